@@ -1,18 +1,36 @@
 """
 Cloud Run用のHTTPサーバー
-動画生成リクエストを受け付けてCloud Storageにアップロード
+動画生成リクエストをジョブとして受け付け、バックグラウンドで生成してCloud Storageにアップロード
+
+- POST /generate: ジョブを登録して202を返す（"profile" でレンダリングプロファイルを指定可能）
+- GET /jobs/<id>: ジョブの状態とフェーズごとの進捗を返す
+  （終了したジョブは JOB_TTL_SECONDS 秒後、または MAX_FINISHED_JOBS 件を超えると古いものから削除され404になる）
+- 失敗したジョブを同じ video_id・テーマで再送すると、完了済みのフェーズはチェックポイントから復元する
+
+※ レスポンス返却後もバックグラウンドで処理を続けるため、
+  Cloud Runでは「CPUを常に割り当てる」設定で運用すること
 """
 import json
 import logging
+import multiprocessing
 import os
+import shutil
+import threading
+import time
 import uuid
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
+from typing import Optional
 
 from flask import Flask, request, jsonify
 from google.cloud import storage
 from supabase import create_client, Client
 
+from src.core.config import get_config
+from src.main import VideoGenerator
+
 # ロギング設定
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -31,113 +49,179 @@ def get_supabase() -> Client:
     return create_client(SUPABASE_URL, SUPABASE_KEY)
 
 
+# 動画生成パイプライン（プロセス内で1つを使い回す）
+# Geminiの設定・プロンプト読み込み・APIクライアント・HTTP接続プール・フォントを毎回作り直さない
+_generator: Optional[VideoGenerator] = None
+_generator_lock = threading.Lock()
+
+
+def get_generator() -> VideoGenerator:
+    """共有の VideoGenerator を取得（初回のみ作成）"""
+    global _generator
+    with _generator_lock:
+        if _generator is None:
+            _generator = VideoGenerator()
+    return _generator
+
+
+def prewarm() -> None:
+    """起動時に VideoGenerator を作成してフォント等を読み込んでおく"""
+    try:
+        get_generator().prewarm()
+    except Exception as e:
+        # APIキー未設定などで失敗しても起動は続け、最初のリクエストで再試行する
+        logger.warning(f"Prewarm failed: {e}")
+
+
 @app.route('/health', methods=['GET'])
 def health_check():
     """ヘルスチェック"""
     return jsonify({'status': 'healthy'}), 200
 
 
+# ジョブ実行用のワーカープール（1インスタンスで複数のAPI待ちジョブを並行処理）
+JOB_WORKERS = int(os.environ.get('JOB_WORKERS', 2))
+job_executor = ThreadPoolExecutor(max_workers=JOB_WORKERS, thread_name_prefix='job')
+
+# ジョブの状態（video_id → 状態）。プロセス内のみで保持する
+_jobs = {}
+_jobs_lock = threading.Lock()
+
+# 終了したジョブ（completed / failed）の状態を保持する時間（秒）と最大件数
+# 終了順に _finished_jobs（video_id → 終了時刻）に並べ、古いものから _jobs ごと削除する
+JOB_TTL_SECONDS = int(os.environ.get('JOB_TTL_SECONDS', 3600))
+MAX_FINISHED_JOBS = int(os.environ.get('MAX_FINISHED_JOBS', 1000))
+TERMINAL_STATUSES = ('completed', 'failed')
+_finished_jobs: 'OrderedDict[str, float]' = OrderedDict()
+
+
+def _prune_jobs() -> None:
+    """保持期限切れ・件数超過の終了済みジョブを削除（_jobs_lock を取得して呼ぶこと）"""
+    expire_before = time.monotonic() - JOB_TTL_SECONDS
+    while _finished_jobs:
+        video_id, finished_at = next(iter(_finished_jobs.items()))
+        if finished_at > expire_before and len(_finished_jobs) <= MAX_FINISHED_JOBS:
+            break
+        del _finished_jobs[video_id]
+        _jobs.pop(video_id, None)
+
+
+def _update_job(video_id: str, **fields) -> None:
+    """ジョブの状態を更新"""
+    with _jobs_lock:
+        job = _jobs[video_id]
+        job.update(fields)
+        job['updated_at'] = datetime.now().isoformat()
+        if job['status'] in TERMINAL_STATUSES:
+            _finished_jobs[video_id] = time.monotonic()
+            _prune_jobs()
+
+
+def _update_phase(video_id: str, phase: str, status: str) -> None:
+    """フェーズの進捗を更新"""
+    with _jobs_lock:
+        job = _jobs[video_id]
+        job['phases'][phase] = status
+        job['updated_at'] = datetime.now().isoformat()
+
+
 @app.route('/generate', methods=['POST'])
 def generate_video():
-    """動画生成エンドポイント"""
-    try:
-        data = request.get_json()
+    """動画生成エンドポイント（ジョブを登録してすぐに202を返す）"""
+    data = request.get_json(silent=True)
 
-        if not data or 'theme' not in data:
-            return jsonify({'error': 'theme is required'}), 400
+    if not data or 'theme' not in data:
+        return jsonify({'error': 'theme is required'}), 400
 
-        theme = data['theme']
-        video_id = data.get('video_id', str(uuid.uuid4()))
-        user_id = data.get('user_id', 'anonymous')
+    theme = data['theme']
+    video_id = data.get('video_id', str(uuid.uuid4()))
+    user_id = data.get('user_id', 'anonymous')
+    profile = data.get('profile')
 
-        logger.info(f"Starting video generation: {video_id}, theme: {theme}")
+    # レンダリングプロファイルの確認（"draft" で下書き、"final" で投稿用）
+    profiles = get_config().video.profiles
+    if profile is not None and profile not in profiles:
+        return jsonify({'error': f'Unknown profile: {profile} (available: {list(profiles)})'}), 400
 
-        # 環境変数の確認
-        required_env = ['GOOGLE_AI_API_KEY', 'OPENAI_API_KEY', 'FISH_AUDIO_API_KEY', 'FISH_AUDIO_VOICE_ID']
-        missing = [env for env in required_env if not os.environ.get(env)]
-        if missing:
-            return jsonify({'error': f'Missing environment variables: {missing}'}), 500
+    # 環境変数の確認
+    required_env = ['GOOGLE_AI_API_KEY', 'OPENAI_API_KEY', 'FISH_AUDIO_API_KEY', 'FISH_AUDIO_VOICE_ID']
+    missing = [env for env in required_env if not os.environ.get(env)]
+    if missing:
+        return jsonify({'error': f'Missing environment variables: {missing}'}), 500
+
+    now = datetime.now().isoformat()
+    with _jobs_lock:
+        _prune_jobs()
+        if video_id in _jobs and _jobs[video_id]['status'] not in TERMINAL_STATUSES:
+            return jsonify({'error': f'Job already in progress: {video_id}'}), 409
+        # 同じIDで再実行する場合は終了済みの記録を消す
+        _finished_jobs.pop(video_id, None)
+        _jobs[video_id] = {
+            'job_id': video_id,
+            'user_id': user_id,
+            'theme': theme,
+            'profile': profile,
+            'status': 'queued',
+            'phases': {},
+            'created_at': now,
+            'updated_at': now,
+        }
+
+    logger.info(f"Video generation queued: {video_id}, theme: {theme}")
+    job_executor.submit(_run_job, video_id, theme, user_id, profile)
+
+    return jsonify({
+        'success': True,
+        'job_id': video_id,
+        'video_id': video_id,
+        'status': 'queued',
+        'status_url': f"/jobs/{video_id}",
+    }), 202
 
-        # 動画生成
-        from src.main import VideoGenerator
 
-        generator = VideoGenerator()
+@app.route('/jobs/<job_id>', methods=['GET'])
+def get_job(job_id):
+    """ジョブの状態とフェーズごとの進捗を返す"""
+    with _jobs_lock:
+        _prune_jobs()
+        # 存在しないID・保持期限を過ぎて削除されたIDは404
+        job = _jobs.get(job_id)
+        if job is None:
+            return jsonify({'error': f'Job not found: {job_id}'}), 404
+        job = json.loads(json.dumps(job))
+
+    return jsonify(job), 200
+
+
+def _run_job(video_id: str, theme: str, user_id: str, profile: Optional[str] = None) -> None:
+    """ワーカーでジョブを実行し、結果をCloud StorageとSupabaseに反映"""
+    _update_job(video_id, status='running')
+    logger.info(f"Starting video generation: {video_id}, theme: {theme}")
+
+    try:
+        # 動画生成
+        generator = get_generator()
         output_name = f"video_{video_id}"
-        video_path = generator.generate(theme, output_name)
+        progress = lambda phase, status: _update_phase(video_id, phase, status)
+        # 失敗したジョブを同じIDで再実行した場合は、チェックポイントから再開する
+        if generator.can_resume(output_name, theme, profile):
+            logger.info(f"Resuming from checkpoint: {video_id}")
+            video_path = generator.resume(output_name, progress=progress)
+        else:
+            video_path = generator.generate(theme, output_name, progress=progress, profile=profile)
 
         logger.info(f"Video generated: {video_path}")
 
-        # Cloud Storageにアップロード
-        bucket = storage_client.bucket(BUCKET_NAME)
-
-        # 動画ファイルをアップロード
-        video_blob_name = f"{user_id}/{video_id}/video.mp4"
-        video_blob = bucket.blob(video_blob_name)
-        video_blob.upload_from_filename(str(video_path))
-        video_url = f"https://storage.googleapis.com/{BUCKET_NAME}/{video_blob_name}"
-
-        logger.info(f"Video uploaded: {video_url}")
-
-        # キャプションを読み込み
-        caption_path = video_path.parent / "caption.txt"
-        caption = ""
-        if caption_path.exists():
-            caption = caption_path.read_text(encoding='utf-8')
-
-        # スクリプトデータを読み込み
-        script_path = video_path.parent / "script.json"
-        script_data = None
-        title = theme[:50]
-        if script_path.exists():
-            script_data = json.loads(script_path.read_text(encoding='utf-8'))
-            title = script_data.get('title', title)
-
-        # サムネイル（最初のスライド）をアップロード
-        thumbnail_url = None
-        slides_dir = video_path.parent / "slides"
-        if slides_dir.exists():
-            slides = sorted(slides_dir.glob("*.png"))
-            if slides:
-                thumb_blob_name = f"{user_id}/{video_id}/thumbnail.png"
-                thumb_blob = bucket.blob(thumb_blob_name)
-                thumb_blob.upload_from_filename(str(slides[0]))
-                thumbnail_url = f"https://storage.googleapis.com/{BUCKET_NAME}/{thumb_blob_name}"
-
-        # 一時ファイルを削除
-        import shutil
-        output_dir = video_path.parent
-        if output_dir.exists():
-            shutil.rmtree(output_dir)
-
-        # Supabaseのvideosテーブルを更新
-        if SUPABASE_KEY:
-            try:
-                supabase = get_supabase()
-                supabase.table('videos').update({
-                    'status': 'completed',
-                    'video_url': video_url,
-                    'thumbnail_url': thumbnail_url,
-                    'title': title,
-                    'caption': caption,
-                }).eq('id', video_id).execute()
-                logger.info(f"Supabase updated for video: {video_id}")
-            except Exception as db_error:
-                logger.error(f"Failed to update Supabase: {db_error}")
-
-        return jsonify({
-            'success': True,
-            'video_id': video_id,
-            'video_url': video_url,
-            'thumbnail_url': thumbnail_url,
-            'title': title,
-            'caption': caption,
-        }), 200
+        _update_job(video_id, status='uploading')
+        result = _publish_video(video_path, video_id, user_id, theme)
+        _update_job(video_id, status='completed', result=result)
 
     except Exception as e:
         logger.error(f"Video generation failed: {e}", exc_info=True)
+        _update_job(video_id, status='failed', error=str(e))
 
         # エラー時もSupabaseを更新
-        if SUPABASE_KEY and 'video_id' in locals():
+        if SUPABASE_KEY:
             try:
                 supabase = get_supabase()
                 supabase.table('videos').update({
@@ -147,10 +231,78 @@ def generate_video():
             except Exception as db_error:
                 logger.error(f"Failed to update Supabase on error: {db_error}")
 
-        return jsonify({
-            'success': False,
-            'error': str(e),
-        }), 500
+
+def _publish_video(video_path: Path, video_id: str, user_id: str, theme: str) -> dict:
+    """生成物をCloud Storageにアップロードし、Supabaseを更新"""
+    # Cloud Storageにアップロード
+    bucket = storage_client.bucket(BUCKET_NAME)
+
+    # 動画ファイルをアップロード
+    video_blob_name = f"{user_id}/{video_id}/video.mp4"
+    video_blob = bucket.blob(video_blob_name)
+    video_blob.upload_from_filename(str(video_path))
+    video_url = f"https://storage.googleapis.com/{BUCKET_NAME}/{video_blob_name}"
+
+    logger.info(f"Video uploaded: {video_url}")
+
+    # キャプションを読み込み
+    caption_path = video_path.parent / "caption.txt"
+    caption = ""
+    if caption_path.exists():
+        caption = caption_path.read_text(encoding='utf-8')
+
+    # スクリプトデータを読み込み
+    script_path = video_path.parent / "script.json"
+    script_data = None
+    title = theme[:50]
+    if script_path.exists():
+        script_data = json.loads(script_path.read_text(encoding='utf-8'))
+        title = script_data.get('title', title)
+
+    # サムネイル（最初のスライド）をアップロード
+    thumbnail_url = None
+    thumbnail_path = video_path.parent / "thumbnail.png"
+    if not thumbnail_path.exists():
+        # サムネイルがない場合は最初のスライド画像を使う
+        slides = sorted((video_path.parent / "slides").glob("*.png"))
+        thumbnail_path = slides[0] if slides else None
+    if thumbnail_path is not None:
+        thumb_blob_name = f"{user_id}/{video_id}/thumbnail.png"
+        thumb_blob = bucket.blob(thumb_blob_name)
+        thumb_blob.upload_from_filename(str(thumbnail_path))
+        thumbnail_url = f"https://storage.googleapis.com/{BUCKET_NAME}/{thumb_blob_name}"
+
+    # 一時ファイルを削除
+    output_dir = video_path.parent
+    if output_dir.exists():
+        shutil.rmtree(output_dir)
+
+    # Supabaseのvideosテーブルを更新
+    if SUPABASE_KEY:
+        try:
+            supabase = get_supabase()
+            supabase.table('videos').update({
+                'status': 'completed',
+                'video_url': video_url,
+                'thumbnail_url': thumbnail_url,
+                'title': title,
+                'caption': caption,
+            }).eq('id', video_id).execute()
+            logger.info(f"Supabase updated for video: {video_id}")
+        except Exception as db_error:
+            logger.error(f"Failed to update Supabase: {db_error}")
+
+    return {
+        'video_url': video_url,
+        'thumbnail_url': thumbnail_url,
+        'title': title,
+        'caption': caption,
+    }
+
+
+# スライド合成のワーカープロセス（spawn でこのモジュールを読み込む場合）では行わない
+if os.environ.get('PREWARM_GENERATOR', 'true').lower() == 'true' and multiprocessing.parent_process() is None:
+    prewarm()
 
 
 if __name__ == '__main__':
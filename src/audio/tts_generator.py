@@ -8,7 +8,9 @@ from typing import Optional
 import httpx
 import ormsgpack
 
+from src.core.cache import get_artifact_cache
 from src.core.config import get_config
+from src.core.tracing import span
 
 logger = logging.getLogger(__name__)
 
@@ -26,6 +28,10 @@ class TTSGenerator:
         self.api_key = config.fish_audio_api_key
         self.voice_id = config.fish_audio_voice_id
         self.fish_config = config.audio.fish_audio
+        self.cache = get_artifact_cache()
+
+        # APIリクエスト用のHTTPクライアント（接続を使い回してTLSハンドシェイクを省く）
+        self.http_client = httpx.Client(timeout=120.0)
 
     def generate_speech(
         self,
@@ -50,40 +56,57 @@ class TTSGenerator:
         if not voice_id:
             raise ValueError("Voice ID is not set")
 
-        logger.info(f"Generating speech: {text[:50]}...")
-
-        # リクエストボディの構築
-        request_body = {
-            "text": text,
-            "reference_id": voice_id,
-            "format": self.fish_config.format,
-            "chunk_length": self.fish_config.chunk_length,
-            "normalize": self.fish_config.normalize,
-            "latency": self.fish_config.latency,
-        }
-
-        # APIリクエスト
-        with httpx.Client(timeout=120.0) as client:
-            response = client.post(
-                self.fish_config.api_url,
-                headers={
-                    "Authorization": f"Bearer {self.api_key}",
-                    "Content-Type": "application/msgpack",
-                },
-                content=ormsgpack.packb(request_body),
-            )
-
-            if response.status_code != 200:
-                logger.error(f"TTS API error: {response.status_code} - {response.text}")
-                raise Exception(f"TTS API error: {response.status_code}")
+        with span("tts.generate_speech", chars=len(text)) as current:
+            # 同じテキスト・ボイス・出力形式の音声があれば再利用
+            cache_key = self.cache.make_key(text, voice_id, self.fish_config.model_dump())
+            if self.cache.get("narration", cache_key, output_path):
+                current.attributes["cache_hit"] = True
+                logger.info(f"Speech cache hit: {output_path}")
+                return output_path
+
+            logger.info(f"Generating speech: {text[:50]}...")
+
+            # リクエストボディの構築
+            request_body = {
+                "text": text,
+                "reference_id": voice_id,
+                "format": self.fish_config.format,
+                "chunk_length": self.fish_config.chunk_length,
+                "normalize": self.fish_config.normalize,
+                "latency": self.fish_config.latency,
+            }
+
+            # APIリクエスト
+            payload = ormsgpack.packb(request_body)
+            audio_data = self._request_speech(payload)
+            current.add_bytes(bytes_in=len(audio_data), bytes_out=len(payload))
 
             # 音声データを保存
             output_path.parent.mkdir(parents=True, exist_ok=True)
             with open(output_path, "wb") as f:
-                f.write(response.content)
+                f.write(audio_data)
+
+            self.cache.put("narration", cache_key, output_path)
+
+            logger.info(f"Speech saved: {output_path}")
+            return output_path
+
+    def _request_speech(self, payload: bytes) -> bytes:
+        """Fish Audio APIを呼び出して音声データを取得"""
+        response = self.http_client.post(
+            self.fish_config.api_url,
+            headers={
+                "Authorization": f"Bearer {self.api_key}",
+                "Content-Type": "application/msgpack",
+            },
+            content=payload,
+        )
+
+        if response.status_code != 200:
+            logger.error(f"TTS API error: {response.status_code} - {response.text}")
+            raise Exception(f"TTS API error: {response.status_code}")
 
-        logger.info(f"Speech saved: {output_path}")
-        return output_path
+        return response.content
 
     def generate_narration(
         self,
@@ -0,0 +1,125 @@
+"""
+複数テーマの一括動画生成
+
+1つの VideoGenerator（APIクライアント・プロンプト・フォント）を全ジョブで共有し、
+ワーカープールでジョブを並行実行する。FFmpegが使うスレッド数は
+プロセス全体の予算（FFmpegBudget）でCPUコア数までに制限される。
+"""
+import json
+import logging
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Dict, List, Optional
+
+if TYPE_CHECKING:
+    from src.main import VideoGenerator
+
+logger = logging.getLogger(__name__)
+
+
+def read_themes(path: Path) -> List[str]:
+    """
+    テーマファイルを読み込む（1行1テーマ、空行と#で始まる行は無視）
+
+    Args:
+        path: テーマファイルのパス
+
+    Returns:
+        List[str]: テーマのリスト
+    """
+    with open(path, "r", encoding="utf-8") as f:
+        lines = [line.strip() for line in f]
+    return [line for line in lines if line and not line.startswith("#")]
+
+
+class BatchRunner:
+    """複数テーマの動画をまとめて生成するクラス"""
+
+    def __init__(self, generator: "VideoGenerator", jobs: int = 2, profile: Optional[str] = None):
+        self.generator = generator
+        self.jobs = max(1, jobs)
+        self.profile = profile
+
+    def run(self, themes: List[str], summary_path: Path) -> List[Dict[str, Any]]:
+        """
+        全テーマの動画を生成してサマリーを書き出す
+
+        Args:
+            themes: テーマのリスト
+            summary_path: サマリーJSONの出力先
+
+        Returns:
+            List[Dict[str, Any]]: ジョブごとの結果（テーマの順序どおり）
+        """
+        batch_id = datetime.now().strftime("%Y%m%d_%H%M%S")
+        logger.info(f"=== Starting batch {batch_id}: {len(themes)} themes, {self.jobs} jobs ===")
+
+        started = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=self.jobs, thread_name_prefix="job") as executor:
+            futures = [
+                executor.submit(self._run_job, theme, f"{batch_id}_{index:03d}")
+                for index, theme in enumerate(themes, start=1)
+            ]
+            results = [future.result() for future in futures]
+        elapsed = time.perf_counter() - started
+
+        succeeded = sum(1 for result in results if result["status"] == "completed")
+        summary = {
+            "batch_id": batch_id,
+            "jobs": self.jobs,
+            "profile": self.profile,
+            "total": len(results),
+            "succeeded": succeeded,
+            "failed": len(results) - succeeded,
+            "elapsed_sec": round(elapsed, 3),
+            "results": results,
+        }
+
+        summary_path.parent.mkdir(parents=True, exist_ok=True)
+        with open(summary_path, "w", encoding="utf-8") as f:
+            json.dump(summary, f, ensure_ascii=False, indent=2)
+
+        logger.info(f"=== Batch complete: {succeeded}/{len(results)} succeeded in {elapsed:.1f}s ===")
+        logger.info(f"Summary: {summary_path}")
+
+        return results
+
+    def _run_job(self, theme: str, job_id: str) -> Dict[str, Any]:
+        """1ジョブを実行し、失敗しても他のジョブを止めずに結果を返す"""
+        result: Dict[str, Any] = {
+            "theme": theme,
+            "job_id": job_id,
+            "started_at": datetime.now().isoformat(),
+        }
+        started = time.perf_counter()
+        try:
+            video_path = self.generator.generate(theme, job_id, profile=self.profile)
+            result["status"] = "completed"
+            result["output"] = str(video_path)
+        except Exception as e:
+            logger.error(f"Batch job failed ({job_id}): {e}")
+            result["status"] = "failed"
+            result["error"] = str(e)
+        result["elapsed_sec"] = round(time.perf_counter() - started, 3)
+        self._attach_timings(result, job_id)
+        return result
+
+    def _attach_timings(self, result: Dict[str, Any], job_id: str) -> None:
+        """ジョブの timings.json のパスとフェーズごとの所要時間（秒）を結果に追加"""
+        output_dir = self.generator.project_root / self.generator.config.output.directory / job_id
+        timings_path = output_dir / "timings.json"
+        try:
+            with open(timings_path, "r", encoding="utf-8") as f:
+                summary = json.load(f)["summary"]
+        except (OSError, ValueError, KeyError):
+            # 計測が無効、またはジョブが出力ディレクトリを作る前に失敗した場合
+            return
+
+        result["timings"] = str(timings_path)
+        result["phases"] = {
+            name[len("phase."):]: round(values["wall_time"], 3)
+            for name, values in sorted(summary.items())
+            if name.startswith("phase.")
+        }
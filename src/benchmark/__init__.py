@@ -0,0 +1,10 @@
+"""Benchmark module with local stand-ins for external APIs"""
+from .fakes import FakeScriptGenerator, FakeImageGenerator, FakeTTSGenerator
+from .runner import run_benchmark
+
+__all__ = [
+    "FakeScriptGenerator",
+    "FakeImageGenerator",
+    "FakeTTSGenerator",
+    "run_benchmark",
+]
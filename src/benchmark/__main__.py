@@ -0,0 +1,92 @@
+"""
+パイプラインのベンチマーク
+
+使用方法:
+    python -m src.benchmark
+    python -m src.benchmark --update-baseline
+    python -m src.benchmark --slides 4 --image-latency 12 --tts-latency 5
+"""
+import argparse
+import logging
+import sys
+from pathlib import Path
+
+from src.benchmark.runner import DEFAULT_BASELINE_PATH, run_benchmark
+
+
+def main():
+    """メイン関数"""
+    parser = argparse.ArgumentParser(
+        description="SNS Automation System - パイプラインベンチマーク（外部APIはローカルのスタンドイン）"
+    )
+    parser.add_argument(
+        "--slides",
+        type=int,
+        nargs="+",
+        default=[4, 8],
+        help="計測するスライド枚数（デフォルト: 4 8）",
+    )
+    parser.add_argument(
+        "--script-latency",
+        type=float,
+        default=1.0,
+        help="台本生成のシミュレート遅延（秒）",
+    )
+    parser.add_argument(
+        "--image-latency",
+        type=float,
+        default=2.0,
+        help="画像1枚あたりのシミュレート遅延（秒）",
+    )
+    parser.add_argument(
+        "--tts-latency",
+        type=float,
+        default=2.0,
+        help="音声生成のシミュレート遅延（秒）",
+    )
+    parser.add_argument(
+        "--baseline",
+        type=str,
+        default=str(DEFAULT_BASELINE_PATH),
+        help="ベースラインJSONのパス",
+    )
+    parser.add_argument(
+        "--update-baseline",
+        action="store_true",
+        help="今回の結果をベースラインとして保存",
+    )
+    parser.add_argument(
+        "--tolerance",
+        type=float,
+        default=0.2,
+        help="許容する劣化率（デフォルト: 0.2 = 20%%）",
+    )
+    parser.add_argument(
+        "--keep-outputs",
+        action="store_true",
+        help="生成した動画などを削除せずに残す",
+    )
+    parser.add_argument(
+        "-v", "--verbose",
+        action="store_true",
+        help="詳細なログを出力",
+    )
+
+    args = parser.parse_args()
+
+    logging.getLogger().setLevel(logging.DEBUG if args.verbose else logging.WARNING)
+
+    return run_benchmark(
+        slide_counts=args.slides,
+        script_latency=args.script_latency,
+        image_latency=args.image_latency,
+        tts_latency=args.tts_latency,
+        baseline_path=Path(args.baseline),
+        update_baseline=args.update_baseline,
+        tolerance=args.tolerance,
+        keep_outputs=args.keep_outputs,
+    )
+
+
+if __name__ == "__main__":
+    sys.exit(main())
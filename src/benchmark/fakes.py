@@ -0,0 +1,164 @@
+"""
+ベンチマーク用の外部APIスタンドイン
+
+Gemini・DALL-E・Fish Audio の呼び出し部分だけを決定的なローカル実装に置き換える。
+レスポンスの解析・キャッシュ・計測・リトライなどの周辺処理は本番と同じコードを通る。
+"""
+import hashlib
+import io
+import json
+import math
+import struct
+import time
+import wave
+from pathlib import Path
+
+from PIL import Image, ImageDraw
+
+from src.core.cache import get_artifact_cache
+from src.core.config import get_config
+from src.core.script_generator import ScriptGenerator
+from src.generation.image_generator import ImageGenerator
+from src.audio.tts_generator import TTSGenerator
+
+
+def _seed(text: str) -> int:
+    """テキストから決定的な整数シードを作成"""
+    return int(hashlib.sha256(text.encode("utf-8")).hexdigest()[:8], 16)
+
+
+class FakeScriptGenerator(ScriptGenerator):
+    """固定の台本JSONを返すGeminiのスタンドイン"""
+
+    def __init__(self, slide_count: int = 4, slide_duration: float = 8.0, latency: float = 0.0):
+        self.config = get_config()
+        self.prompt_template = "{theme}"
+        self.slide_count = slide_count
+        self.slide_duration = slide_duration
+        self.latency = latency
+
+    def _request_script(self, prompt: str) -> str:
+        time.sleep(self.latency)
+        theme = prompt
+
+        slides = []
+        for order in range(1, self.slide_count + 1):
+            slides.append({
+                "order": order,
+                "duration": self.slide_duration,
+                "background": {
+                    "prompt": f"{theme} abstract background {order}",
+                    "style": ["illustration", "abstract", "minimalist"][order % 3],
+                    "color_scheme": "cool blue and teal",
+                },
+                "text_elements": [
+                    {
+                        "content": "知らないと損する" if order == 1 else f"ポイント{order - 1}",
+                        "x": 50, "y": 25, "anchor": "center",
+                        "style": "hook" if order == 1 else "title",
+                        "animation": "pop",
+                    },
+                    {
+                        "content": f"{theme}について、お客様の心理を理解して売上につなげる方法を解説します。（その{order}）",
+                        "x": 50, "y": 55, "anchor": "center",
+                        "style": "body",
+                        "animation": "fade_in",
+                        "animation_delay": 0.5,
+                    },
+                    {
+                        "content": "今日から実践！",
+                        "x": 50, "y": 80, "anchor": "center",
+                        "style": "emphasis",
+                        "animation": "slide_up",
+                        "animation_delay": 1.0,
+                    },
+                ],
+                "narration": f"{theme}のポイント{order}を説明します。",
+                "animation": "zoom_in",
+            })
+
+        script = {
+            "title": f"{theme}の基本"[:50],
+            "hook": "知らないと損する",
+            "theme": theme,
+            "slides": slides,
+            "audio": {"speed": 1.0},
+            "caption": {"text": f"{theme}を解説", "hashtags": ["ベンチマーク"]},
+        }
+        return f"```json\n{json.dumps(script, ensure_ascii=False)}\n```"
+
+
+class FakeImageGenerator(ImageGenerator):
+    """プロンプトから決定的なグラデーション画像を作るDALL-Eのスタンドイン"""
+
+    def __init__(self, latency: float = 0.0):
+        config = get_config()
+        self.config = config
+        self.dalle_config = config.image_generation.dalle
+        self.max_concurrency = config.image_generation.max_concurrency
+        self.cache = get_artifact_cache()
+        self.latency = latency
+
+    def _request_image(self, prompt: str, output_path: Path) -> int:
+        time.sleep(self.latency)
+
+        width, height = (int(v) for v in self.dalle_config.size.split("x"))
+        seed = _seed(prompt)
+        top = (seed & 0xFF, (seed >> 8) & 0xFF, (seed >> 16) & 0xFF)
+        bottom = tuple(255 - c for c in top)
+
+        # 縦グラデーション＋図形（PNGの圧縮率が本物の画像に近くなるよう適度な変化を付ける）
+        image = Image.linear_gradient("L").resize((width, height))
+        image = Image.composite(
+            Image.new("RGB", (width, height), bottom),
+            Image.new("RGB", (width, height), top),
+            image,
+        )
+        draw = ImageDraw.Draw(image)
+        for i in range(24):
+            r = (seed >> (i % 24)) % (width // 4) + 40
+            cx = (seed * (i + 1)) % width
+            cy = (seed * (i + 7)) % height
+            draw.ellipse((cx - r, cy - r, cx + r, cy + r), outline=top, width=6)
+
+        buffer = io.BytesIO()
+        image.save(buffer, "PNG")
+        data = buffer.getvalue()
+
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+        output_path.write_bytes(data)
+        return len(data)
+
+
+class FakeTTSGenerator(TTSGenerator):
+    """合成音（WAV）を返すFish Audioのスタンドイン"""
+
+    def __init__(self, duration: float = 60.0, latency: float = 0.0, sample_rate: int = 24000):
+        config = get_config()
+        self.config = config
+        self.api_key = "benchmark"
+        self.voice_id = "benchmark"
+        self.fish_config = config.audio.fish_audio
+        self.cache = get_artifact_cache()
+        self.duration = duration
+        self.latency = latency
+        self.sample_rate = sample_rate
+
+    def _request_speech(self, payload: bytes) -> bytes:
+        time.sleep(self.latency)
+
+        # FFmpegは拡張子ではなく内容から形式を判定するため、WAVのままでよい
+        frame_count = int(self.duration * self.sample_rate)
+        step = 2 * math.pi * 220.0 / self.sample_rate
+        samples = struct.pack(
+            f"<{frame_count}h",
+            *(int(6000 * math.sin(step * i)) for i in range(frame_count)),
+        )
+
+        buffer = io.BytesIO()
+        with wave.open(buffer, "wb") as wav:
+            wav.setnchannels(1)
+            wav.setsampwidth(2)
+            wav.setframerate(self.sample_rate)
+            wav.writeframes(samples)
+        return buffer.getvalue()
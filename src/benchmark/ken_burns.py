@@ -0,0 +1,212 @@
+"""
+Ken Burnsエフェクトのベンチマーク
+
+従来の scale=8000 + zoompan フィルターと、オーバーサンプリング方式の
+KenBurnsEffect で1スライド分のフレームを生成し、処理速度（フレーム/秒）と
+FFmpegプロセスの最大メモリ使用量（peak RSS）を比較する。
+既定ではフィルターの処理だけを計測し、--encode で設定のコーデックによるエンコードも含める。
+
+使用方法:
+    python -m src.benchmark.ken_burns
+    python -m src.benchmark.ken_burns --duration 8 --oversample 1.5 2 3
+    python -m src.benchmark.ken_burns --encode
+"""
+import argparse
+import os
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Dict, List, Sequence
+
+from PIL import Image, ImageDraw
+
+from src.core.config import get_config
+from src.core.schemas.video_script import AnimationType, Slide, SlideBackground
+from src.video.ken_burns import KenBurnsEffect
+
+
+def legacy_filter(slide: Slide, width: int, height: int, fps: int, start_scale: float, end_scale: float) -> str:
+    """従来のフィルター（8000pxに拡大してから zoompan）"""
+    return (
+        f"scale=8000:-1,"
+        f"zoompan=z='min(zoom+{(end_scale-start_scale)/slide.duration/fps:.6f},1.5)':"
+        f"x='iw/2-(iw/zoom/2)':y='ih/2-(ih/zoom/2)':"
+        f"d={int(slide.duration * fps)}:"
+        f"s={width}x{height}:"
+        f"fps={fps}"
+    )
+
+
+def measure(
+    slide_path: Path,
+    video_filter: str,
+    duration: float,
+    frames: int,
+    encode: bool = False,
+) -> Dict[str, float]:
+    """
+    1スライド分のフレームを生成して計測する
+
+    Args:
+        slide_path: スライド画像のパス
+        video_filter: 計測するフィルター
+        duration: 表示時間（秒）
+        frames: 生成されるフレーム数
+        encode: 設定のコーデックでのエンコードも含める
+
+    Returns:
+        Dict[str, float]: 秒数・フレーム/秒・peak RSS（MB）
+    """
+    config = get_config().video
+    cmd = [
+        "ffmpeg", "-y", "-v", "error",
+        "-loop", "1",
+        "-i", str(slide_path),
+        "-vf", video_filter,
+        "-t", str(duration),
+    ]
+    if encode:
+        cmd += ["-c:v", config.video_codec, "-pix_fmt", "yuv420p", "-b:v", config.video_bitrate]
+    cmd += ["-f", "null", "-"]
+
+    started = time.perf_counter()
+    process = subprocess.Popen(cmd, stdin=subprocess.DEVNULL, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE)
+    stderr = process.stderr.read()
+    process.stderr.close()
+    # wait4でこのFFmpegプロセスの最大RSSを取得（Linuxでは KB 単位）
+    _, status, usage = os.wait4(process.pid, 0)
+    elapsed = time.perf_counter() - started
+
+    if os.waitstatus_to_exitcode(status) != 0:
+        raise RuntimeError(f"FFmpeg failed: {stderr.decode('utf-8', errors='ignore')}")
+
+    return {
+        "seconds": elapsed,
+        "fps": frames / elapsed,
+        "peak_rss_mb": usage.ru_maxrss / 1024,
+    }
+
+
+def run_ken_burns_benchmark(
+    duration: float = 4.0,
+    oversamples: Sequence[float] = (2.0,),
+    skip_legacy: bool = False,
+    encode: bool = False,
+) -> List[Dict[str, object]]:
+    """
+    ベンチマークを実行して結果を表示する
+
+    Args:
+        duration: 1スライドの表示時間（秒）
+        oversamples: 計測するオーバーサンプリング倍率
+        skip_legacy: 従来のフィルターを計測しない（非常に遅いため）
+        encode: 設定のコーデックでのエンコードも含める
+
+    Returns:
+        List[Dict[str, object]]: 計測結果
+    """
+    if not hasattr(os, "wait4"):
+        raise RuntimeError("This benchmark requires os.wait4 (Linux/macOS)")
+
+    config = get_config()
+    video = config.video
+    slides = config.slides
+
+    def make_slide(animation: AnimationType) -> Slide:
+        return Slide(
+            order=1,
+            duration=duration,
+            background=SlideBackground(prompt="benchmark"),
+            narration="",
+            animation=animation,
+        )
+
+    results: List[Dict[str, object]] = []
+    with tempfile.TemporaryDirectory() as temp_dir:
+        slide_path = Path(temp_dir) / "slide.png"
+        _make_test_slide(slide_path, video.width, video.height)
+
+        frames = int(duration * video.fps)
+        if not skip_legacy:
+            slide = make_slide(AnimationType.ZOOM_IN)
+            video_filter = legacy_filter(
+                slide, video.width, video.height, video.fps, slides.zoom_start_scale, slides.zoom_end_scale,
+            )
+            results.append({
+                "name": "legacy scale=8000",
+                **measure(slide_path, video_filter, duration, frames, encode),
+            })
+
+        for oversample in oversamples:
+            effect = KenBurnsEffect(
+                width=video.width,
+                height=video.height,
+                fps=video.fps,
+                start_scale=slides.zoom_start_scale,
+                end_scale=slides.zoom_end_scale,
+                oversample=oversample,
+            )
+            for animation in (AnimationType.ZOOM_IN, AnimationType.ZOOM_OUT, AnimationType.PAN_LEFT):
+                slide = make_slide(animation)
+                results.append({
+                    "name": f"{animation.value} x{oversample:g}",
+                    **measure(slide_path, effect.build_filter(slide), duration, frames, encode),
+                })
+
+    print()
+    print(f"{'filter':<22}{'seconds':>10}{'fps':>10}{'peak RSS':>12}")
+    for result in results:
+        print(
+            f"{result['name']:<22}{result['seconds']:>9.2f}s"
+            f"{result['fps']:>10.1f}{result['peak_rss_mb']:>9.0f} MB"
+        )
+    return results
+
+
+def _make_test_slide(path: Path, width: int, height: int) -> None:
+    """細かい模様のあるテスト画像を作成（ズームの揺れやぼけが分かりやすい）"""
+    image = Image.linear_gradient("L").resize((width, height)).convert("RGB")
+    draw = ImageDraw.Draw(image)
+    for x in range(0, width, 40):
+        draw.line((x, 0, x, height), fill=(255, 120, 0), width=2)
+    for y in range(0, height, 40):
+        draw.line((0, y, width, y), fill=(0, 160, 255), width=2)
+    image.save(path)
+
+
+def main():
+    """メイン関数"""
+    parser = argparse.ArgumentParser(description="Ken Burnsエフェクトのベンチマーク")
+    parser.add_argument(
+        "--duration",
+        type=float,
+        default=4.0,
+        help="1スライドの表示時間（秒、3以上）",
+    )
+    parser.add_argument(
+        "--oversample",
+        type=float,
+        nargs="+",
+        default=[2.0],
+        help="計測するオーバーサンプリング倍率（デフォルト: 2.0）",
+    )
+    parser.add_argument(
+        "--skip-legacy",
+        action="store_true",
+        help="従来の scale=8000 フィルターを計測しない",
+    )
+    parser.add_argument(
+        "--encode",
+        action="store_true",
+        help="設定のコーデックでのエンコードも含めて計測する",
+    )
+
+    args = parser.parse_args()
+    run_ken_burns_benchmark(args.duration, args.oversample, args.skip_legacy, args.encode)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
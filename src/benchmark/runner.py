@@ -0,0 +1,181 @@
+"""
+パイプライン全体のベンチマーク
+
+外部APIをローカルのスタンドイン（シミュレートした遅延付き）に差し替え、
+スライド合成と動画合成は本番と同じコードで実行して、フェーズごとの時間を計測する。
+保存済みのベースラインより遅くなっていれば失敗として扱う。
+"""
+import json
+import logging
+import shutil
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence
+
+from src.benchmark.fakes import FakeImageGenerator, FakeScriptGenerator, FakeTTSGenerator
+from src.core.config import get_config, get_project_root
+from src.main import VideoGenerator
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_BASELINE_PATH = Path(__file__).parent / "baseline.json"
+
+
+def run_case(
+    slide_count: int,
+    script_latency: float,
+    image_latency: float,
+    tts_latency: float,
+    slide_duration: float = 8.0,
+) -> Dict[str, float]:
+    """
+    1ケース（スライド枚数）を実行してフェーズごとの時間を返す
+
+    Args:
+        slide_count: スライド枚数
+        script_latency: 台本生成のシミュレート遅延（秒）
+        image_latency: 画像1枚あたりのシミュレート遅延（秒）
+        tts_latency: 音声生成のシミュレート遅延（秒）
+        slide_duration: 1スライドの表示時間（秒）
+
+    Returns:
+        Dict[str, float]: 指標名（"total", "phase.*"）と秒数
+    """
+    generator = VideoGenerator(
+        script_generator=FakeScriptGenerator(slide_count, slide_duration, script_latency),
+        image_generator=FakeImageGenerator(image_latency),
+        tts_generator=FakeTTSGenerator(slide_count * slide_duration + 5, tts_latency),
+    )
+
+    output_name = f"benchmark_{slide_count}slides"
+    started = time.perf_counter()
+    video_path = generator.generate("売上を2倍にする顧客心理学", output_name)
+    total = time.perf_counter() - started
+
+    with open(video_path.parent / "timings.json", "r", encoding="utf-8") as f:
+        summary = json.load(f)["summary"]
+
+    metrics = {"total": round(total, 3)}
+    for name, values in sorted(summary.items()):
+        if name.startswith("phase."):
+            metrics[name] = round(values["wall_time"], 3)
+    return metrics
+
+
+def compare_to_baseline(
+    results: Dict[str, Dict[str, float]],
+    baseline: Dict[str, Dict[str, float]],
+    tolerance: float,
+    min_slack: float,
+) -> List[str]:
+    """
+    ベースラインと比較して劣化した指標を列挙する
+
+    Args:
+        results: ケース名 → 指標 → 秒数
+        baseline: 同じ形式のベースライン
+        tolerance: 許容する劣化率（0.2 = 20%）
+        min_slack: 許容する最小の劣化量（秒）。短いフェーズのノイズ対策
+
+    Returns:
+        List[str]: 劣化した指標の説明
+    """
+    regressions = []
+    for case, metrics in results.items():
+        for name, seconds in metrics.items():
+            base = baseline.get(case, {}).get(name)
+            if base is None:
+                continue
+            limit = max(base * (1 + tolerance), base + min_slack)
+            if seconds > limit:
+                regressions.append(f"{case} {name}: {seconds:.2f}s > {limit:.2f}s (baseline {base:.2f}s)")
+    return regressions
+
+
+def run_benchmark(
+    slide_counts: Sequence[int] = (4, 8),
+    script_latency: float = 1.0,
+    image_latency: float = 2.0,
+    tts_latency: float = 2.0,
+    baseline_path: Path = DEFAULT_BASELINE_PATH,
+    update_baseline: bool = False,
+    tolerance: float = 0.2,
+    min_slack: float = 0.5,
+    keep_outputs: bool = False,
+) -> int:
+    """
+    ベンチマークを実行して結果を表示する
+
+    Returns:
+        int: 終了コード（劣化があれば 1）
+    """
+    config = get_config()
+    # 毎回同じ処理量を計測するためキャッシュは使わない
+    # （スプライトのメモリキャッシュはプロセス内でケースをまたいで残るため、これも無効にする。
+    #   設定はスライド合成のワーカープロセスにも引き継がれる）
+    config.cache.enabled = False
+    config.cache.sprite_memory_mb = 0
+    config.output.directory = str(Path(config.output.directory) / "benchmark")
+
+    results: Dict[str, Dict[str, float]] = {}
+    for slide_count in slide_counts:
+        case = f"{slide_count}_slides"
+        logger.info(f"Benchmark case: {case}")
+        results[case] = run_case(slide_count, script_latency, image_latency, tts_latency)
+
+    _print_results(results)
+
+    if not keep_outputs:
+        shutil.rmtree(get_project_root() / config.output.directory, ignore_errors=True)
+
+    if update_baseline:
+        with open(baseline_path, "w", encoding="utf-8") as f:
+            json.dump(results, f, indent=2)
+        print(f"\nBaseline updated: {baseline_path}")
+        return 0
+
+    baseline = _load_baseline(baseline_path)
+    if baseline is None:
+        print(f"\n[WARNING] No baseline found at {baseline_path}: nothing was compared, regressions are not checked")
+        print("  Run with --update-baseline on a reference machine to create one")
+        return 0
+
+    compared = sum(
+        1 for case, metrics in results.items() for name in metrics if name in baseline.get(case, {})
+    )
+    if compared == 0:
+        print(f"\n[WARNING] Baseline {baseline_path} has none of these cases/metrics: nothing was compared")
+        return 0
+
+    regressions = compare_to_baseline(results, baseline, tolerance, min_slack)
+    if regressions:
+        print("\n[REGRESSION]")
+        for regression in regressions:
+            print(f"  {regression}")
+        return 1
+
+    print("\n[OK] No regressions against baseline")
+    return 0
+
+
+def _load_baseline(path: Path) -> Optional[Dict[str, Dict[str, float]]]:
+    """ベースラインを読み込む（なければ None）"""
+    if not path.exists():
+        return None
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def _print_results(results: Dict[str, Dict[str, Any]]) -> None:
+    """結果を表形式で表示"""
+    names = sorted({name for metrics in results.values() for name in metrics})
+    cases = list(results)
+
+    print()
+    print(f"{'metric':<24}" + "".join(f"{case:>14}" for case in cases))
+    for name in names:
+        row = "".join(
+            f"{results[case][name]:>13.2f}s" if name in results[case] else f"{'-':>14}"
+            for case in cases
+        )
+        print(f"{name:<24}{row}")
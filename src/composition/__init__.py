@@ -1,9 +1,27 @@
 """Composition module for text rendering"""
-from .text_renderer import TextRenderer, SlideComposer, FontManager, compose_slides
+from .text_renderer import (
+    TextRenderer,
+    SlideComposer,
+    FontManager,
+    compose_slides,
+    get_font_manager,
+    get_compose_pool,
+    prewarm_compose_pool,
+)
+from .text_sprite import TextSprite, SpriteCache, get_sprite_cache
+from .text_effects import TextEffectStyle, render_effects
 
 __all__ = [
     "TextRenderer",
     "SlideComposer",
     "FontManager",
     "compose_slides",
+    "get_font_manager",
+    "get_compose_pool",
+    "prewarm_compose_pool",
+    "TextSprite",
+    "SpriteCache",
+    "get_sprite_cache",
+    "TextEffectStyle",
+    "render_effects",
 ]
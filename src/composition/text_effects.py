@@ -0,0 +1,184 @@
+"""
+テキストエフェクト（縁取り・影・グロー・グラデーション）
+
+グリフのマスク（アンチエイリアス済みの濃度）を1回だけ描画し、縁取り・影・グローの
+各レイヤーをNumPyの配列演算（モルフォロジー膨張とぼかし）で作ってから1回で合成する。
+膨張は行ごとの区間最大値を倍々に広げて求め、ぼかしは累積和（積分画像）の
+ボックスブラーを3回かけるため、処理量は縁取りの太さ・ぼかし半径にほとんど比例しない。
+"""
+import math
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+from PIL import Image, ImageColor
+
+
+@dataclass
+class TextEffectStyle:
+    """テキストの塗りとエフェクトの設定"""
+    color: str = "#FFFFFF"
+    stroke_width: int = 0
+    stroke_color: str = "#000000"
+    # 設定すると color（上）からこの色（下）への縦グラデーションで塗る
+    gradient_color: Optional[str] = None
+    # 影（色を設定した場合のみ）
+    shadow_color: Optional[str] = None
+    shadow_offset: Tuple[int, int] = (4, 4)
+    shadow_blur: int = 6
+    # グロー（色を設定した場合のみ）
+    glow_color: Optional[str] = None
+    glow_radius: int = 12
+
+    @property
+    def extent(self) -> int:
+        """エフェクトがグリフの外側に広がる最大のピクセル数"""
+        extent = max(self.stroke_width, 0)
+        if self.shadow_color:
+            offset = max(abs(self.shadow_offset[0]), abs(self.shadow_offset[1]))
+            extent = max(extent, self.stroke_width + offset + self.shadow_blur)
+        if self.glow_color:
+            extent = max(extent, self.stroke_width + self.glow_radius)
+        return extent
+
+
+def render_effects(
+    mask: np.ndarray,
+    style: TextEffectStyle,
+    fill_rows: Optional[Tuple[int, int]] = None,
+) -> Image.Image:
+    """
+    グリフのマスクからエフェクト付きのテキスト画像を作成
+
+    Args:
+        mask: グリフの濃度（0〜1のfloat32、高さ×幅）。エフェクトの広がり分の余白を含むこと
+        style: 塗りとエフェクトの設定
+        fill_rows: グラデーションをかける行の範囲（開始, 終了）。省略時はマスク全体
+
+    Returns:
+        Image.Image: RGBA画像（マスクと同じサイズ）
+    """
+    height, width = mask.shape
+    silhouette = dilate(mask, style.stroke_width)
+
+    # 下から順に重ねるレイヤー（濃度, 色）
+    layers: List[Tuple[np.ndarray, np.ndarray]] = []
+
+    if style.glow_color:
+        glow = blur(dilate(silhouette, style.glow_radius // 2), style.glow_radius)
+        glow_rgb, glow_alpha = _parse_color(style.glow_color)
+        layers.append((np.minimum(glow * 1.5, 1.0) * glow_alpha, glow_rgb))
+
+    if style.shadow_color:
+        shadow = blur(_shift(silhouette, *style.shadow_offset), style.shadow_blur)
+        shadow_rgb, shadow_alpha = _parse_color(style.shadow_color)
+        layers.append((shadow * shadow_alpha, shadow_rgb))
+
+    if style.stroke_width > 0:
+        stroke_rgb, stroke_alpha = _parse_color(style.stroke_color)
+        layers.append((silhouette * stroke_alpha, stroke_rgb))
+
+    fill_rgb, fill_alpha = _parse_color(style.color)
+    if style.gradient_color:
+        end_rgb, _ = _parse_color(style.gradient_color)
+        top, bottom = fill_rows or (0, height)
+        ratio = np.clip(
+            (np.arange(height, dtype=np.float32) - top) / max(bottom - top - 1, 1), 0.0, 1.0,
+        )[:, None, None]
+        fill_rgb = fill_rgb * (1.0 - ratio) + end_rgb * ratio
+    layers.append((mask * fill_alpha, fill_rgb))
+
+    # 乗算済みアルファで一度に重ねる
+    out_rgb = np.zeros((height, width, 3), dtype=np.float32)
+    out_alpha = np.zeros((height, width), dtype=np.float32)
+    for alpha, rgb in layers:
+        out_rgb = rgb * alpha[..., None] + out_rgb * (1.0 - alpha[..., None])
+        out_alpha = alpha + out_alpha * (1.0 - alpha)
+
+    # 乗算済みから通常のアルファに戻す
+    rgba = np.empty((height, width, 4), dtype=np.uint8)
+    rgba[..., :3] = np.clip(
+        out_rgb / np.maximum(out_alpha, 1e-6)[..., None] + 0.5, 0, 255,
+    ).astype(np.uint8)
+    rgba[..., 3] = np.clip(out_alpha * 255.0 + 0.5, 0, 255).astype(np.uint8)
+    return Image.fromarray(rgba, "RGBA")
+
+
+def dilate(mask: np.ndarray, radius: int) -> np.ndarray:
+    """
+    円形の構造要素でマスクを膨張させる（濃度の最大値を取るためアンチエイリアスが残る）
+
+    円を行ごとの横幅に分解し、各横幅の区間最大値を1回ずつ求めて縦にずらして重ねる。
+    """
+    if radius <= 0:
+        return mask
+    height, width = mask.shape
+    padded = np.pad(mask, radius)
+    result = np.zeros_like(mask)
+    window_max: Dict[int, np.ndarray] = {}
+    for dy in range(-radius, radius + 1):
+        half = int(math.sqrt((radius + 0.5) ** 2 - dy * dy))
+        if half not in window_max:
+            window_max[half] = _horizontal_max(padded, half)
+        rows = window_max[half][radius + dy:radius + dy + height, radius:radius + width]
+        np.maximum(result, rows, out=result)
+    return result
+
+
+def blur(mask: np.ndarray, radius: int) -> np.ndarray:
+    """ボックスブラーを3回かけてガウスぼかしに近づける（広がりは radius ピクセル）"""
+    if radius <= 0:
+        return mask
+    box = max(int(math.ceil(radius / 3)), 1)
+    result = mask
+    for _ in range(3):
+        result = _box_blur(_box_blur(result, box, axis=0), box, axis=1)
+    return result
+
+
+def _box_blur(mask: np.ndarray, radius: int, axis: int) -> np.ndarray:
+    """累積和で1方向のボックスブラーをかける（範囲外は透明として扱う）"""
+    pad = [(0, 0), (0, 0)]
+    pad[axis] = (radius + 1, radius)
+    cumulative = np.cumsum(np.pad(mask, pad), axis=axis, dtype=np.float64)
+    size = mask.shape[axis]
+    window = 2 * radius + 1
+    upper = np.take(cumulative, np.arange(window, window + size), axis=axis)
+    lower = np.take(cumulative, np.arange(0, size), axis=axis)
+    return ((upper - lower) / window).astype(np.float32)
+
+
+def _horizontal_max(mask: np.ndarray, half: int) -> np.ndarray:
+    """各画素の左右 half ピクセルの範囲の最大値（区間を倍々に広げて求める）"""
+    if half <= 0:
+        return mask
+    width = mask.shape[1]
+    length = 2 * half + 1
+    # result[:, x] は padded[:, x:x+span] の最大値
+    result = np.pad(mask, ((0, 0), (half, half)))
+    span = 1
+    while span * 2 <= length:
+        result[:, :-span] = np.maximum(result[:, :-span], result[:, span:])
+        span *= 2
+    rest = length - span
+    if rest > 0:
+        result[:, :-rest] = np.maximum(result[:, :-rest], result[:, rest:])
+    return result[:, :width]
+
+
+def _shift(mask: np.ndarray, dx: int, dy: int) -> np.ndarray:
+    """マスクを (dx, dy) ずらす（はみ出た部分は捨てる）"""
+    height, width = mask.shape
+    result = np.zeros_like(mask)
+    if abs(dx) >= width or abs(dy) >= height:
+        return result
+    result[max(dy, 0):height + min(dy, 0), max(dx, 0):width + min(dx, 0)] = \
+        mask[max(-dy, 0):height - max(dy, 0), max(-dx, 0):width - max(dx, 0)]
+    return result
+
+
+def _parse_color(color: str) -> Tuple[np.ndarray, float]:
+    """色文字列（#RRGGBB / #RRGGBBAA / 色名）をRGB配列と不透明度に変換"""
+    value = ImageColor.getrgb(color)
+    alpha = value[3] / 255.0 if len(value) == 4 else 1.0
+    return np.array(value[:3], dtype=np.float32), alpha
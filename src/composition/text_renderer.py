@@ -1,71 +1,176 @@
 """
 Pillowを使用したテキスト描画モジュール
 """
+import atexit
 import logging
+import multiprocessing
+import threading
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, List, Optional, Tuple, Union
 
+import numpy as np
 from PIL import Image, ImageDraw, ImageFont, ImageFilter
 
-from src.core.config import get_config, get_project_root
-from src.core.schemas.video_script import Slide, TextElement, TextAnchor, TextStyle
+from src.composition.text_effects import TextEffectStyle, render_effects
+from src.composition.text_sprite import TextSprite, get_sprite_cache
+from src.core.cache import ArtifactCache, get_artifact_cache
+from src.core.config import Config, get_config, get_project_root, set_config
+from src.core.schemas.video_script import Slide, TextAnimationType, TextElement, TextAnchor, TextStyle
+from src.core.tracing import Span, adopt_spans, capture_spans, span
 
 logger = logging.getLogger(__name__)
 
+# 行頭禁則文字（行の先頭に置かない: 句読点・閉じ括弧・小書きの仮名・長音記号など）
+LINE_START_PROHIBITED = frozenset(
+    "、。，．,.・：；:;？！?!‼⁇⁈⁉ー－―…‥〜～゠"
+    ")）]］}｝〕〉》」』】〙〗〟’”｠»"
+    "ぁぃぅぇぉっゃゅょゎゕゖァィゥェォッャュョヮヵヶㇰㇱㇲㇳㇴㇵㇶㇷㇸㇹㇺㇻㇼㇽㇾㇿ々〻ゝゞヽヾ"
+)
+
+# 行末禁則文字（行の末尾に置かない: 開き括弧）
+LINE_END_PROHIBITED = frozenset("(（[［{｛〔〈《「『【〘〖〝‘“｟«")
+
+# テキストのレイアウト（折り返しなど）の処理を変えたら上げる（キャッシュ済みのスプライト・スライドを使わない）
+LAYOUT_VERSION = 2
+
+# 半透明の背景ボックスを付けるスタイルと、ボックスの余白
+BOXED_STYLES = frozenset({TextStyle.TITLE, TextStyle.HOOK})
+BOX_PADDING = 20
+
+
+# 事前に送り幅を計算しておく文字（ASCII・ひらがな・カタカナ・よく使う記号）
+PRELOAD_CHARS = (
+    "".join(chr(c) for c in range(0x20, 0x7F))
+    + "".join(chr(c) for c in range(0x3041, 0x3097))
+    + "".join(chr(c) for c in range(0x30A1, 0x30FB))
+    + "、。・ー「」『』（）！？…"
+)
+
 
 class FontManager:
-    """フォント管理クラス"""
+    """
+    フォント管理クラス
+
+    フォントと文字の寸法（送り幅・行のバウンディングボックス）をキャッシュする。
+    プロセス全体で1つを共有するため（get_font_manager）、スレッドセーフにしている。
+    """
+
+    # 行のバウンディングボックスのキャッシュの上限（超えたら全て破棄）
+    MAX_BBOX_ENTRIES = 8192
 
     def __init__(self):
         config = get_config()
         self.config = config.fonts
         self.fonts_dir = get_project_root() / config.fonts.directory
         self._font_cache: Dict[Tuple[str, int], ImageFont.FreeTypeFont] = {}
+        # 文字送り幅のキャッシュ: (フォントファイル, サイズ, 文字) → 幅
+        self._advance_cache: Dict[Tuple[str, int, str], float] = {}
+        # 行のバウンディングボックスのキャッシュ: (フォントファイル, サイズ, 行) → bbox
+        self._bbox_cache: Dict[Tuple[str, int, str], Tuple[int, int, int, int]] = {}
+        self._lock = threading.Lock()
 
     def get_font(self, font_type: str, size: int) -> ImageFont.FreeTypeFont:
         """フォントを取得（キャッシュ付き）"""
         cache_key = (font_type, size)
-        if cache_key not in self._font_cache:
-            font_file = getattr(self.config, font_type, self.config.regular)
-            font_path = self.fonts_dir / font_file
-            self._font_cache[cache_key] = ImageFont.truetype(str(font_path), size)
-        return self._font_cache[cache_key]
+        font = self._font_cache.get(cache_key)
+        if font is None:
+            with self._lock:
+                # 他のスレッドが読み込み済みなら、それを使う
+                font = self._font_cache.get(cache_key)
+                if font is None:
+                    font_file = getattr(self.config, font_type, self.config.regular)
+                    font_path = self.fonts_dir / font_file
+                    font = ImageFont.truetype(str(font_path), size)
+                    self._font_cache[cache_key] = font
+        return font
+
+    def get_advance(self, font: ImageFont.FreeTypeFont, char: str) -> float:
+        """文字の送り幅を取得（キャッシュ付き）"""
+        cache_key = (font.path, font.size, char)
+        advance = self._advance_cache.get(cache_key)
+        if advance is None:
+            # 同じ値を2回計算しても結果は同じなので、書き込みはロックしない
+            advance = font.getlength(char)
+            self._advance_cache[cache_key] = advance
+        return advance
+
+    def get_bbox(self, font: ImageFont.FreeTypeFont, text: str) -> Tuple[int, int, int, int]:
+        """1行のテキストのバウンディングボックスを取得（キャッシュ付き）"""
+        cache_key = (font.path, font.size, text)
+        bbox = self._bbox_cache.get(cache_key)
+        if bbox is None:
+            bbox = font.getbbox(text)
+            if len(self._bbox_cache) >= self.MAX_BBOX_ENTRIES:
+                self._bbox_cache.clear()
+            self._bbox_cache[cache_key] = bbox
+        return bbox
+
+    def preload(self) -> None:
+        """設定された全テキストスタイルのフォントを読み込み、よく使う文字の送り幅を計算しておく"""
+        for style in TextStyle:
+            font, _ = self.get_style_font(style)
+            for char in PRELOAD_CHARS:
+                self.get_advance(font, char)
 
     def get_style_font(self, style: TextStyle) -> Tuple[ImageFont.FreeTypeFont, dict]:
         """スタイルに対応するフォントと設定を取得"""
         style_config = self.config.styles.get(style.value, {})
 
-        if isinstance(style_config, dict):
-            font_type = style_config.get("font", "medium")
-            size = style_config.get("size", 48)
-            color = style_config.get("color", "#FFFFFF")
-            stroke_width = style_config.get("stroke_width", 2)
-            stroke_color = style_config.get("stroke_color", "#000000")
-        else:
+        def option(name: str, default):
+            if isinstance(style_config, dict):
+                return style_config.get(name, default)
             # FontStyleConfigオブジェクトの場合
-            font_type = style_config.font if hasattr(style_config, 'font') else "medium"
-            size = style_config.size if hasattr(style_config, 'size') else 48
-            color = style_config.color if hasattr(style_config, 'color') else "#FFFFFF"
-            stroke_width = style_config.stroke_width if hasattr(style_config, 'stroke_width') else 2
-            stroke_color = style_config.stroke_color if hasattr(style_config, 'stroke_color') else "#000000"
+            return getattr(style_config, name, default)
 
-        font = self.get_font(font_type, size)
+        font = self.get_font(option("font", "medium"), option("size", 48))
 
         return font, {
-            "color": color,
-            "stroke_width": stroke_width,
-            "stroke_color": stroke_color,
+            "color": option("color", "#FFFFFF"),
+            "stroke_width": option("stroke_width", 2),
+            "stroke_color": option("stroke_color", "#000000"),
+            "gradient_color": option("gradient_color", None),
+            "shadow_color": option("shadow_color", None),
+            "shadow_offset": tuple(option("shadow_offset", (4, 4))),
+            "shadow_blur": option("shadow_blur", 6),
+            "glow_color": option("glow_color", None),
+            "glow_radius": option("glow_radius", 12),
         }
 
 
+# グローバルフォントマネージャーインスタンス
+_font_manager: Optional[FontManager] = None
+_font_manager_lock = threading.Lock()
+
+
+def get_font_manager() -> FontManager:
+    """フォントマネージャーを取得（シングルトン）"""
+    global _font_manager
+    with _font_manager_lock:
+        if _font_manager is None:
+            _font_manager = FontManager()
+    return _font_manager
+
+
 class TextRenderer:
     """テキスト描画クラス"""
 
     def __init__(self):
-        self.font_manager = FontManager()
+        self.font_manager = get_font_manager()
+        self.sprite_cache = get_sprite_cache()
         config = get_config()
         self.video_width = config.video.width
         self.video_height = config.video.height
+        self.text_animation = config.slides.text_animation
+
+    def is_animated(self, element: TextElement) -> bool:
+        """
+        テキスト要素をエンコード時にアニメーションさせるか
+
+        アニメーションする要素はスライド画像には焼き込まず、
+        動画化の際にスプライトとして重ねる（src.video.text_animation）。
+        """
+        return self.text_animation and element.animation != TextAnimationType.NONE
 
     def render_text_on_image(
         self,
@@ -82,97 +187,252 @@ class TextRenderer:
         Returns:
             Image.Image: テキストが描画された画像
         """
-        # 画像をコピー（元画像を変更しない）
-        result = image.copy()
+        # 画像をコピー（元画像を変更しない）し、RGBAへの変換はスライドごとに1回だけ行う
+        result = image.convert('RGBA') if image.mode != 'RGBA' else image.copy()
 
         for element in text_elements:
             result = self._render_single_text(result, element)
 
         return result
 
-    def _render_single_text(
-        self,
-        image: Image.Image,
-        element: TextElement,
-    ) -> Image.Image:
-        """単一のテキスト要素を描画"""
-        draw = ImageDraw.Draw(image)
+    def render_sprite(self, element: TextElement, image_width: int) -> TextSprite:
+        """
+        テキスト要素を透明背景のスプライトとして描画する（キャッシュ付き）
+
+        縁取りと TITLE/HOOK の背景ボックスを含む。内容・スタイル・フォント・
+        折り返し幅が同じなら、別のスライドや別の動画でも同じスプライトを使う。
+
+        Args:
+            element: テキスト要素（位置・アンカーは使わない）
+            image_width: 貼り付け先の画像の幅（折り返し幅の計算に使用）
 
-        # フォントとスタイル設定を取得
+        Returns:
+            TextSprite: 描画済みのテキスト要素
+        """
         font, style_config = self.font_manager.get_style_font(element.style)
+        max_width = image_width * 0.85
+        boxed = element.style in BOXED_STYLES
+        cache_key = ArtifactCache.make_key(
+            element.content,
+            element.style.value,
+            font.path,
+            font.size,
+            style_config,
+            max_width,
+            boxed,
+            LAYOUT_VERSION,
+        )
+        sprite = self.sprite_cache.get(cache_key)
+        if sprite is not None:
+            return sprite
 
         # テキストの改行処理
-        lines = self._wrap_text(element.content, font, image.width * 0.85)
+        lines = self._wrap_text(element.content, font, max_width)
 
         # テキストのサイズを計算
-        text_bbox = self._get_multiline_bbox(draw, lines, font)
+        text_bbox = self._get_multiline_bbox(lines, font)
         text_width = text_bbox[2] - text_bbox[0]
         text_height = text_bbox[3] - text_bbox[1]
 
-        # 位置の計算
-        x, y = self._calculate_position(
-            element.x, element.y,
-            element.anchor,
-            text_width, text_height,
-            image.width, image.height,
-        )
+        # 背景ボックス・縁取りなどのエフェクト・グリフのはみ出し分の余白
+        effect_style = TextEffectStyle(**style_config)
+        margin = (BOX_PADDING if boxed else 0) + effect_style.extent + font.size // 4
+        size = (text_width + margin * 2, text_height + margin * 2)
+        image = Image.new('RGBA', size, (0, 0, 0, 0))
 
         # 背景の半透明ボックスを描画（オプション）
-        if element.style in [TextStyle.TITLE, TextStyle.HOOK]:
-            padding = 20
-            box_coords = (
-                x - padding,
-                y - padding,
-                x + text_width + padding,
-                y + text_height + padding,
-            )
-            # 半透明の黒背景
-            overlay = Image.new('RGBA', image.size, (0, 0, 0, 0))
-            overlay_draw = ImageDraw.Draw(overlay)
-            overlay_draw.rounded_rectangle(
-                box_coords,
+        if boxed:
+            ImageDraw.Draw(image).rounded_rectangle(
+                (
+                    margin - BOX_PADDING,
+                    margin - BOX_PADDING,
+                    margin + text_width + BOX_PADDING,
+                    margin + text_height + BOX_PADDING,
+                ),
                 radius=10,
                 fill=(0, 0, 0, 128),
             )
-            image = Image.alpha_composite(image.convert('RGBA'), overlay)
-            draw = ImageDraw.Draw(image)
-
-        # テキストを描画（縁取り付き）
-        self._draw_multiline_text(
-            draw, lines, (x, y), font,
-            fill=style_config["color"],
-            stroke_width=style_config["stroke_width"],
-            stroke_fill=style_config["stroke_color"],
+
+        # グリフのマスクを1回だけ描画し、縁取り・影・グローはNumPyで作って重ねる
+        mask = Image.new('L', size, 0)
+        self._draw_multiline_text(ImageDraw.Draw(mask), lines, (margin, margin), font, fill=255)
+        effects = render_effects(
+            np.asarray(mask, dtype=np.float32) / 255.0,
+            effect_style,
+            fill_rows=(margin, margin + text_height),
+        )
+        image.alpha_composite(effects)
+
+        sprite = TextSprite(
+            image=image,
+            text_width=text_width,
+            text_height=text_height,
+            margin=margin,
+        )
+        self.sprite_cache.put(cache_key, sprite)
+        return sprite
+
+    def layout(
+        self,
+        element: TextElement,
+        image_width: int,
+        image_height: int,
+    ) -> Tuple[TextSprite, int, int]:
+        """
+        テキスト要素のスプライトと配置位置を求める
+
+        Args:
+            element: テキスト要素
+            image_width: 貼り付け先の画像の幅
+            image_height: 貼り付け先の画像の高さ
+
+        Returns:
+            Tuple[TextSprite, int, int]: スプライトと、スプライト左上の座標（画面外なら負の値）
+        """
+        sprite = self.render_sprite(element, image_width)
+
+        # 位置の計算
+        x, y = self._calculate_position(
+            element.x, element.y,
+            element.anchor,
+            sprite.text_width, sprite.text_height,
+            image_width, image_height,
         )
+        return sprite, x - sprite.margin, y - sprite.margin
 
+    def _render_single_text(
+        self,
+        image: Image.Image,
+        element: TextElement,
+    ) -> Image.Image:
+        """単一のテキスト要素を描画（image はRGBAで、その場で書き換える）"""
+        sprite, x, y = self.layout(element, image.width, image.height)
+        self._paste_sprite(image, sprite.image, (x, y))
         return image
 
+    @staticmethod
+    def _paste_sprite(
+        image: Image.Image,
+        sprite: Image.Image,
+        position: Tuple[int, int],
+    ) -> None:
+        """スプライトを、画像内に収まる範囲だけその場で合成する"""
+        x, y = position
+        # 画面外にはみ出た部分は切り取る（alpha_composite は負の座標を扱えない）
+        source_left = max(-x, 0)
+        source_top = max(-y, 0)
+        source_right = min(sprite.width, image.width - x)
+        source_bottom = min(sprite.height, image.height - y)
+        if source_right <= source_left or source_bottom <= source_top:
+            return
+
+        image.alpha_composite(
+            sprite,
+            dest=(x + source_left, y + source_top),
+            source=(source_left, source_top, source_right, source_bottom),
+        )
+
     def _wrap_text(
         self,
         text: str,
         font: ImageFont.FreeTypeFont,
         max_width: float,
     ) -> List[str]:
-        """テキストを折り返す"""
-        lines = []
+        """
+        テキストを折り返す
+
+        文字ごとの送り幅を足し合わせて行幅を求める（行全体を測り直さない）。
+        行頭禁則・行末禁則を守り、英単語の途中では改行しない。
+        どうしても守れない場合（1語が1行より長いなど）は幅を優先して改行する。
+        空の行は出力しない。
+        """
+        lines: List[str] = []
         for paragraph in text.split('\n'):
-            current_line = ""
+            current: List[str] = []
+            widths: List[float] = []
+            line_width = 0.0
+            wrapped = False
             for char in paragraph:
-                test_line = current_line + char
-                bbox = font.getbbox(test_line)
-                if bbox[2] - bbox[0] <= max_width:
-                    current_line = test_line
-                else:
-                    if current_line:
-                        lines.append(current_line)
-                    current_line = char
-            if current_line:
-                lines.append(current_line)
+                if wrapped and not current and char == " ":
+                    # 折り返した行の先頭の空白は詰める
+                    continue
+                advance = self.font_manager.get_advance(font, char)
+                if line_width + advance <= max_width or not current:
+                    current.append(char)
+                    widths.append(advance)
+                    line_width += advance
+                    continue
+
+                # 改行位置を決め、そこから後ろの文字を次の行へ送る
+                split = self._find_break(current, char)
+                self._append_line(lines, current[:split])
+                wrapped = True
+                current, widths = self._strip_leading_spaces(current[split:], widths[split:])
+                if current or char != " ":
+                    current.append(char)
+                    widths.append(advance)
+
+                # 送った文字だけで1行を超える場合（長い単語など）は、収まるまで改行を続ける
+                line_width = sum(widths)
+                while line_width > max_width and len(current) > 1:
+                    fit = 1
+                    total = widths[0]
+                    while total + widths[fit] <= max_width:
+                        total += widths[fit]
+                        fit += 1
+                    split = self._find_break(current[:fit], current[fit])
+                    self._append_line(lines, current[:split])
+                    current, widths = self._strip_leading_spaces(current[split:], widths[split:])
+                    line_width = sum(widths)
+            self._append_line(lines, current)
         return lines
 
+    @staticmethod
+    def _append_line(lines: List[str], chars: List[str]) -> None:
+        """行末の空白を除いて行を追加（空の行は追加しない）"""
+        line = "".join(chars).rstrip(" ")
+        if line:
+            lines.append(line)
+
+    @staticmethod
+    def _strip_leading_spaces(
+        chars: List[str],
+        widths: List[float],
+    ) -> Tuple[List[str], List[float]]:
+        """行頭の空白を詰める"""
+        start = 0
+        while start < len(chars) and chars[start] == " ":
+            start += 1
+        return chars[start:], widths[start:]
+
+    @staticmethod
+    def _find_break(line: List[str], next_char: str) -> int:
+        """
+        行 line の末尾に next_char が入らないときの改行位置（line のインデックス）を求める
+
+        改行位置 i では line[:i] が現在の行、line[i:] + next_char が次の行になる。
+        現在の行が空白だけになる位置では改行しない。禁則を守れる位置がなければ len(line)。
+        """
+        def allowed(i: int) -> bool:
+            after = line[i] if i < len(line) else next_char
+            before = line[i - 1]
+            if after in LINE_START_PROHIBITED or before in LINE_END_PROHIBITED:
+                return False
+            # 英数字の単語の途中では改行しない
+            if before.isascii() and after.isascii() and before.isalnum() and after.isalnum():
+                return False
+            return True
+
+        first = 0
+        while first < len(line) and line[first] == " ":
+            first += 1
+        for i in range(len(line), first, -1):
+            if allowed(i):
+                return i
+        return len(line)
+
     def _get_multiline_bbox(
         self,
-        draw: ImageDraw.Draw,
         lines: List[str],
         font: ImageFont.FreeTypeFont,
     ) -> Tuple[int, int, int, int]:
@@ -185,7 +445,7 @@ class TextRenderer:
         line_height = font.size + 10  # 行間
 
         for line in lines:
-            bbox = font.getbbox(line)
+            bbox = self.font_manager.get_bbox(font, line)
             width = bbox[2] - bbox[0]
             max_width = max(max_width, width)
             total_height += line_height
@@ -233,24 +493,14 @@ class TextRenderer:
         lines: List[str],
         position: Tuple[int, int],
         font: ImageFont.FreeTypeFont,
-        fill: str,
-        stroke_width: int,
-        stroke_fill: str,
+        fill: Union[str, int],
     ) -> None:
-        """複数行テキストを描画"""
+        """複数行テキストを描画（縁取りは text_effects で付ける）"""
         x, y = position
         line_height = font.size + 10
 
         for line in lines:
-            # 縁取り付きでテキストを描画
-            draw.text(
-                (x, y),
-                line,
-                font=font,
-                fill=fill,
-                stroke_width=stroke_width,
-                stroke_fill=stroke_fill,
-            )
+            draw.text((x, y), line, font=font, fill=fill)
             y += line_height
 
 
@@ -260,8 +510,10 @@ class SlideComposer:
     def __init__(self):
         self.text_renderer = TextRenderer()
         config = get_config()
+        self.fonts_config = config.fonts
         self.video_width = config.video.width
         self.video_height = config.video.height
+        self.cache = get_artifact_cache()
 
     def compose_slide(
         self,
@@ -280,6 +532,65 @@ class SlideComposer:
         Returns:
             Path: 生成されたスライドのパス
         """
+        with span("slide.compose", order=slide.order) as current:
+            # 同じ背景・テキスト・フォント設定のスライドがあれば再利用
+            cache_key = self.cache.make_key(
+                self.cache.hash_file(background_path),
+                [element.model_dump(mode="json") for element in self.static_elements(slide)],
+                self.fonts_config.model_dump(),
+                (self.video_width, self.video_height),
+                LAYOUT_VERSION,
+            )
+            if self.cache.get("slides", cache_key, output_path):
+                current.attributes["cache_hit"] = True
+                logger.info(f"Slide cache hit: {output_path}")
+                return output_path
+
+            result = self.render_slide(background_path, slide)
+
+            # 保存
+            output_path.parent.mkdir(parents=True, exist_ok=True)
+            result.save(output_path, 'PNG')
+            self.cache.put("slides", cache_key, output_path)
+            current.add_bytes(
+                bytes_in=background_path.stat().st_size,
+                bytes_out=output_path.stat().st_size,
+            )
+
+            logger.info(f"Slide composed: {output_path}")
+            return output_path
+
+    def static_elements(self, slide: Slide) -> List[TextElement]:
+        """スライド画像に焼き込むテキスト要素（アニメーションしないもの）"""
+        return [
+            element for element in slide.text_elements
+            if not self.text_renderer.is_animated(element)
+        ]
+
+    def save_thumbnail(self, background_path: Path, slide: Slide, output_path: Path) -> Path:
+        """アニメーションするテキストも含めた全テキスト入りの静止画を保存（サムネイル用）"""
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+        self.render_slide(background_path, slide, include_animated=True).save(output_path, 'PNG')
+        return output_path
+
+    def render_slide(
+        self,
+        background_path: Path,
+        slide: Slide,
+        include_animated: bool = False,
+    ) -> Image.Image:
+        """
+        背景画像にテキストを合成したスライド画像を作成（ファイルには保存しない）
+
+        Args:
+            background_path: 背景画像のパス
+            slide: スライド情報
+            include_animated: アニメーションするテキストも焼き込む
+                （通常は動画化の際に重ねるため含めない）
+
+        Returns:
+            Image.Image: 動画サイズのスライド画像（RGBA）
+        """
         # 背景画像を読み込み
         background = Image.open(background_path)
 
@@ -291,18 +602,11 @@ class SlideComposer:
             background = background.convert('RGBA')
 
         # テキストを描画
-        result = self.text_renderer.render_text_on_image(
+        return self.text_renderer.render_text_on_image(
             background,
-            slide.text_elements,
+            slide.text_elements if include_animated else self.static_elements(slide),
         )
 
-        # 保存
-        output_path.parent.mkdir(parents=True, exist_ok=True)
-        result.save(output_path, 'PNG')
-
-        logger.info(f"Slide composed: {output_path}")
-        return output_path
-
     def compose_all_slides(
         self,
         background_paths: List[Path],
@@ -312,15 +616,40 @@ class SlideComposer:
         """
         全スライドを合成
 
+        pipeline.compose_processes が1以上の場合は共有のプロセスプールで並列に合成する。
+
         Args:
             background_paths: 背景画像のパスリスト
             slides: スライドリスト
             output_dir: 出力ディレクトリ
 
         Returns:
-            List[Path]: 生成されたスライドのパスリスト
+            List[Path]: 生成されたスライドのパスリスト（スライド順）
         """
         output_dir.mkdir(parents=True, exist_ok=True)
+
+        processes = get_config().pipeline.compose_processes
+        if processes > 0:
+            with span("slide.compose_pool", processes=processes, slides=len(slides)):
+                pool = get_compose_pool(processes)
+                futures = [
+                    pool.submit(
+                        _compose_in_worker,
+                        bg_path,
+                        slide,
+                        output_dir / f"slide_{slide.order:02d}.png",
+                    )
+                    for bg_path, slide in zip(background_paths, slides)
+                ]
+                slide_paths = []
+                for future in futures:
+                    # ワーカーで計測した slide.compose のスパンをこのジョブのトレースに加える
+                    slide_path, spans = future.result()
+                    adopt_spans(spans)
+                    slide_paths.append(slide_path)
+            logger.info(f"Composed {len(slide_paths)} slides in {processes} processes")
+            return slide_paths
+
         slide_paths = []
 
         for bg_path, slide in zip(background_paths, slides):
@@ -350,6 +679,65 @@ class SlideComposer:
         return image.resize((self.video_width, self.video_height), Image.Resampling.LANCZOS)
 
 
+# スライド合成用のプロセスプール（プロセス全体で共有）
+_compose_pool: Optional[ProcessPoolExecutor] = None
+_compose_pool_lock = threading.Lock()
+
+# ワーカープロセス内の SlideComposer
+_worker_composer: Optional[SlideComposer] = None
+
+
+def get_compose_pool(processes: int) -> ProcessPoolExecutor:
+    """
+    スライド合成用のプロセスプールを取得（初回のみ作成）
+
+    ワーカーは spawn で起動し（スレッドを持つ親プロセスを fork しない）、
+    親プロセスの設定を引き継いでフォントを読み込んだ状態で待機する。
+    """
+    global _compose_pool
+    with _compose_pool_lock:
+        if _compose_pool is None:
+            _compose_pool = ProcessPoolExecutor(
+                max_workers=processes,
+                mp_context=multiprocessing.get_context("spawn"),
+                initializer=_init_compose_worker,
+                initargs=(get_config(),),
+            )
+            atexit.register(_compose_pool.shutdown)
+    return _compose_pool
+
+
+def prewarm_compose_pool(processes: int) -> None:
+    """プロセスプールの全ワーカーを起動しておく（初回合成時の起動待ちをなくす）"""
+    pool = get_compose_pool(processes)
+    for future in [pool.submit(_worker_ready) for _ in range(processes)]:
+        future.result()
+
+
+def _worker_ready() -> bool:
+    """ワーカーの起動確認用"""
+    return _worker_composer is not None
+
+
+def _init_compose_worker(config: Config) -> None:
+    """ワーカープロセスの初期化（設定の引き継ぎとフォントの事前読み込み）"""
+    global _worker_composer
+    set_config(config)
+    _worker_composer = SlideComposer()
+    get_font_manager().preload()
+
+
+def _compose_in_worker(
+    background_path: Path,
+    slide: Slide,
+    output_path: Path,
+) -> Tuple[Path, List[Span]]:
+    """ワーカープロセスで1枚のスライドを合成し、計測したスパンと一緒に返す"""
+    with capture_spans() as spans:
+        slide_path = _worker_composer.compose_slide(background_path, slide, output_path)
+    return slide_path, spans
+
+
 def compose_slides(
     background_paths: List[Path],
     slides: List[Slide],
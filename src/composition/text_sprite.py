@@ -0,0 +1,137 @@
+"""
+テキストスプライトのキャッシュ
+
+テキスト要素（縁取り・TITLE/HOOK の背景ボックスを含む）を透明背景のRGBA画像として
+描画したものをスプライトと呼ぶ。内容・スタイル・フォント・折り返し幅が同じなら
+同じ画像になるため、メモリ上のLRUとディスク（ArtifactCache）の2段でキャッシュし、
+スライド合成では貼り付けるだけにする。
+"""
+import io
+import logging
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Optional
+
+from PIL import Image, PngImagePlugin
+
+from src.core.cache import ArtifactCache, get_artifact_cache
+from src.core.config import get_config
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class TextSprite:
+    """描画済みのテキスト要素"""
+    image: Image.Image
+    # テキスト部分（ボックス・縁取りを除く）のサイズ。配置位置の計算に使う
+    text_width: int
+    text_height: int
+    # スプライト左上からテキスト描画位置までの余白
+    margin: int
+
+    @property
+    def nbytes(self) -> int:
+        """メモリ使用量の目安（RGBA）"""
+        return self.image.width * self.image.height * 4
+
+
+class SpriteCache:
+    """メモリLRU＋ディスクの2段のスプライトキャッシュ"""
+
+    NAMESPACE = "sprites"
+
+    def __init__(self, max_memory_bytes: int, disk: Optional[ArtifactCache] = None):
+        """
+        Args:
+            max_memory_bytes: メモリ上に保持するスプライトの合計サイズの上限
+            disk: ディスクキャッシュ（省略時はメモリのみ）
+        """
+        self.max_memory_bytes = max_memory_bytes
+        self.disk = disk
+        self._entries: "OrderedDict[str, TextSprite]" = OrderedDict()
+        self._memory_bytes = 0
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[TextSprite]:
+        """スプライトを取得（なければ None）"""
+        with self._lock:
+            sprite = self._entries.get(key)
+            if sprite is not None:
+                self._entries.move_to_end(key)
+                return sprite
+
+        sprite = self._load(key)
+        if sprite is not None:
+            self._remember(key, sprite)
+        return sprite
+
+    def put(self, key: str, sprite: TextSprite) -> None:
+        """スプライトを保存"""
+        self._remember(key, sprite)
+        if self.disk is None or not self.disk.enabled:
+            return
+
+        # 配置に必要な寸法はPNGのテキストチャンクに保存する
+        info = PngImagePlugin.PngInfo()
+        info.add_text("text_width", str(sprite.text_width))
+        info.add_text("text_height", str(sprite.text_height))
+        info.add_text("margin", str(sprite.margin))
+        buffer = io.BytesIO()
+        sprite.image.save(buffer, "PNG", pnginfo=info)
+        self.disk.put_bytes(self.NAMESPACE, key, buffer.getvalue(), ".png")
+
+    def _remember(self, key: str, sprite: TextSprite) -> None:
+        """メモリに保持し、上限を超えたら古いものから捨てる"""
+        if sprite.nbytes > self.max_memory_bytes:
+            return
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self._memory_bytes -= previous.nbytes
+            self._entries[key] = sprite
+            self._memory_bytes += sprite.nbytes
+            while self._memory_bytes > self.max_memory_bytes:
+                _, evicted = self._entries.popitem(last=False)
+                self._memory_bytes -= evicted.nbytes
+
+    def _load(self, key: str) -> Optional[TextSprite]:
+        """ディスクから読み込む"""
+        if self.disk is None:
+            return None
+        path = self.disk.lookup(self.NAMESPACE, key, ".png")
+        if path is None:
+            return None
+        try:
+            with Image.open(path) as image:
+                image.load()
+                sprite = TextSprite(
+                    image=image.convert("RGBA"),
+                    text_width=int(image.info["text_width"]),
+                    text_height=int(image.info["text_height"]),
+                    margin=int(image.info["margin"]),
+                )
+        except (OSError, KeyError, ValueError) as e:
+            # 削除済み・壊れたエントリはミスとして扱う
+            logger.debug(f"Sprite cache entry unusable: {e}")
+            return None
+        return sprite
+
+
+# グローバルスプライトキャッシュインスタンス
+_sprite_cache: Optional[SpriteCache] = None
+_sprite_cache_lock = threading.Lock()
+
+
+def get_sprite_cache() -> SpriteCache:
+    """テキストスプライトのキャッシュを取得（シングルトン）"""
+    global _sprite_cache
+    with _sprite_cache_lock:
+        if _sprite_cache is None:
+            cache_config = get_config().cache
+            _sprite_cache = SpriteCache(
+                max_memory_bytes=cache_config.sprite_memory_mb * 1024 * 1024,
+                disk=get_artifact_cache() if cache_config.sprite_disk else None,
+            )
+    return _sprite_cache
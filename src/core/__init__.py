@@ -1,11 +1,20 @@
 """Core module for SNS Automation System"""
 from .config import get_config, get_project_root, Config
+from .cache import ArtifactCache, get_artifact_cache
+from .checkpoint import JobManifest
+from .tracing import Tracer, span, trace_job
 from .script_generator import ScriptGenerator, generate_script
 
 __all__ = [
     "get_config",
     "get_project_root",
     "Config",
+    "ArtifactCache",
+    "get_artifact_cache",
+    "JobManifest",
+    "Tracer",
+    "span",
+    "trace_job",
     "ScriptGenerator",
     "generate_script",
 ]
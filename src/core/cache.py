@@ -0,0 +1,202 @@
+"""
+生成物のコンテンツアドレス型キャッシュ
+
+入力のハッシュをキーに背景画像・ナレーション・スライドなどを保存し、
+同じ入力での再生成（有料APIの呼び出しやCPU処理）をスキップする。
+ディスク使用量が上限を超えると、最も長く使われていないものから削除する（LRU）。
+"""
+import hashlib
+import json
+import logging
+import os
+import shutil
+import threading
+import uuid
+from pathlib import Path
+from typing import Any, Callable, Optional
+
+from .config import get_config, get_project_root
+
+logger = logging.getLogger(__name__)
+
+
+class ArtifactCache:
+    """サイズ上限付きのLRUアーティファクトキャッシュ"""
+
+    def __init__(self, directory: Path, max_bytes: int, enabled: bool = True):
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self.enabled = enabled
+        self._lock = threading.Lock()
+        self._total_bytes: Optional[int] = None
+
+    @staticmethod
+    def make_key(*parts: Any) -> str:
+        """入力値からキャッシュキー（SHA-256）を作成"""
+        payload = json.dumps(parts, ensure_ascii=False, sort_keys=True, default=str)
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    @staticmethod
+    def hash_file(path: Path) -> str:
+        """ファイル内容のSHA-256を計算"""
+        digest = hashlib.sha256()
+        with open(path, "rb") as f:
+            for chunk in iter(lambda: f.read(1024 * 1024), b""):
+                digest.update(chunk)
+        return digest.hexdigest()
+
+    def get(self, namespace: str, key: str, output_path: Path) -> bool:
+        """
+        キャッシュにあれば output_path にコピーする
+
+        Args:
+            namespace: 生成物の種類（"backgrounds" など）
+            key: キャッシュキー
+            output_path: コピー先パス
+
+        Returns:
+            bool: キャッシュヒットした場合 True
+        """
+        if not self.enabled:
+            return False
+
+        entry = self._entry_path(namespace, key, output_path.suffix)
+        try:
+            output_path.parent.mkdir(parents=True, exist_ok=True)
+            shutil.copyfile(entry, output_path)
+            # 最終利用時刻を更新（LRU判定に使用）
+            os.utime(entry)
+        except FileNotFoundError:
+            return False
+
+        logger.debug(f"Cache hit: {namespace}/{key[:12]}")
+        return True
+
+    def put(self, namespace: str, key: str, source_path: Path) -> None:
+        """
+        生成物をキャッシュに保存する
+
+        Args:
+            namespace: 生成物の種類
+            key: キャッシュキー
+            source_path: 保存するファイルのパス
+        """
+        if not self.enabled:
+            return
+        self._store(namespace, key, source_path.suffix, lambda tmp_path: shutil.copyfile(source_path, tmp_path))
+
+    def put_bytes(self, namespace: str, key: str, data: bytes, suffix: str) -> None:
+        """
+        メモリ上のデータをキャッシュに保存する
+
+        Args:
+            namespace: 生成物の種類
+            key: キャッシュキー
+            data: 保存するデータ
+            suffix: 拡張子（".png" など）
+        """
+        if not self.enabled:
+            return
+        self._store(namespace, key, suffix, lambda tmp_path: tmp_path.write_bytes(data))
+
+    def lookup(self, namespace: str, key: str, suffix: str) -> Optional[Path]:
+        """
+        キャッシュにあればエントリのパスを返す（コピーせずに直接読む場合）
+
+        エントリは削除される可能性があるため、読み込み時の FileNotFoundError はミスとして扱うこと。
+        """
+        if not self.enabled:
+            return None
+
+        entry = self._entry_path(namespace, key, suffix)
+        try:
+            # 最終利用時刻を更新（LRU判定に使用）
+            os.utime(entry)
+        except FileNotFoundError:
+            return None
+        return entry
+
+    def _store(self, namespace: str, key: str, suffix: str, write: Callable[[Path], Any]) -> None:
+        """write で一時ファイルに書き込み、エントリとして登録する"""
+        entry = self._entry_path(namespace, key, suffix)
+        try:
+            entry.parent.mkdir(parents=True, exist_ok=True)
+            # 書きかけのファイルを読まれないよう一時ファイル経由で置き換える
+            tmp_path = entry.with_name(f".{entry.name}.{uuid.uuid4().hex}.tmp")
+            write(tmp_path)
+            # 同じキーを上書きする場合は置き換える前のサイズを差し引く
+            try:
+                replaced_bytes = entry.stat().st_size
+            except FileNotFoundError:
+                replaced_bytes = 0
+            os.replace(tmp_path, entry)
+        except OSError as e:
+            logger.warning(f"Failed to store cache entry: {e}")
+            return
+
+        with self._lock:
+            if self._total_bytes is None:
+                self._total_bytes = self._scan_total()
+            else:
+                self._total_bytes += entry.stat().st_size - replaced_bytes
+            if self._total_bytes > self.max_bytes:
+                self._evict()
+
+    def _entry_path(self, namespace: str, key: str, suffix: str) -> Path:
+        """キャッシュエントリのパスを取得"""
+        return self.directory / namespace / key[:2] / f"{key}{suffix}"
+
+    def _iter_entries(self):
+        """キャッシュエントリ（一時ファイルを除く）を列挙"""
+        if not self.directory.exists():
+            return
+        for path in self.directory.rglob("*"):
+            if path.is_file() and not path.name.startswith("."):
+                yield path
+
+    def _scan_total(self) -> int:
+        """キャッシュ全体のサイズを計算"""
+        return sum(path.stat().st_size for path in self._iter_entries())
+
+    def _evict(self) -> None:
+        """最も長く使われていないエントリから上限以下になるまで削除"""
+        entries = []
+        for path in self._iter_entries():
+            try:
+                stat = path.stat()
+            except FileNotFoundError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, path))
+
+        # 他プロセスの書き込みも含めて実サイズで判定する
+        total = sum(size for _, size, _ in entries)
+        for _, size, path in sorted(entries):
+            if total <= self.max_bytes:
+                break
+            try:
+                path.unlink()
+                total -= size
+                logger.debug(f"Cache evicted: {path.name}")
+            except FileNotFoundError:
+                continue
+
+        self._total_bytes = total
+
+
+# グローバルキャッシュインスタンス
+_cache: Optional[ArtifactCache] = None
+_cache_lock = threading.Lock()
+
+
+def get_artifact_cache() -> ArtifactCache:
+    """アーティファクトキャッシュを取得（シングルトン）"""
+    global _cache
+    with _cache_lock:
+        if _cache is None:
+            cache_config = get_config().cache
+            _cache = ArtifactCache(
+                directory=get_project_root() / cache_config.directory,
+                max_bytes=cache_config.max_size_mb * 1024 * 1024,
+                enabled=cache_config.enabled,
+            )
+    return _cache
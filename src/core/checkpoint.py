@@ -0,0 +1,119 @@
+"""
+ジョブのチェックポイント管理
+
+出力ディレクトリに manifest.json を置き、完了したフェーズと
+その生成物のチェックサムを記録する。クラッシュやインスタンス停止の後は
+記録を検証して、最初の未完了フェーズから再開できる。
+"""
+import json
+import logging
+import os
+import threading
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from .cache import ArtifactCache
+
+logger = logging.getLogger(__name__)
+
+
+class JobManifest:
+    """ジョブのフェーズ完了状況を記録するマニフェスト"""
+
+    FILENAME = "manifest.json"
+
+    def __init__(self, output_dir: Path, data: Dict[str, Any]):
+        self.output_dir = output_dir
+        self.path = output_dir / self.FILENAME
+        self.data = data
+        self._lock = threading.Lock()
+
+    @classmethod
+    def create(
+        cls,
+        output_dir: Path,
+        job_id: str,
+        theme: str,
+        profile: Optional[str] = None,
+    ) -> "JobManifest":
+        """新しいマニフェストを作成して保存"""
+        manifest = cls(output_dir, {
+            "job_id": job_id,
+            "theme": theme,
+            "profile": profile,
+            "created_at": datetime.now().isoformat(),
+            "phases": {},
+        })
+        manifest.save()
+        return manifest
+
+    @classmethod
+    def exists(cls, output_dir: Path) -> bool:
+        """出力ディレクトリにマニフェストがあるか"""
+        return (output_dir / cls.FILENAME).exists()
+
+    @classmethod
+    def load(cls, output_dir: Path) -> "JobManifest":
+        """既存のマニフェストを読み込む"""
+        path = output_dir / cls.FILENAME
+        if not path.exists():
+            raise FileNotFoundError(f"Manifest not found: {path}")
+        with open(path, "r", encoding="utf-8") as f:
+            return cls(output_dir, json.load(f))
+
+    @property
+    def job_id(self) -> str:
+        return self.data["job_id"]
+
+    @property
+    def theme(self) -> str:
+        return self.data["theme"]
+
+    @property
+    def profile(self) -> Optional[str]:
+        return self.data.get("profile")
+
+    def is_complete(self, phase: str) -> bool:
+        """フェーズが完了済みで、生成物が記録時のまま残っているか"""
+        record = self.data["phases"].get(phase)
+        if record is None:
+            return False
+
+        for relative_path, checksum in record["artifacts"].items():
+            path = self.output_dir / relative_path
+            if not path.exists() or ArtifactCache.hash_file(path) != checksum:
+                logger.warning(f"Checkpoint for phase '{phase}' is stale: {relative_path}")
+                return False
+        return True
+
+    def artifacts(self, phase: str) -> List[Path]:
+        """フェーズの生成物のパスリストを記録順で取得"""
+        record = self.data["phases"][phase]
+        return [self.output_dir / relative_path for relative_path in record["artifacts"]]
+
+    def mark_complete(self, phase: str, artifacts: List[Path]) -> None:
+        """
+        フェーズの完了を記録する
+
+        Args:
+            phase: フェーズ名
+            artifacts: フェーズの生成物（出力ディレクトリ配下のパス）
+        """
+        record = {
+            "completed_at": datetime.now().isoformat(),
+            "artifacts": {
+                path.relative_to(self.output_dir).as_posix(): ArtifactCache.hash_file(path)
+                for path in artifacts
+            },
+        }
+        with self._lock:
+            self.data["phases"][phase] = record
+            self.save()
+
+    def save(self) -> None:
+        """マニフェストを保存（途中で中断されても壊れないよう置き換えで書き込む）"""
+        tmp_path = self.path.with_suffix(".json.tmp")
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(self.data, f, ensure_ascii=False, indent=2)
+        os.replace(tmp_path, self.path)
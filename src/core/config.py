@@ -3,7 +3,7 @@
 """
 import os
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Optional, Tuple
 
 import yaml
 from dotenv import load_dotenv
@@ -14,6 +14,35 @@ from pydantic import BaseModel, Field
 PROJECT_ROOT = Path(__file__).parent.parent.parent
 
 
+class RenderProfile(BaseModel):
+    """レンダリングプロファイル（指定した項目だけ動画設定を上書きする）"""
+    width: Optional[int] = None
+    height: Optional[int] = None
+    fps: Optional[int] = None
+    video_bitrate: Optional[str] = None
+    preset: Optional[str] = None
+    crf: Optional[int] = None
+    tune: Optional[str] = None
+    # Ken Burnsエフェクトの有効/無効（省略時は slides.zoom.enabled）
+    zoom_enabled: Optional[bool] = None
+
+    def video_overrides(self) -> Dict[str, Any]:
+        """VideoConfig に適用する上書き値"""
+        return self.model_dump(exclude_none=True, exclude={"zoom_enabled"})
+
+
+def _default_render_profiles() -> Dict[str, RenderProfile]:
+    """デフォルトのレンダリングプロファイル"""
+    return {
+        # 台本確認用の下書き（低解像度・低fps・ズームなし・最速プリセット）
+        "draft": RenderProfile(
+            width=540, height=960, fps=24, preset="ultrafast", crf=30, zoom_enabled=False,
+        ),
+        # 投稿用（静止画向けチューニングの品質固定エンコード）
+        "final": RenderProfile(preset="medium", crf=18, tune="stillimage"),
+    }
+
+
 class VideoConfig(BaseModel):
     """動画設定"""
     width: int = 1080
@@ -25,6 +54,22 @@ class VideoConfig(BaseModel):
     video_codec: str = "libx264"
     audio_codec: str = "aac"
     format: str = "mp4"
+    # エンコーダー設定（crf 指定時は video_bitrate の代わりに品質固定で圧縮）
+    preset: Optional[str] = None
+    crf: Optional[int] = None
+    tune: Optional[str] = None
+    # ジョブごとに選択できるレンダリングプロファイル
+    profiles: Dict[str, RenderProfile] = Field(default_factory=_default_render_profiles)
+    # 全スライド・字幕・音声を1つのFFmpegフィルターグラフで1回だけエンコードする
+    single_pass: bool = False
+    # プロセス全体でFFmpegに使わせるスレッド数（0 = CPUコア数）
+    ffmpeg_threads: int = 0
+    # エンコード1プロセスあたりのスレッド数（並列エンコード数 = ffmpeg_threads / この値）
+    threads_per_encode: int = 2
+    # フレームの生成方法（"ffmpeg": FFmpegのフィルター / "numpy": Pythonで全フレームを生成）
+    renderer: str = "ffmpeg"
+    # renderer が "numpy" の場合にフレームを生成するプロセス数（0 = CPUコア数）
+    render_processes: int = 0
 
 
 class SlideConfig(BaseModel):
@@ -33,9 +78,16 @@ class SlideConfig(BaseModel):
     max_slides: int = 8
     default_duration: float = 8.0
     transition_duration: float = 0.3
+    # スライド間のトランジション（FFmpegの xfade の種類。transition_duration が0なら切り替えのみ）
+    transition: str = "fade"
     zoom_enabled: bool = True
     zoom_start_scale: float = 1.0
     zoom_end_scale: float = 1.1
+    # 切り出し元の拡大率（出力解像度に対する倍率、大きいほど滑らかだが重い）
+    zoom_oversample: float = 2.0
+    # テキストのアニメーション（TextElement.animation）の有効/無効と、1回の長さ（秒）
+    text_animation: bool = True
+    text_animation_duration: float = 0.4
 
 
 class FontStyleConfig(BaseModel):
@@ -45,6 +97,15 @@ class FontStyleConfig(BaseModel):
     color: str = "#FFFFFF"
     stroke_width: int = 2
     stroke_color: str = "#000000"
+    # 縦グラデーションの下端の色（color から変化する。未設定なら単色）
+    gradient_color: Optional[str] = None
+    # 影（色を設定した場合のみ。#RRGGBBAA で不透明度も指定できる）
+    shadow_color: Optional[str] = None
+    shadow_offset: Tuple[int, int] = (4, 4)
+    shadow_blur: int = 6
+    # グロー（色を設定した場合のみ）
+    glow_color: Optional[str] = None
+    glow_radius: int = 12
 
 
 class FontConfig(BaseModel):
@@ -73,6 +134,7 @@ class DalleConfig(BaseModel):
 class ImageGenerationConfig(BaseModel):
     """画像生成設定"""
     dalle: DalleConfig = Field(default_factory=DalleConfig)
+    max_concurrency: int = 4
     prompt_template: str = ""
     default_styles: list = Field(default_factory=list)
     default_color_schemes: list = Field(default_factory=list)
@@ -131,6 +193,34 @@ class OutputConfig(BaseModel):
     filename_format: str = "{date}_{title}_{id}"
     temp_directory: str = "output/temp"
     keep_temp_files: bool = False
+    # ストリーミング時も全スライドのPNGを保存する（デバッグ用、サムネイル用の1枚目は常に保存）
+    keep_slide_images: bool = False
+
+
+class CacheConfig(BaseModel):
+    """生成物キャッシュ設定"""
+    enabled: bool = True
+    directory: str = "cache"
+    max_size_mb: int = 2048
+    # テキストスプライト（描画済みテキスト）のメモリキャッシュの上限（MB）
+    sprite_memory_mb: int = 64
+    # テキストスプライトをディスクキャッシュにも保存する
+    sprite_disk: bool = True
+
+
+class PipelineConfig(BaseModel):
+    """パイプライン設定"""
+    # スライド単位のストリーミング処理（背景が届いたスライドから合成・エンコード）
+    streaming: bool = False
+    # スライド合成に使うプロセス数（0 = 呼び出し元のスレッドで順に合成）
+    compose_processes: int = 0
+
+
+class TracingConfig(BaseModel):
+    """計測・トレース設定"""
+    enabled: bool = True
+    export_trace: bool = False
+    trace_file: str = "trace.json"
 
 
 class LoggingConfig(BaseModel):
@@ -150,6 +240,9 @@ class Config(BaseModel):
     ai: AIConfig = Field(default_factory=AIConfig)
     content: ContentConfig = Field(default_factory=ContentConfig)
     output: OutputConfig = Field(default_factory=OutputConfig)
+    pipeline: PipelineConfig = Field(default_factory=PipelineConfig)
+    cache: CacheConfig = Field(default_factory=CacheConfig)
+    tracing: TracingConfig = Field(default_factory=TracingConfig)
     logging: LoggingConfig = Field(default_factory=LoggingConfig)
 
     # 環境変数から読み込むAPIキー
@@ -180,6 +273,7 @@ def load_config(config_path: Optional[Path] = None) -> Config:
         config_dict["slides"]["zoom_enabled"] = zoom.get("enabled", True)
         config_dict["slides"]["zoom_start_scale"] = zoom.get("start_scale", 1.0)
         config_dict["slides"]["zoom_end_scale"] = zoom.get("end_scale", 1.1)
+        config_dict["slides"]["zoom_oversample"] = zoom.get("oversample", 2.0)
 
     if "audio" in config_dict and "normalization" in config_dict["audio"]:
         norm = config_dict["audio"].pop("normalization")
@@ -215,6 +309,12 @@ def get_config() -> Config:
     return _config
 
 
+def set_config(config: Config) -> None:
+    """設定を差し替える（子プロセスに親プロセスの設定を引き継ぐ場合など）"""
+    global _config
+    _config = config
+
+
 def get_project_root() -> Path:
     """プロジェクトルートを取得"""
     return PROJECT_ROOT
@@ -0,0 +1,139 @@
+"""
+フェーズ依存グラフによるパイプライン実行モジュール
+
+各フェーズは依存するフェーズの結果を引数として受け取り、
+依存がすべて完了した時点で並行に実行される。
+各フェーズは投入時のコンテキスト（トレースなど）を引き継いで実行される。
+"""
+import contextvars
+import logging
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Optional, Sequence
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class Phase:
+    """パイプラインの1フェーズ"""
+    name: str
+    func: Callable[..., Any]
+    depends_on: List[str] = field(default_factory=list)
+    # 設定されている場合は依存を待たずにこの関数で結果を復元する（チェックポイント再開用）
+    restore: Optional[Callable[[], Any]] = None
+
+
+class PhaseGraph:
+    """フェーズの依存グラフを実行するクラス"""
+
+    def __init__(self, max_workers: Optional[int] = None):
+        self.max_workers = max_workers
+        self._phases: Dict[str, Phase] = {}
+
+    def add_phase(
+        self,
+        name: str,
+        func: Callable[..., Any],
+        depends_on: Sequence[str] = (),
+        restore: Optional[Callable[[], Any]] = None,
+    ) -> None:
+        """
+        フェーズを追加する
+
+        Args:
+            name: フェーズ名（結果のキーになる）
+            func: 実行する関数（依存フェーズの結果をキーワード引数で受け取る）
+            depends_on: 依存するフェーズ名のリスト
+            restore: 完了済みフェーズの結果を復元する関数（省略時は func を実行）
+        """
+        if name in self._phases:
+            raise ValueError(f"Phase already registered: {name}")
+        self._phases[name] = Phase(
+            name=name,
+            func=func,
+            depends_on=list(depends_on),
+            restore=restore,
+        )
+
+    def run(self) -> Dict[str, Any]:
+        """
+        依存関係に従ってすべてのフェーズを実行する
+
+        復元可能なフェーズは依存を待たずに復元され、
+        復元済みフェーズからしか必要とされないフェーズは実行しない。
+
+        Returns:
+            Dict[str, Any]: フェーズ名をキーとした各フェーズの結果
+        """
+        self._validate()
+
+        results: Dict[str, Any] = {}
+        pending = {name: self._phases[name] for name in self._required_phases()}
+        running: Dict[Future, str] = {}
+        max_workers = self.max_workers or max(len(pending), 1)
+
+        with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="phase") as executor:
+            while pending or running:
+                # 依存が揃ったフェーズを投入
+                for name in [n for n, p in pending.items() if self._is_ready(p, results)]:
+                    phase = pending.pop(name)
+                    if phase.restore is not None:
+                        logger.debug(f"Phase restored: {name}")
+                        running[executor.submit(contextvars.copy_context().run, phase.restore)] = name
+                        continue
+                    kwargs = {dep: results[dep] for dep in phase.depends_on}
+                    logger.debug(f"Phase started: {name}")
+                    running[executor.submit(contextvars.copy_context().run, phase.func, **kwargs)] = name
+
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in done:
+                    name = running.pop(future)
+                    try:
+                        results[name] = future.result()
+                    except Exception:
+                        # 未着手のフェーズは破棄し、実行中のフェーズの終了を待って再送出
+                        for other in running:
+                            other.cancel()
+                        raise
+                    logger.debug(f"Phase finished: {name}")
+
+        return results
+
+    @staticmethod
+    def _is_ready(phase: Phase, results: Dict[str, Any]) -> bool:
+        """フェーズを開始できるか（復元可能か、依存がすべて完了しているか）"""
+        return phase.restore is not None or all(dep in results for dep in phase.depends_on)
+
+    def _required_phases(self) -> List[str]:
+        """最終フェーズから依存を辿り、実行または復元が必要なフェーズを求める"""
+        dependents = {dep for phase in self._phases.values() for dep in phase.depends_on}
+        stack = [name for name in self._phases if name not in dependents]
+        required: List[str] = []
+        while stack:
+            name = stack.pop()
+            if name in required:
+                continue
+            required.append(name)
+            phase = self._phases[name]
+            if phase.restore is None:
+                stack.extend(phase.depends_on)
+        return required
+
+    def _validate(self) -> None:
+        """未定義の依存や循環依存がないかチェック"""
+        for phase in self._phases.values():
+            for dep in phase.depends_on:
+                if dep not in self._phases:
+                    raise ValueError(f"Phase '{phase.name}' depends on unknown phase '{dep}'")
+
+        # トポロジカルソートで循環を検出
+        resolved: set = set()
+        remaining = dict(self._phases)
+        while remaining:
+            ready = [n for n, p in remaining.items() if all(d in resolved for d in p.depends_on)]
+            if not ready:
+                raise ValueError(f"Circular dependency among phases: {sorted(remaining)}")
+            for name in ready:
+                resolved.add(name)
+                del remaining[name]
@@ -10,6 +10,7 @@ from typing import Optional
 import google.generativeai as genai
 
 from .config import get_config, get_project_root
+from .tracing import span
 from .schemas.video_script import (
     VideoScript,
     Slide,
@@ -92,20 +93,29 @@ class ScriptGenerator:
 
         logger.info(f"Generating script for theme: {theme}")
 
-        # Gemini APIの呼び出し
-        response = self.model.generate_content(prompt)
+        with span("script.generate", model=config.ai.gemini.model) as current:
+            # Gemini APIの呼び出し
+            response_text = self._request_script(prompt)
 
-        # レスポンスからJSONを抽出
-        response_text = response.text
-        json_data = self._extract_json(response_text)
+            # レスポンスからJSONを抽出
+            current.add_bytes(
+                bytes_in=len(response_text.encode("utf-8")),
+                bytes_out=len(prompt.encode("utf-8")),
+            )
+            json_data = self._extract_json(response_text)
 
-        # VideoScriptオブジェクトに変換
-        script = self._parse_script(json_data)
+            # VideoScriptオブジェクトに変換
+            script = self._parse_script(json_data)
 
         logger.info(f"Script generated: {script.title} ({script.total_duration:.1f}s)")
 
         return script
 
+    def _request_script(self, prompt: str) -> str:
+        """Gemini APIを呼び出してレスポンステキストを取得"""
+        response = self.model.generate_content(prompt)
+        return response.text
+
     def _extract_json(self, text: str) -> dict:
         """レスポンステキストからJSONを抽出"""
         # コードブロック内のJSONを探す
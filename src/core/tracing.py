@@ -0,0 +1,281 @@
+"""
+処理時間の計測とトレース
+
+ジョブごとに Tracer を有効化し、各処理を span() で囲むと
+実時間・CPU時間・入出力バイト数・リトライ回数が記録される。
+ジョブ終了時に timings.json（集計）と、必要に応じて
+Chrome Trace Event 形式のトレースファイルを書き出す。
+ワーカープロセスで計測したスパンは capture_spans() で集めて結果と一緒に返し、
+親プロセスで adopt_spans() に渡すと同じジョブのスパンとして記録される。
+"""
+import json
+import logging
+import multiprocessing
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class Span:
+    """計測区間"""
+    name: str
+    span_id: int
+    parent_id: Optional[int]
+    thread: str
+    start: float
+    wall_time: float = 0.0
+    cpu_time: float = 0.0
+    child_cpu_time: float = 0.0
+    bytes_in: int = 0
+    bytes_out: int = 0
+    retries: int = 0
+    attributes: Dict[str, Any] = field(default_factory=dict)
+    error: Optional[str] = None
+
+    def add_bytes(self, bytes_in: int = 0, bytes_out: int = 0) -> None:
+        """入出力バイト数を加算"""
+        self.bytes_in += bytes_in
+        self.bytes_out += bytes_out
+
+    def add_retry(self) -> None:
+        """リトライ回数を加算"""
+        self.retries += 1
+
+    def add_child_cpu(self, seconds: float) -> None:
+        """子プロセス（FFmpegなど）のCPU時間を加算"""
+        self.child_cpu_time += seconds
+
+
+class Tracer:
+    """1ジョブ分のスパンを収集するクラス"""
+
+    def __init__(self, job_id: str):
+        self.job_id = job_id
+        self.origin = time.perf_counter()
+        # プロセスをまたいで開始時刻を揃えるための基準（UNIX時刻）
+        self.epoch = time.time()
+        self.spans: List[Span] = []
+        self._lock = threading.Lock()
+        self._next_id = 1
+
+    def _new_span(self, name: str, parent: Optional[Span], attributes: Dict[str, Any]) -> Span:
+        with self._lock:
+            span_id = self._next_id
+            self._next_id += 1
+        return Span(
+            name=name,
+            span_id=span_id,
+            parent_id=parent.span_id if parent else None,
+            thread=threading.current_thread().name,
+            start=time.perf_counter() - self.origin,
+            attributes=attributes,
+        )
+
+    def _record(self, span: Span) -> None:
+        with self._lock:
+            self.spans.append(span)
+
+    def adopt(self, spans: List[Span], parent: Optional[Span]) -> None:
+        """
+        capture_spans() で集めた別プロセスのスパンを parent の子として記録する
+
+        スパンIDは振り直し、開始時刻はこのトレースの基準に合わせる。
+        """
+        ids: Dict[int, int] = {}
+        with self._lock:
+            for span in spans:
+                ids[span.span_id] = self._next_id
+                self._next_id += 1
+        for span in spans:
+            span.span_id = ids[span.span_id]
+            if span.parent_id in ids:
+                span.parent_id = ids[span.parent_id]
+            else:
+                span.parent_id = parent.span_id if parent else None
+            span.start -= self.epoch
+            self._record(span)
+
+    def summary(self) -> Dict[str, Any]:
+        """スパン名ごとの集計"""
+        totals: Dict[str, Dict[str, Any]] = {}
+        with self._lock:
+            spans = list(self.spans)
+
+        for span in spans:
+            total = totals.setdefault(span.name, {
+                "count": 0,
+                "wall_time": 0.0,
+                "cpu_time": 0.0,
+                "child_cpu_time": 0.0,
+                "bytes_in": 0,
+                "bytes_out": 0,
+                "retries": 0,
+                "errors": 0,
+            })
+            total["count"] += 1
+            total["wall_time"] += span.wall_time
+            total["cpu_time"] += span.cpu_time
+            total["child_cpu_time"] += span.child_cpu_time
+            total["bytes_in"] += span.bytes_in
+            total["bytes_out"] += span.bytes_out
+            total["retries"] += span.retries
+            total["errors"] += 1 if span.error else 0
+
+        for total in totals.values():
+            for key in ("wall_time", "cpu_time", "child_cpu_time"):
+                total[key] = round(total[key], 6)
+        return totals
+
+    def write_report(self, path: Path) -> None:
+        """集計と全スパンをJSONで書き出す"""
+        with self._lock:
+            spans = sorted(self.spans, key=lambda s: s.start)
+        report = {
+            "job_id": self.job_id,
+            "wall_time": round(time.perf_counter() - self.origin, 6),
+            "summary": self.summary(),
+            "spans": [asdict(span) for span in spans],
+        }
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(report, f, ensure_ascii=False, indent=2, default=str)
+
+    def write_trace(self, path: Path) -> None:
+        """Chrome Trace Event 形式（chrome://tracing, Perfetto で表示可能）で書き出す"""
+        with self._lock:
+            spans = sorted(self.spans, key=lambda s: s.start)
+
+        thread_ids: Dict[str, int] = {}
+        events = []
+        for span in spans:
+            tid = thread_ids.setdefault(span.thread, len(thread_ids) + 1)
+            events.append({
+                "name": span.name,
+                "ph": "X",
+                "ts": round(span.start * 1_000_000),
+                "dur": round(span.wall_time * 1_000_000),
+                "pid": 1,
+                "tid": tid,
+                "args": {
+                    "cpu_time": span.cpu_time,
+                    "child_cpu_time": span.child_cpu_time,
+                    "bytes_in": span.bytes_in,
+                    "bytes_out": span.bytes_out,
+                    "retries": span.retries,
+                    "error": span.error,
+                    **span.attributes,
+                },
+            })
+        for thread, tid in thread_ids.items():
+            events.append({
+                "name": "thread_name",
+                "ph": "M",
+                "pid": 1,
+                "tid": tid,
+                "args": {"name": thread},
+            })
+
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump({"traceEvents": events, "otherData": {"job_id": self.job_id}}, f, default=str)
+
+
+_current_tracer: ContextVar[Optional[Tracer]] = ContextVar("current_tracer", default=None)
+_current_span: ContextVar[Optional[Span]] = ContextVar("current_span", default=None)
+
+
+@contextmanager
+def trace_job(job_id: str) -> Iterator[Tracer]:
+    """
+    ジョブのトレースを有効化する
+
+    ワーカースレッドへ引き継ぐには contextvars.copy_context() で実行すること。
+    """
+    tracer = Tracer(job_id)
+    token = _current_tracer.set(tracer)
+    try:
+        yield tracer
+    finally:
+        _current_tracer.reset(token)
+
+
+@contextmanager
+def capture_spans() -> Iterator[List[Span]]:
+    """
+    ワーカープロセスで計測したスパンを集める
+
+    ブロックを抜けると、渡したリストに計測したスパンが入る。
+    開始時刻はUNIX時刻で、スレッド名にはプロセス名を付ける（親プロセスで adopt_spans() に渡す）。
+    """
+    tracer = Tracer("")
+    spans: List[Span] = []
+    token = _current_tracer.set(tracer)
+    span_token = _current_span.set(None)
+    try:
+        yield spans
+    finally:
+        _current_span.reset(span_token)
+        _current_tracer.reset(token)
+        process = multiprocessing.current_process().name
+        for captured in tracer.spans:
+            captured.start += tracer.epoch
+            captured.thread = f"{process}/{captured.thread}"
+        spans.extend(tracer.spans)
+
+
+def adopt_spans(spans: List[Span]) -> None:
+    """
+    ワーカープロセスから返されたスパンを現在のスパンの子として記録する
+
+    トップレベルのスパンのCPU時間は、現在のスパンの子プロセスCPU時間にも加算する。
+    トレースが無効な場合は何もしない。
+    """
+    tracer = _current_tracer.get()
+    if tracer is None:
+        return
+    parent = _current_span.get()
+    if parent is not None:
+        captured_ids = {span.span_id for span in spans}
+        parent.add_child_cpu(sum(
+            span.cpu_time for span in spans if span.parent_id not in captured_ids
+        ))
+    tracer.adopt(spans, parent)
+
+
+@contextmanager
+def span(name: str, **attributes: Any) -> Iterator[Span]:
+    """
+    処理区間を計測する
+
+    トレースが無効な場合も Span を返すが、記録はされない。
+
+    Args:
+        name: スパン名（"image.generate_background" など）
+        **attributes: スパンに付与する属性
+    """
+    tracer = _current_tracer.get()
+    parent = _current_span.get()
+    if tracer is None:
+        current = Span(name=name, span_id=0, parent_id=None, thread="", start=0.0, attributes=attributes)
+    else:
+        current = tracer._new_span(name, parent, attributes)
+
+    token = _current_span.set(current)
+    wall_start = time.perf_counter()
+    cpu_start = time.thread_time()
+    try:
+        yield current
+    except BaseException as e:
+        current.error = f"{type(e).__name__}: {e}"
+        raise
+    finally:
+        current.wall_time = time.perf_counter() - wall_start
+        current.cpu_time = time.thread_time() - cpu_start
+        _current_span.reset(token)
+        if tracer is not None:
+            tracer._record(current)
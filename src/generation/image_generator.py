@@ -1,15 +1,19 @@
 """
 DALL-E 3を使用した背景画像生成モジュール
 """
+import contextvars
 import logging
 import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
-from typing import List, Optional
+from typing import Iterator, List, Optional, Tuple
 
 import httpx
 from openai import OpenAI
 
+from src.core.cache import get_artifact_cache
 from src.core.config import get_config, get_project_root
+from src.core.tracing import span
 from src.core.schemas.video_script import Slide, SlideBackground
 
 logger = logging.getLogger(__name__)
@@ -27,6 +31,14 @@ class ImageGenerator:
 
         self.client = OpenAI(api_key=config.openai_api_key)
         self.dalle_config = config.image_generation.dalle
+        self.max_concurrency = config.image_generation.max_concurrency
+        self.cache = get_artifact_cache()
+
+        # 画像ダウンロード用のHTTPクライアント（接続を使い回してTLSハンドシェイクを省く）
+        self.http_client = httpx.Client(
+            timeout=60.0,
+            limits=httpx.Limits(max_keepalive_connections=self.max_concurrency),
+        )
 
     def generate_background(
         self,
@@ -48,35 +60,32 @@ class ImageGenerator:
         # プロンプトの構築
         prompt = self._build_prompt(background)
 
-        logger.info(f"Generating image: {prompt[:100]}...")
-
-        for attempt in range(retry_count):
-            try:
-                # DALL-E 3 APIの呼び出し
-                response = self.client.images.generate(
-                    model=self.dalle_config.model,
-                    prompt=prompt,
-                    size=self.dalle_config.size,
-                    quality=self.dalle_config.quality,
-                    style=self.dalle_config.style,
-                    n=1,
-                )
-
-                # 画像URLを取得
-                image_url = response.data[0].url
-
-                # 画像をダウンロード
-                self._download_image(image_url, output_path)
-
-                logger.info(f"Image saved: {output_path}")
+        with span("image.generate_background", output=output_path.name) as current:
+            # 同じプロンプト・DALL-E設定の画像があれば再利用
+            cache_key = self.cache.make_key(prompt, self.dalle_config.model_dump())
+            if self.cache.get("backgrounds", cache_key, output_path):
+                current.attributes["cache_hit"] = True
+                logger.info(f"Image cache hit: {output_path}")
                 return output_path
 
-            except Exception as e:
-                logger.warning(f"Image generation failed (attempt {attempt + 1}): {e}")
-                if attempt < retry_count - 1:
-                    time.sleep(2 ** attempt)  # Exponential backoff
-                else:
-                    raise
+            logger.info(f"Generating image: {prompt[:100]}...")
+
+            for attempt in range(retry_count):
+                try:
+                    downloaded = self._request_image(prompt, output_path)
+                    current.add_bytes(bytes_in=downloaded, bytes_out=len(prompt.encode("utf-8")))
+                    self.cache.put("backgrounds", cache_key, output_path)
+
+                    logger.info(f"Image saved: {output_path}")
+                    return output_path
+
+                except Exception as e:
+                    logger.warning(f"Image generation failed (attempt {attempt + 1}): {e}")
+                    if attempt < retry_count - 1:
+                        current.add_retry()
+                        time.sleep(2 ** attempt)  # Exponential backoff
+                    else:
+                        raise
 
     def generate_all_backgrounds(
         self,
@@ -93,15 +102,51 @@ class ImageGenerator:
         Returns:
             List[Path]: 生成された画像のパスリスト
         """
-        output_dir.mkdir(parents=True, exist_ok=True)
-        image_paths = []
+        image_paths = {
+            slide.order: image_path
+            for slide, image_path in self.iter_backgrounds(slides, output_dir)
+        }
+        # 完成順ではなくスライド順で返す
+        return [image_paths[slide.order] for slide in slides]
 
-        for slide in slides:
-            output_path = output_dir / f"background_{slide.order:02d}.png"
-            image_path = self.generate_background(slide.background, output_path)
-            image_paths.append(image_path)
+    def iter_backgrounds(
+        self,
+        slides: List[Slide],
+        output_dir: Path,
+    ) -> Iterator[Tuple[Slide, Path]]:
+        """
+        背景画像を並行に生成し、完成したものから順に返す
+
+        同時リクエスト数は image_generation.max_concurrency で制限する。
+        リトライはスライドごとに独立しているため、1枚の遅延が他を待たせない。
+
+        Args:
+            slides: スライドリスト
+            output_dir: 出力ディレクトリ
 
-        return image_paths
+        Yields:
+            Tuple[Slide, Path]: スライドと生成された画像のパス（完成順）
+        """
+        output_dir.mkdir(parents=True, exist_ok=True)
+        max_workers = max(1, min(self.max_concurrency, len(slides)))
+
+        with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="dalle") as executor:
+            futures = {
+                executor.submit(
+                    contextvars.copy_context().run,
+                    self.generate_background,
+                    slide.background,
+                    output_dir / f"background_{slide.order:02d}.png",
+                ): slide
+                for slide in slides
+            }
+            try:
+                for future in as_completed(futures):
+                    yield futures[future], future.result()
+            finally:
+                # 失敗時や呼び出し側が途中で止めた場合は未着手のリクエストを取り消す
+                for future in futures:
+                    future.cancel()
 
     def _build_prompt(self, background: SlideBackground) -> str:
         """DALL-E用のプロンプトを構築"""
@@ -136,15 +181,34 @@ class ImageGenerator:
 
         return full_prompt
 
-    def _download_image(self, url: str, output_path: Path) -> None:
-        """画像をダウンロードして保存"""
-        with httpx.Client(timeout=60.0) as client:
-            response = client.get(url)
-            response.raise_for_status()
-
-            output_path.parent.mkdir(parents=True, exist_ok=True)
-            with open(output_path, "wb") as f:
-                f.write(response.content)
+    def _request_image(self, prompt: str, output_path: Path) -> int:
+        """DALL-E 3 APIで画像を生成してダウンロード（ダウンロードしたバイト数を返す）"""
+        # DALL-E 3 APIの呼び出し
+        response = self.client.images.generate(
+            model=self.dalle_config.model,
+            prompt=prompt,
+            size=self.dalle_config.size,
+            quality=self.dalle_config.quality,
+            style=self.dalle_config.style,
+            n=1,
+        )
+
+        # 画像URLを取得
+        image_url = response.data[0].url
+
+        # 画像をダウンロード
+        return self._download_image(image_url, output_path)
+
+    def _download_image(self, url: str, output_path: Path) -> int:
+        """画像をダウンロードして保存（ダウンロードしたバイト数を返す）"""
+        response = self.http_client.get(url)
+        response.raise_for_status()
+
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+        with open(output_path, "wb") as f:
+            f.write(response.content)
+
+        return len(response.content)
 
 
 def generate_backgrounds(slides: List[Slide], output_dir: Path) -> List[Path]:
@@ -3,22 +3,34 @@ SNS Automation System - メインエントリーポイント
 
 使用方法:
     python -m src.main "動画のテーマ"
+    python -m src.main --resume <JOB_ID>
+    python -m src.main --batch themes.txt --jobs 3
 
 例:
     python -m src.main "売上を2倍にする顧客心理学"
 """
 import argparse
+import contextvars
 import json
 import logging
 import sys
+import threading
 import uuid
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Sequence
 
+from src.batch import BatchRunner, read_themes
+from src.core.cache import get_artifact_cache
+from src.core.checkpoint import JobManifest
 from src.core.config import get_config, get_project_root
+from src.core.pipeline import PhaseGraph
+from src.core.schemas.video_script import Slide, VideoScript
 from src.core.script_generator import ScriptGenerator
+from src.core.tracing import Tracer, span, trace_job
 from src.generation.image_generator import ImageGenerator
-from src.composition.text_renderer import SlideComposer
+from src.composition.text_renderer import SlideComposer, get_font_manager, prewarm_compose_pool
 from src.audio.tts_generator import TTSGenerator
 from src.video.video_composer import VideoComposer
 
@@ -32,25 +44,58 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# フェーズの進捗通知: (フェーズ名, "running" | "completed" | "restored" | "failed")
+ProgressCallback = Callable[[str, str], None]
+
 
 class VideoGenerator:
     """動画生成パイプライン"""
 
-    def __init__(self):
+    def __init__(
+        self,
+        script_generator: Optional[ScriptGenerator] = None,
+        image_generator: Optional[ImageGenerator] = None,
+        tts_generator: Optional[TTSGenerator] = None,
+    ):
+        """
+        Args:
+            script_generator: 台本生成（省略時はGemini）
+            image_generator: 背景画像生成（省略時はDALL-E）
+            tts_generator: 音声生成（省略時はFish Audio）
+        """
         self.config = get_config()
         self.project_root = get_project_root()
 
-        # 各モジュールの初期化
-        self.script_generator = ScriptGenerator()
-        self.image_generator = ImageGenerator()
+        # 各モジュールの初期化（ベンチマーク等では外部API部分を差し替え可能）
+        self.script_generator = script_generator or ScriptGenerator()
+        self.image_generator = image_generator or ImageGenerator()
         self.slide_composer = SlideComposer()
-        self.tts_generator = TTSGenerator()
+        self.tts_generator = tts_generator or TTSGenerator()
         self.video_composer = VideoComposer()
 
+        # レンダリングプロファイルごとの動画合成（プロファイルなしは既定の video 設定）
+        self._video_composers: Dict[Optional[str], VideoComposer] = {None: self.video_composer}
+        self._video_composers_lock = threading.Lock()
+
+    def prewarm(self) -> None:
+        """
+        初回リクエストの前に重い初期化を済ませておく
+
+        フォントの読み込みとキャッシュの初期化、スライド合成プロセスの起動を行う。
+        APIクライアントとHTTP接続プールは __init__ で作成済み。
+        """
+        get_font_manager().preload()
+        get_artifact_cache()
+        if self.config.pipeline.compose_processes > 0:
+            prewarm_compose_pool(self.config.pipeline.compose_processes)
+        logger.info("VideoGenerator prewarmed")
+
     def generate(
         self,
         theme: str,
         output_name: str = None,
+        progress: Optional[ProgressCallback] = None,
+        profile: Optional[str] = None,
     ) -> Path:
         """
         テーマから動画を生成する
@@ -58,10 +103,15 @@ class VideoGenerator:
         Args:
             theme: 動画のテーマ
             output_name: 出力ファイル名（省略時は自動生成）
+            progress: フェーズの状態変化ごとに (フェーズ名, 状態) で呼ばれるコールバック
+            profile: レンダリングプロファイル名（"draft", "final" など、省略時は video 設定のまま）
 
         Returns:
             Path: 生成された動画のパス
         """
+        # 不明なプロファイルは何も生成する前にエラーにする
+        self.get_video_composer(profile)
+
         # 出力ディレクトリの準備
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         job_id = str(uuid.uuid4())[:8]
@@ -72,83 +122,438 @@ class VideoGenerator:
         output_dir = self.project_root / self.config.output.directory / output_name
         output_dir.mkdir(parents=True, exist_ok=True)
 
+        # 既存のマニフェストを置き換えるとチェックポイントが失われるので、その旨を残す
+        if JobManifest.exists(output_dir):
+            logger.warning(
+                f"Overwriting existing manifest for job {output_name}; "
+                f"completed phases will be regenerated (use resume() to continue it)"
+            )
+
+        # 出力名をジョブIDとしてマニフェストに記録（resume() で再開する際に使用）
+        manifest = JobManifest.create(output_dir, output_name, theme, profile)
+
         logger.info(f"=== Starting video generation ===")
         logger.info(f"Theme: {theme}")
+        if profile:
+            logger.info(f"Render profile: {profile}")
+        logger.info(f"Job ID: {output_name}")
         logger.info(f"Output directory: {output_dir}")
 
+        return self._run(manifest, output_name, progress)
+
+    def resume(self, job_id: str, progress: Optional[ProgressCallback] = None) -> Path:
+        """
+        中断したジョブを最初の未完了フェーズから再開する
+
+        Args:
+            job_id: ジョブID（出力ディレクトリ名）
+            progress: フェーズの状態変化ごとに (フェーズ名, 状態) で呼ばれるコールバック
+
+        Returns:
+            Path: 生成された動画のパス
+        """
+        output_dir = self.project_root / self.config.output.directory / job_id
+        try:
+            manifest = JobManifest.load(output_dir)
+        except FileNotFoundError:
+            raise ValueError(f"No resumable job found: {job_id}")
+
+        completed = [name for name in manifest.data["phases"] if manifest.is_complete(name)]
+
+        logger.info(f"=== Resuming video generation ===")
+        logger.info(f"Theme: {manifest.theme}")
+        logger.info(f"Job ID: {job_id}")
+        logger.info(f"Completed phases: {', '.join(completed) or 'none'}")
+
+        return self._run(manifest, job_id, progress)
+
+    def can_resume(self, job_id: str, theme: str, profile: Optional[str] = None) -> bool:
+        """
+        同じテーマ・プロファイルで中断したジョブのマニフェストが残っているか
+
+        Args:
+            job_id: ジョブID（出力ディレクトリ名）
+            theme: 動画のテーマ
+            profile: レンダリングプロファイル名
+        """
+        output_dir = self.project_root / self.config.output.directory / job_id
+        if not JobManifest.exists(output_dir):
+            return False
         try:
-            # Phase 1: 台本生成
-            logger.info("Phase 1: Generating script...")
-            script = self.script_generator.generate(theme)
-
-            # 台本をJSONとして保存
-            script_path = output_dir / "script.json"
-            with open(script_path, "w", encoding="utf-8") as f:
-                json.dump(script.model_dump(), f, ensure_ascii=False, indent=2, default=str)
-            logger.info(f"Script saved: {script_path}")
-            logger.info(f"Title: {script.title}")
-            logger.info(f"Total duration: {script.total_duration:.1f}s")
-            logger.info(f"Slides: {len(script.slides)}")
-
-            # Phase 2: 背景画像生成
-            logger.info("Phase 2: Generating background images...")
-            backgrounds_dir = output_dir / "backgrounds"
-            background_paths = self.image_generator.generate_all_backgrounds(
-                script.slides,
-                backgrounds_dir,
-            )
-            logger.info(f"Generated {len(background_paths)} background images")
+            manifest = JobManifest.load(output_dir)
+            return manifest.theme == theme and manifest.profile == profile
+        except (OSError, ValueError, KeyError) as e:
+            logger.warning(f"Ignoring unreadable manifest for job {job_id}: {e}")
+            return False
 
-            # Phase 3: スライド合成（テキストオーバーレイ）
-            logger.info("Phase 3: Composing slides...")
-            slides_dir = output_dir / "slides"
-            slide_paths = self.slide_composer.compose_all_slides(
-                background_paths,
-                script.slides,
-                slides_dir,
+    def get_video_composer(self, profile: Optional[str] = None) -> VideoComposer:
+        """
+        レンダリングプロファイルに対応する動画合成を取得（プロファイルごとに1つを使い回す）
+
+        Raises:
+            ValueError: 不明なプロファイル名の場合
+        """
+        with self._video_composers_lock:
+            if profile not in self._video_composers:
+                self._video_composers[profile] = VideoComposer(profile)
+            return self._video_composers[profile]
+
+    def _run(
+        self,
+        manifest: JobManifest,
+        output_name: str,
+        progress: Optional[ProgressCallback] = None,
+    ) -> Path:
+        """フェーズ依存グラフを構築して実行"""
+        with trace_job(output_name) as tracer:
+            try:
+                graph = self._build_graph(manifest, output_name, progress)
+                results = graph.run()
+                video_path = results["video"]
+
+                logger.info(f"=== Video generation complete ===")
+                logger.info(f"Output: {video_path}")
+
+                return video_path
+
+            except Exception as e:
+                logger.error(f"Video generation failed: {e}")
+                raise
+
+            finally:
+                # 失敗時もどこで時間がかかったか分かるよう計測結果を書き出す
+                self._write_timings(tracer, manifest.output_dir)
+
+    def _write_timings(self, tracer: Tracer, output_dir: Path) -> None:
+        """計測結果を timings.json（とトレースファイル）に書き出す"""
+        tracing_config = self.config.tracing
+        if not tracing_config.enabled:
+            return
+        try:
+            timings_path = output_dir / "timings.json"
+            tracer.write_report(timings_path)
+            logger.info(f"Timings saved: {timings_path}")
+            if tracing_config.export_trace:
+                trace_path = output_dir / tracing_config.trace_file
+                tracer.write_trace(trace_path)
+                logger.info(f"Trace saved: {trace_path}")
+        except OSError as e:
+            logger.warning(f"Failed to write timings: {e}")
+
+    def _build_graph(
+        self,
+        manifest: JobManifest,
+        output_name: str,
+        progress: Optional[ProgressCallback] = None,
+    ) -> PhaseGraph:
+        """
+        パイプラインのフェーズ依存グラフを構築する
+
+        Phase 2（背景画像）とPhase 4（音声）はどちらも台本のみに依存するため並行実行される。
+        マニフェストで完了済みのフェーズは再実行せず、記録された生成物から結果を復元する。
+        """
+        theme = manifest.theme
+        output_dir = manifest.output_dir
+        video_composer = self.get_video_composer(manifest.profile)
+
+        graph = PhaseGraph()
+        self._add_phase(
+            graph, manifest, progress, "script",
+            lambda: self._generate_script(theme, output_dir),
+            artifacts=lambda script: [output_dir / "script.json"],
+            restore=lambda paths: VideoScript.model_validate_json(
+                paths[0].read_text(encoding="utf-8")
+            ),
+        )
+        self._add_phase(
+            graph, manifest, progress, "narration",
+            lambda script: self._generate_narration(script, output_dir),
+            depends_on=["script"],
+        )
+
+        if self.config.pipeline.streaming:
+            # 背景が届いたスライドから順に合成・エンコードする
+            self._add_phase(
+                graph, manifest, progress, "segments",
+                lambda script: self._stream_slides(script, output_dir, output_name, video_composer),
+                depends_on=["script"],
+                artifacts=list,
+                restore=list,
+            )
+            self._add_phase(
+                graph, manifest, progress, "video",
+                lambda script, segments, narration: self._compose_video_from_segments(
+                    script, segments, narration, output_dir, output_name, video_composer,
+                ),
+                depends_on=["script", "segments", "narration"],
+                artifacts=lambda video_path: [video_path, output_dir / "caption.txt"],
+            )
+        else:
+            self._add_phase(
+                graph, manifest, progress, "backgrounds",
+                lambda script: self._generate_backgrounds(script, output_dir),
+                depends_on=["script"],
+                artifacts=list,
+                restore=list,
+            )
+            self._add_phase(
+                graph, manifest, progress, "slides",
+                lambda script, backgrounds: self._compose_slides(script, backgrounds, output_dir),
+                depends_on=["script", "backgrounds"],
+                artifacts=list,
+                restore=list,
             )
-            logger.info(f"Composed {len(slide_paths)} slides")
-
-            # Phase 4: 音声生成
-            logger.info("Phase 4: Generating narration...")
-            audio_path = output_dir / "narration.mp3"
-            self.tts_generator.generate_narration(
-                script.audio.narration_text,
-                audio_path,
+            self._add_phase(
+                graph, manifest, progress, "video",
+                lambda script, slides, narration: self._compose_video(
+                    script, slides, narration, output_dir, output_name, video_composer,
+                ),
+                depends_on=["script", "slides", "narration"],
+                artifacts=lambda video_path: [video_path, output_dir / "caption.txt"],
             )
-            logger.info(f"Narration saved: {audio_path}")
 
-            # Phase 5: 動画合成
-            logger.info("Phase 5: Composing video...")
-            video_path = output_dir / f"{output_name}.mp4"
+        return graph
 
-            # BGMがあれば使用
-            bgm_dir = self.project_root / self.config.audio.bgm.directory
-            bgm_files = list(bgm_dir.glob("*.mp3")) + list(bgm_dir.glob("*.wav"))
-            bgm_path = bgm_files[0] if bgm_files else None
+    def _add_phase(
+        self,
+        graph: PhaseGraph,
+        manifest: JobManifest,
+        progress: Optional[ProgressCallback],
+        name: str,
+        func: Callable[..., Any],
+        depends_on: Sequence[str] = (),
+        artifacts: Callable[[Any], List[Path]] = lambda path: [path],
+        restore: Callable[[List[Path]], Any] = lambda paths: paths[0],
+    ) -> None:
+        """
+        完了時にチェックポイントを記録するフェーズを追加する
 
-            self.video_composer.compose_video(
-                slide_paths,
+        Args:
+            graph: 追加先のグラフ
+            manifest: ジョブのマニフェスト
+            progress: 進捗コールバック（省略可）
+            name: フェーズ名
+            func: フェーズの処理
+            depends_on: 依存するフェーズ名のリスト
+            artifacts: フェーズの結果から生成物のパスリストを得る関数
+            restore: 生成物のパスリストからフェーズの結果を復元する関数
+        """
+        def notify(status: str) -> None:
+            if progress is None:
+                return
+            try:
+                progress(name, status)
+            except Exception as e:
+                logger.warning(f"Progress callback failed: {e}")
+
+        def run(**kwargs):
+            notify("running")
+            try:
+                with span(f"phase.{name}"):
+                    result = func(**kwargs)
+            except Exception:
+                notify("failed")
+                raise
+            manifest.mark_complete(name, artifacts(result))
+            notify("completed")
+            return result
+
+        restore_from_checkpoint = None
+        if manifest.is_complete(name):
+            logger.info(f"Phase '{name}' already completed, restoring from checkpoint")
+
+            def restore_from_checkpoint():
+                result = restore(manifest.artifacts(name))
+                notify("restored")
+                return result
+
+        graph.add_phase(name, run, depends_on, restore=restore_from_checkpoint)
+
+    def _generate_script(self, theme: str, output_dir: Path) -> VideoScript:
+        """Phase 1: 台本生成"""
+        logger.info("Phase 1: Generating script...")
+        script = self.script_generator.generate(theme)
+
+        # 台本をJSONとして保存
+        script_path = output_dir / "script.json"
+        with open(script_path, "w", encoding="utf-8") as f:
+            json.dump(script.model_dump(), f, ensure_ascii=False, indent=2, default=str)
+        logger.info(f"Script saved: {script_path}")
+        logger.info(f"Title: {script.title}")
+        logger.info(f"Total duration: {script.total_duration:.1f}s")
+        logger.info(f"Slides: {len(script.slides)}")
+
+        return script
+
+    def _generate_backgrounds(self, script: VideoScript, output_dir: Path) -> List[Path]:
+        """Phase 2: 背景画像生成"""
+        logger.info("Phase 2: Generating background images...")
+        backgrounds_dir = output_dir / "backgrounds"
+        background_paths = self.image_generator.generate_all_backgrounds(
+            script.slides,
+            backgrounds_dir,
+        )
+        logger.info(f"Generated {len(background_paths)} background images")
+        return background_paths
+
+    def _compose_slides(
+        self,
+        script: VideoScript,
+        background_paths: List[Path],
+        output_dir: Path,
+    ) -> List[Path]:
+        """Phase 3: スライド合成（テキストオーバーレイ）"""
+        logger.info("Phase 3: Composing slides...")
+        slides_dir = output_dir / "slides"
+        slide_paths = self.slide_composer.compose_all_slides(
+            background_paths,
+            script.slides,
+            slides_dir,
+        )
+        # サムネイル（アニメーションするテキストも含めた1枚目）
+        self.slide_composer.save_thumbnail(
+            background_paths[0], script.slides[0], output_dir / "thumbnail.png",
+        )
+        logger.info(f"Composed {len(slide_paths)} slides")
+        return slide_paths
+
+    def _generate_narration(self, script: VideoScript, output_dir: Path) -> Path:
+        """Phase 4: 音声生成"""
+        logger.info("Phase 4: Generating narration...")
+        audio_path = output_dir / "narration.mp3"
+        self.tts_generator.generate_narration(
+            script.audio.narration_text,
+            audio_path,
+        )
+        logger.info(f"Narration saved: {audio_path}")
+        return audio_path
+
+    def _stream_slides(
+        self,
+        script: VideoScript,
+        output_dir: Path,
+        output_name: str,
+        video_composer: VideoComposer,
+    ) -> List[Path]:
+        """Phase 2〜3: 背景画像生成 → スライド合成 → スライド動画化をスライド単位で流す"""
+        logger.info("Phase 2-3: Streaming slides (background -> compose -> encode)...")
+        backgrounds_dir = output_dir / "backgrounds"
+        slides_dir = output_dir / "slides"
+        slides_dir.mkdir(parents=True, exist_ok=True)
+        temp_dir = video_composer.get_temp_dir(output_dir / f"{output_name}.mp4")
+
+        # 合成・エンコードは別スレッドで行い、その間に次のスライドの背景画像を生成する
+        # （同時エンコード数はFFmpegのスレッド予算に合わせる）
+        futures = {}
+        with ThreadPoolExecutor(
+            max_workers=video_composer.max_parallel_encodes,
+            thread_name_prefix="slide",
+        ) as executor:
+            for slide, background_path in self.image_generator.iter_backgrounds(
                 script.slides,
-                audio_path,
-                video_path,
-                bgm_path,
-            )
+                backgrounds_dir,
+            ):
+                futures[slide.order] = executor.submit(
+                    contextvars.copy_context().run,
+                    self._compose_and_encode_slide,
+                    slide,
+                    background_path,
+                    slides_dir,
+                    temp_dir,
+                    video_composer,
+                )
+            segment_paths = [futures[slide.order].result() for slide in script.slides]
+
+        logger.info(f"Encoded {len(segment_paths)} slide segments")
+        return segment_paths
+
+    def _compose_and_encode_slide(
+        self,
+        slide: Slide,
+        background_path: Path,
+        slides_dir: Path,
+        temp_dir: Path,
+        video_composer: VideoComposer,
+    ) -> Path:
+        """1枚のスライドを合成して動画化（画像はPNGを経由せずFFmpegに渡す）"""
+        with span("slide.compose", order=slide.order):
+            image = self.slide_composer.render_slide(background_path, slide)
 
-            # キャプションを保存
-            caption_path = output_dir / "caption.txt"
-            with open(caption_path, "w", encoding="utf-8") as f:
-                f.write(script.caption.full_caption())
-            logger.info(f"Caption saved: {caption_path}")
+        # サムネイルは1枚目から（アニメーションするテキストも含めて）作成
+        if slide.order == 1:
+            self.slide_composer.save_thumbnail(background_path, slide, slides_dir.parent / "thumbnail.png")
 
-            logger.info(f"=== Video generation complete ===")
-            logger.info(f"Output: {video_path}")
+        # スライドのPNGはデバッグ用に残す設定の場合だけ保存
+        if self.config.output.keep_slide_images:
+            image.save(slides_dir / f"slide_{slide.order:02d}.png", "PNG")
 
-            return video_path
+        return video_composer.encode_slide(
+            image,
+            slide,
+            temp_dir / f"slide_{slide.order:02d}.mp4",
+        )
 
-        except Exception as e:
-            logger.error(f"Video generation failed: {e}")
-            raise
+    def _compose_video(
+        self,
+        script: VideoScript,
+        slide_paths: List[Path],
+        audio_path: Path,
+        output_dir: Path,
+        output_name: str,
+        video_composer: VideoComposer,
+    ) -> Path:
+        """Phase 5: 動画合成"""
+        logger.info("Phase 5: Composing video...")
+        video_path = output_dir / f"{output_name}.mp4"
+
+        video_composer.compose_video(
+            slide_paths,
+            script.slides,
+            audio_path,
+            video_path,
+            self._find_bgm(),
+        )
+        self._save_caption(script, output_dir)
+
+        return video_path
+
+    def _compose_video_from_segments(
+        self,
+        script: VideoScript,
+        segment_paths: List[Path],
+        audio_path: Path,
+        output_dir: Path,
+        output_name: str,
+        video_composer: VideoComposer,
+    ) -> Path:
+        """Phase 5: エンコード済みスライド動画から動画合成（ストリーミング時）"""
+        logger.info("Phase 5: Composing video from slide segments...")
+        video_path = output_dir / f"{output_name}.mp4"
+
+        video_composer.compose_from_segments(
+            segment_paths,
+            audio_path,
+            video_path,
+            self._find_bgm(),
+            slides=script.slides,
+        )
+        self._save_caption(script, output_dir)
+
+        return video_path
+
+    def _find_bgm(self) -> Optional[Path]:
+        """BGMがあれば使用"""
+        bgm_dir = self.project_root / self.config.audio.bgm.directory
+        bgm_files = list(bgm_dir.glob("*.mp3")) + list(bgm_dir.glob("*.wav"))
+        return bgm_files[0] if bgm_files else None
+
+    def _save_caption(self, script: VideoScript, output_dir: Path) -> Path:
+        """キャプションを保存"""
+        caption_path = output_dir / "caption.txt"
+        with open(caption_path, "w", encoding="utf-8") as f:
+            f.write(script.caption.full_caption())
+        logger.info(f"Caption saved: {caption_path}")
+        return caption_path
 
 
 def main():
@@ -159,6 +564,7 @@ def main():
     parser.add_argument(
         "theme",
         type=str,
+        nargs="?",
         help="動画のテーマ（例: '売上を2倍にする顧客心理学'）",
     )
     parser.add_argument(
@@ -167,6 +573,32 @@ def main():
         default=None,
         help="出力ファイル名（省略時は自動生成）",
     )
+    parser.add_argument(
+        "--resume",
+        type=str,
+        default=None,
+        metavar="JOB_ID",
+        help="中断したジョブを再開（JOB_IDは出力ディレクトリ名）",
+    )
+    parser.add_argument(
+        "--batch",
+        type=str,
+        default=None,
+        metavar="FILE",
+        help="テーマファイル（1行1テーマ）の全テーマを一括生成",
+    )
+    parser.add_argument(
+        "-j", "--jobs",
+        type=int,
+        default=2,
+        help="一括生成時の同時実行ジョブ数（デフォルト: 2）",
+    )
+    parser.add_argument(
+        "--profile",
+        type=str,
+        default=None,
+        help="レンダリングプロファイル（例: draft で低解像度の下書き、final で投稿用）",
+    )
     parser.add_argument(
         "-v", "--verbose",
         action="store_true",
@@ -175,12 +607,30 @@ def main():
 
     args = parser.parse_args()
 
+    if not args.theme and not args.resume and not args.batch:
+        parser.error("theme, --resume or --batch is required")
+
     if args.verbose:
         logging.getLogger().setLevel(logging.DEBUG)
 
     try:
         generator = VideoGenerator()
-        video_path = generator.generate(args.theme, args.output)
+        if args.batch:
+            themes = read_themes(Path(args.batch))
+            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+            summary_path = (
+                generator.project_root / generator.config.output.directory
+                / f"batch_{timestamp}.json"
+            )
+            results = BatchRunner(generator, args.jobs, args.profile).run(themes, summary_path)
+            failed = [result for result in results if result["status"] != "completed"]
+            print(f"\n[BATCH] {len(results) - len(failed)}/{len(results)} videos generated: {summary_path}")
+            return 1 if failed else 0
+
+        if args.resume:
+            video_path = generator.resume(args.resume)
+        else:
+            video_path = generator.generate(args.theme, args.output, profile=args.profile)
         print(f"\n[SUCCESS] Video generated: {video_path}")
         return 0
     except Exception as e:
@@ -1,7 +1,18 @@
 """Video composition module"""
+from .ffmpeg_budget import FFmpegBudget, get_ffmpeg_budget
+from .frame_renderer import FrameRenderer, TimelineSlide, get_render_pool
+from .ken_burns import KenBurnsEffect
+from .text_animation import TextAnimator
 from .video_composer import VideoComposer, compose_video
 
 __all__ = [
+    "FFmpegBudget",
+    "get_ffmpeg_budget",
+    "FrameRenderer",
+    "TimelineSlide",
+    "get_render_pool",
+    "KenBurnsEffect",
+    "TextAnimator",
     "VideoComposer",
     "compose_video",
 ]
@@ -0,0 +1,93 @@
+"""
+FFmpegのCPUスレッド予算
+
+プロセス全体（サーバーで並行する複数ジョブを含む）で使うFFmpegのスレッド数を
+CPUコア数までに制限する。各FFmpegプロセスは起動前に必要なスレッド数を予約し、
+予算が空くまで待つ。予約は到着順に割り当て、多くのスレッドを待っている予約を
+後から来た小さな予約が追い越さないようにする。エンコードは1プロセスあたりのスレッド数を固定し、
+libx264 やフィルターグラフが各自でコア数分のスレッドを立てて奪い合うのを防ぐ。
+"""
+import os
+import threading
+from collections import deque
+from contextlib import contextmanager
+from typing import Deque, Iterator, Optional
+
+from src.core.config import get_config
+
+
+class FFmpegBudget:
+    """FFmpegプロセスに割り当てるスレッド数の予算"""
+
+    def __init__(self, total_threads: int, threads_per_encode: int):
+        """
+        Args:
+            total_threads: プロセス全体で使えるスレッド数
+            threads_per_encode: エンコード1プロセスあたりのスレッド数
+        """
+        self.total_threads = max(total_threads, 1)
+        self.threads_per_encode = min(max(threads_per_encode, 1), self.total_threads)
+        self._available = self.total_threads
+        self._condition = threading.Condition()
+        # 予約を待っている順番（先頭の予約だけがスレッドを受け取れる）
+        self._waiting: Deque[object] = deque()
+
+    @property
+    def max_parallel_encodes(self) -> int:
+        """同時に実行できるエンコード数"""
+        return max(self.total_threads // self.threads_per_encode, 1)
+
+    @contextmanager
+    def reserve(self, threads: Optional[int] = None) -> Iterator[int]:
+        """
+        スレッドを予約する（空きがなければ待つ）
+
+        予約は到着順に割り当てる。先に待っている予約があれば、空きがあっても順番を待つ。
+
+        Args:
+            threads: 予約するスレッド数（省略時はエンコード1プロセス分）
+
+        Yields:
+            int: 予約したスレッド数（FFmpegの -threads と -filter_threads / -filter_complex_threads に渡す）
+        """
+        threads = min(max(threads or self.threads_per_encode, 1), self.total_threads)
+        ticket = object()
+        with self._condition:
+            self._waiting.append(ticket)
+            try:
+                self._condition.wait_for(
+                    lambda: self._waiting[0] is ticket and self._available >= threads
+                )
+            except BaseException:
+                # 待機中に中断された場合は順番を抜け、後ろの予約を先に進める
+                self._waiting.remove(ticket)
+                self._condition.notify_all()
+                raise
+            self._waiting.popleft()
+            self._available -= threads
+            # 次の予約も空きがあればすぐに受け取れるようにする
+            self._condition.notify_all()
+        try:
+            yield threads
+        finally:
+            with self._condition:
+                self._available += threads
+                self._condition.notify_all()
+
+
+# シングルトンインスタンス
+_budget: Optional[FFmpegBudget] = None
+_budget_lock = threading.Lock()
+
+
+def get_ffmpeg_budget() -> FFmpegBudget:
+    """FFmpegのスレッド予算を取得（シングルトン）"""
+    global _budget
+    with _budget_lock:
+        if _budget is None:
+            video_config = get_config().video
+            _budget = FFmpegBudget(
+                total_threads=video_config.ffmpeg_threads or os.cpu_count() or 1,
+                threads_per_encode=video_config.threads_per_encode,
+            )
+    return _budget
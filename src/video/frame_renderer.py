@@ -0,0 +1,424 @@
+"""
+フレーム合成レンダラー（video.renderer: "numpy"）
+
+FFmpegのフィルターを使わず、出力の全フレームをPythonで生成して
+rawvideo として1つのエンコーダーに流す。
+
+- Ken Burns: KenBurnsEffect.viewport の表示範囲をアフィン変換（バイリニア）で切り出す
+- テキスト: アニメーションするテキストのスプライトを TextAnimator.frame_state に従って重ねる
+- トランジション: スライドの境界の前後 transition_duration/2 秒ずつをクロスフェードする
+
+フレームはスライドごとに一定数の範囲に分けてプロセスプールで並列に生成し、順番どおりに流す。
+切り出し用に縮小したスライド画像とテキストのスプライトは各プロセスで保持し、範囲をまたいで使い回す。
+"""
+import atexit
+import bisect
+import multiprocessing
+import os
+import threading
+import uuid
+from collections import OrderedDict, deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Deque, Dict, Iterator, List, Optional, Sequence, Tuple, Union
+
+import numpy as np
+from PIL import Image
+
+from src.core.config import Config, get_config, set_config
+from src.core.schemas.video_script import Slide, TextElement
+from src.video.ken_burns import KenBurnsEffect
+from src.video.text_animation import TextAnimator
+
+# 保持する切り出し用のスライド画像の数（クロスフェード中の前後のスライドを含む）
+MAX_CACHED_SOURCES = 3
+
+# 保持するテキストのスプライトの数（超えたら捨てて作り直す）
+MAX_CACHED_SPRITES = 64
+
+
+@dataclass
+class TimelineSlide:
+    """タイムライン上の1枚のスライド"""
+    # アニメーションしないテキストを合成済みのスライド画像
+    source: Union[Path, Image.Image]
+    slide: Slide
+    start_frame: int
+    frame_count: int
+    # 切り出し用の画像をキャッシュするためのキー（タイムラインの作成ごとに一意）
+    key: str = field(default_factory=lambda: uuid.uuid4().hex)
+
+
+class FrameRenderer:
+    """スライドのタイムラインから動画のフレームを生成するクラス"""
+
+    def __init__(
+        self,
+        width: int,
+        height: int,
+        fps: int,
+        ken_burns: KenBurnsEffect,
+        text_animation_duration: float = 0.4,
+        transition_duration: float = 0.0,
+    ):
+        """
+        Args:
+            width: 出力の幅
+            height: 出力の高さ
+            fps: フレームレート
+            ken_burns: スライドの動き
+            text_animation_duration: テキストのアニメーション1回の長さ（秒）
+            transition_duration: スライド間のクロスフェードの長さ（秒、0で無効）
+        """
+        self.width = width
+        self.height = height
+        self.fps = fps
+        self.ken_burns = ken_burns
+        self.text_animation_duration = text_animation_duration
+        self.transition_duration = transition_duration
+        self.text_animator = TextAnimator(width, height, fps, text_animation_duration)
+        # ワーカープロセスで同じレンダラーを見分けるためのID（送り直しても変わらない）
+        self.token = uuid.uuid4().hex
+        # 切り出し用に読み込んだスライド画像（TimelineSlide.key ごと、新しい順に MAX_CACHED_SOURCES 個）
+        self._sources: "OrderedDict[str, Image.Image]" = OrderedDict()
+        self._sources_lock = threading.Lock()
+        # 出力解像度に拡縮したテキストのスプライト（要素ごと）
+        self._sprites: Dict[str, Tuple[np.ndarray, float, float]] = {}
+
+    def __getstate__(self):
+        # ワーカープロセスにはフォントなどを持つ TextAnimator とキャッシュを送らず、受け取った側で作り直す
+        state = self.__dict__.copy()
+        del state["text_animator"]
+        del state["_sources_lock"]
+        state["_sources"] = OrderedDict()
+        state["_sprites"] = {}
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._sources_lock = threading.Lock()
+        self.text_animator = TextAnimator(
+            self.width, self.height, self.fps, self.text_animation_duration,
+        )
+
+    def build_timeline(
+        self,
+        sources: Sequence[Union[Path, Image.Image]],
+        slides: Sequence[Slide],
+    ) -> List[TimelineSlide]:
+        """スライド画像とスライド情報からタイムラインを作成"""
+        timeline = []
+        start = 0
+        for source, slide in zip(sources, slides):
+            count = self.ken_burns.frame_count(slide)
+            timeline.append(TimelineSlide(source, slide, start, count))
+            start += count
+        return timeline
+
+    @staticmethod
+    def total_frames(timeline: Sequence[TimelineSlide]) -> int:
+        """タイムライン全体のフレーム数"""
+        return timeline[-1].start_frame + timeline[-1].frame_count if timeline else 0
+
+    def iter_frames(
+        self,
+        timeline: List[TimelineSlide],
+        parallel: bool = False,
+        chunk_frames: Optional[int] = None,
+    ) -> Iterator[bytes]:
+        """
+        全フレームを rgb24 のバイト列として順番に返す（chunk_frames フレームずつ）
+
+        範囲はスライドの境界で区切るため、1つの範囲で使うスライド画像は
+        そのスライドとクロスフェードする前後のスライドだけになる。
+
+        Args:
+            timeline: タイムライン
+            parallel: True ならプロセスプール（video.render_processes のプロセス数）で生成する。
+                False またはプロセス数が1ならこのプロセスで生成
+            chunk_frames: 1回に生成するフレーム数（省略時は1秒分）
+        """
+        chunk = chunk_frames or self.fps
+        ranges = [
+            (index, start, min(start + chunk, item.start_frame + item.frame_count))
+            for index, item in enumerate(timeline)
+            for start in range(item.start_frame, item.start_frame + item.frame_count, chunk)
+        ]
+
+        processes = render_process_count() if parallel else 1
+        if processes <= 1:
+            for _, start, end in ranges:
+                yield self.render_range(timeline, start, end)
+            return
+
+        # 先読みは（並行する他のスライドのエンコードも含めて）プロセス数×2 範囲まで
+        # （生成済みフレームでメモリがあふれないように）。ワーカーにはその範囲で使う前後のスライドだけを送る
+        pool = get_render_pool()
+        slots = _render_slots
+        pending: Deque[Future] = deque()
+        try:
+            for index, start, end in ranges:
+                # 空きがなければ自分の先読み分を先に流す（先読みがないときだけ他の呼び出しを待つ）
+                while not slots.acquire(blocking=not pending):
+                    yield _next_result(pending, slots)
+                neighbours = timeline[max(index - 1, 0):index + 2]
+                pending.append(pool.submit(_render_in_worker, self, neighbours, start, end))
+            while pending:
+                yield _next_result(pending, slots)
+        finally:
+            # 途中で止めた場合（エンコーダーの失敗など）は残りを取り消して枠を返す
+            for future in pending:
+                future.cancel()
+                slots.release()
+
+    def render_range(self, timeline: List[TimelineSlide], start: int, end: int) -> bytes:
+        """
+        フレーム番号 start〜end-1 を生成して rgb24 のバイト列で返す
+
+        timeline はその範囲のスライドと前後のスライドを含む一部分でもよい。
+        """
+        starts = [item.start_frame for item in timeline]
+        frames = []
+        for frame in range(start, end):
+            frames.append(self._render_frame(timeline, starts, frame).tobytes())
+        return b"".join(frames)
+
+    def _render_frame(
+        self,
+        timeline: List[TimelineSlide],
+        starts: List[int],
+        frame: int,
+    ) -> np.ndarray:
+        """タイムライン上の1フレームを生成（トランジション込み）"""
+        index = bisect.bisect_right(starts, frame) - 1
+        item = timeline[index]
+        local = frame - item.start_frame
+        result = self._render_slide_frame(timeline, index, local)
+
+        half = int(round(self.transition_duration * self.fps / 2))
+        if half <= 0:
+            return result
+
+        if index > 0 and local < half:
+            # 前のスライドとの境界の直後（前のスライドは最後の状態のまま続ける）
+            previous = timeline[index - 1]
+            weight = (half + local + 0.5) / (2 * half)
+            before = self._render_slide_frame(timeline, index - 1, local + previous.frame_count)
+            result = _blend(before, result, weight)
+        elif index + 1 < len(timeline) and local >= item.frame_count - half:
+            # 次のスライドとの境界の直前（次のスライドは最初の状態で始める）
+            weight = (local - (item.frame_count - half) + 0.5) / (2 * half)
+            after = self._render_slide_frame(timeline, index + 1, local - item.frame_count)
+            result = _blend(result, after, weight)
+        return result
+
+    def _render_slide_frame(
+        self,
+        timeline: List[TimelineSlide],
+        index: int,
+        local: int,
+    ) -> np.ndarray:
+        """スライド内のフレーム番号 local のフレームを生成（範囲外は最初・最後の状態）"""
+        item = timeline[index]
+        source = self._source(item)
+
+        zoom, pan_x, pan_y = self.ken_burns.viewport(item.slide, local)
+        if zoom == 1.0 and source.size == (self.width, self.height):
+            frame = np.asarray(source)
+        else:
+            view_width = source.width / zoom
+            view_height = source.height / zoom
+            left = (source.width - view_width) * pan_x
+            top = (source.height - view_height) * pan_y
+            frame = np.asarray(source.transform(
+                (self.width, self.height),
+                Image.AFFINE,
+                (view_width / self.width, 0, left, 0, view_height / self.height, top),
+                resample=Image.BILINEAR,
+            ))
+
+        return self._composite_text(frame, item.slide, local / self.fps)
+
+    def _source(self, item: TimelineSlide) -> Image.Image:
+        """切り出し用のスライド画像を取得（読み込み・縮小は範囲をまたいで1回だけ）"""
+        with self._sources_lock:
+            source = self._sources.get(item.key)
+            if source is not None:
+                self._sources.move_to_end(item.key)
+                return source
+
+        # 同時に2回作っても結果は同じなので、作成中はロックしない
+        source = self._prepare_source(item)
+        with self._sources_lock:
+            self._sources[item.key] = source
+            while len(self._sources) > MAX_CACHED_SOURCES:
+                self._sources.popitem(last=False)
+        return source
+
+    def _prepare_source(self, item: TimelineSlide) -> Image.Image:
+        """
+        スライド画像を読み込み、切り出しに必要な解像度にしておく
+
+        ズームする場合は 出力解像度×最大ズーム率 まで（元画像より大きくはしない）、
+        静止画の場合は出力解像度にする。
+        """
+        source = item.source
+        if isinstance(source, Path):
+            with Image.open(source) as image:
+                source = image.convert("RGB")
+        elif source.mode != "RGB":
+            source = source.convert("RGB")
+
+        if self.ken_burns.is_animated(item.slide):
+            scale = max(self.ken_burns.start_scale, self.ken_burns.end_scale)
+            size = (round(self.width * scale), round(self.height * scale))
+            if source.width <= size[0]:
+                return source
+        else:
+            size = (self.width, self.height)
+        if source.size == size:
+            return source
+        return source.resize(size, Image.Resampling.LANCZOS)
+
+    def _composite_text(self, frame: np.ndarray, slide: Slide, time: float) -> np.ndarray:
+        """アニメーションするテキストを重ねる"""
+        elements = self.text_animator.animated_elements(slide)
+        if not elements:
+            return frame
+
+        frame = frame.copy()
+        for element in elements:
+            alpha, offset_y, scale = self.text_animator.frame_state(element, time)
+            if alpha <= 0:
+                continue
+            sprite, left, top = self._sprite(element)
+            if scale != 1.0:
+                # 中心を基準に拡縮する
+                height, width = sprite.shape[:2]
+                size = (max(round(width * scale), 1), max(round(height * scale), 1))
+                left += (width - size[0]) / 2
+                top += (height - size[1]) / 2
+                sprite = np.asarray(
+                    Image.fromarray(sprite, "RGBA").resize(size, Image.Resampling.BILINEAR)
+                )
+            _alpha_composite(frame, sprite, round(left), round(top + offset_y), alpha)
+        return frame
+
+    def _sprite(self, element: TextElement) -> Tuple[np.ndarray, float, float]:
+        """出力解像度に拡縮したスプライトと、その左上の座標"""
+        key = element.model_dump_json()
+        cached = self._sprites.get(key)
+        if cached is None:
+            animator = self.text_animator
+            sprite, left, top = animator.text_renderer.layout(
+                element, animator.source_width, animator.source_height,
+            )
+            image = sprite.image
+            if animator.scale != 1:
+                image = image.resize(
+                    (max(round(image.width * animator.scale), 1), max(round(image.height * animator.scale), 1)),
+                    Image.Resampling.LANCZOS,
+                )
+            cached = (np.asarray(image), left * animator.scale, top * animator.scale)
+            if len(self._sprites) >= MAX_CACHED_SPRITES:
+                self._sprites.clear()
+            self._sprites[key] = cached
+        return cached
+
+
+def _next_result(pending: Deque[Future], slots: threading.Semaphore) -> bytes:
+    """先読みの最も古い範囲の結果を取り出し、先読みの枠を返す"""
+    future = pending.popleft()
+    try:
+        return future.result()
+    finally:
+        slots.release()
+
+
+def _blend(first: np.ndarray, second: np.ndarray, weight: float) -> np.ndarray:
+    """2つのフレームを weight（second の割合）で混ぜる"""
+    mixed = first.astype(np.float32) * (1.0 - weight) + second.astype(np.float32) * weight
+    return (mixed + 0.5).astype(np.uint8)
+
+
+def _alpha_composite(frame: np.ndarray, sprite: np.ndarray, x: int, y: int, opacity: float) -> None:
+    """RGBAのスプライトをフレームの (x, y) にその場で重ねる（画面外は切り取る）"""
+    height, width = frame.shape[:2]
+    left, top = max(x, 0), max(y, 0)
+    right = min(x + sprite.shape[1], width)
+    bottom = min(y + sprite.shape[0], height)
+    if right <= left or bottom <= top:
+        return
+
+    part = sprite[top - y:bottom - y, left - x:right - x]
+    alpha = part[..., 3:4].astype(np.float32) * (opacity / 255.0)
+    region = frame[top:bottom, left:right]
+    frame[top:bottom, left:right] = (
+        part[..., :3] * alpha + region * (1.0 - alpha) + 0.5
+    ).astype(np.uint8)
+
+
+# フレーム生成用のプロセスプール（プロセス全体で共有）
+_render_pool: Optional[ProcessPoolExecutor] = None
+_render_pool_lock = threading.Lock()
+
+# プール全体で先読みできる範囲の数（プール作成時に プロセス数×2 にする）
+_render_slots: Optional[threading.Semaphore] = None
+
+
+def render_process_count() -> int:
+    """フレーム生成に使うプロセス数（video.render_processes、0ならCPUコア数）"""
+    return get_config().video.render_processes or os.cpu_count() or 1
+
+
+def get_render_pool() -> ProcessPoolExecutor:
+    """
+    フレーム生成用のプロセスプールを取得（初回のみ作成）
+
+    プロセス数は作成時の video.render_processes で決まり、以降は変わらない。
+    ワーカーは spawn で起動し（スレッドを持つ親プロセスを fork しない）、親プロセスの設定を引き継ぐ。
+    """
+    global _render_pool, _render_slots
+    with _render_pool_lock:
+        if _render_pool is None:
+            processes = render_process_count()
+            _render_slots = threading.BoundedSemaphore(processes * 2)
+            _render_pool = ProcessPoolExecutor(
+                max_workers=processes,
+                mp_context=multiprocessing.get_context("spawn"),
+                initializer=_init_render_worker,
+                initargs=(get_config(),),
+            )
+            atexit.register(_render_pool.shutdown)
+    return _render_pool
+
+
+# ワーカープロセス内のレンダラー（FrameRenderer.token ごと）。キャッシュを範囲をまたいで使う
+_worker_renderers: "OrderedDict[str, FrameRenderer]" = OrderedDict()
+
+# ワーカープロセスで保持するレンダラーの数（プロファイル違いのジョブが並行する場合）
+MAX_WORKER_RENDERERS = 4
+
+
+def _init_render_worker(config: Config) -> None:
+    """ワーカープロセスの初期化（設定の引き継ぎ）"""
+    set_config(config)
+
+
+def _render_in_worker(
+    renderer: FrameRenderer,
+    timeline: List[TimelineSlide],
+    start: int,
+    end: int,
+) -> bytes:
+    """ワーカープロセスでフレームの範囲を生成（同じレンダラーは前回までのキャッシュを使う）"""
+    cached = _worker_renderers.get(renderer.token)
+    if cached is None:
+        _worker_renderers[renderer.token] = renderer
+        while len(_worker_renderers) > MAX_WORKER_RENDERERS:
+            _worker_renderers.popitem(last=False)
+        cached = renderer
+    else:
+        _worker_renderers.move_to_end(renderer.token)
+    return cached.render_range(timeline, start, end)
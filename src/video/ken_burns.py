@@ -0,0 +1,138 @@
+"""
+Ken Burnsエフェクトのフィルター生成モジュール
+
+スライド画像を出力解像度の数倍（オーバーサンプリング）に拡大し、
+zoompan の切り出し位置とズーム率をフレーム番号から直接計算する。
+切り出し位置は拡大後の整数ピクセル単位になるため、出力上では
+1/倍率 ピクセル単位の精度で動き、8000px まで拡大しなくても揺れが出ない。
+"""
+from typing import Tuple
+
+from src.core.schemas.video_script import AnimationType, Slide
+
+
+class KenBurnsEffect:
+    """スライドのアニメーション種別に応じたFFmpegフィルターを作るクラス"""
+
+    def __init__(
+        self,
+        width: int,
+        height: int,
+        fps: int,
+        start_scale: float = 1.0,
+        end_scale: float = 1.1,
+        oversample: float = 2.0,
+        enabled: bool = True,
+    ):
+        """
+        Args:
+            width: 出力の幅
+            height: 出力の高さ
+            fps: フレームレート
+            start_scale: ズーム開始時の倍率
+            end_scale: ズーム終了時の倍率
+            oversample: 切り出し元の拡大率（出力解像度に対する倍率）
+            enabled: False の場合は常に静止画として扱う
+        """
+        self.width = width
+        self.height = height
+        self.fps = fps
+        self.start_scale = start_scale
+        self.end_scale = end_scale
+        self.oversample = max(oversample, 1.0)
+        self.enabled = enabled
+
+    def is_animated(self, slide: Slide) -> bool:
+        """
+        zoompan を使うか
+
+        zoompan は入力1フレームから表示時間分のフレームを生成するため、
+        静止画の場合だけ入力側でループさせる必要がある。
+        """
+        return self.enabled and slide.animation != AnimationType.NONE
+
+    def frame_count(self, slide: Slide) -> int:
+        """スライドの表示フレーム数"""
+        return max(int(slide.duration * self.fps), 1)
+
+    def build_filter(self, slide: Slide) -> str:
+        """
+        スライド画像を動画フレームにするフィルターを作成
+
+        Args:
+            slide: スライド情報（animation と duration を使用）
+
+        Returns:
+            str: FFmpegのフィルター文字列
+        """
+        if not self.is_animated(slide):
+            return f"scale={self.width}:{self.height},fps={self.fps}"
+
+        frames = self.frame_count(slide)
+        source_width = _even(self.width * self.oversample)
+        source_height = _even(self.height * self.oversample)
+
+        # 進行度 0〜1（最終フレームで1）
+        progress = f"min(on/{max(frames - 1, 1)},1)"
+        zoom, x, y = self._motion(slide.animation, progress)
+
+        return (
+            f"scale={source_width}:{source_height}:force_original_aspect_ratio=increase,"
+            f"crop={source_width}:{source_height},"
+            f"zoompan=z='{zoom}':x='{x}':y='{y}':"
+            f"d={frames}:s={self.width}x{self.height}:fps={self.fps}"
+        )
+
+    def viewport(self, slide: Slide, frame: int) -> Tuple[float, float, float]:
+        """
+        フレーム番号での表示範囲（build_filter と同じ動きを数値で返す）
+
+        フィルターを使わずにフレームを生成する場合（src.video.frame_renderer）に使う。
+
+        Args:
+            slide: スライド情報
+            frame: スライド内のフレーム番号（範囲外は最初・最後のフレームに丸める）
+
+        Returns:
+            Tuple[float, float, float]: ズーム率と、切り出し位置
+                （はみ出し部分に対する左端・上端の割合、0〜1）
+        """
+        if not self.is_animated(slide):
+            return 1.0, 0.5, 0.5
+
+        progress = min(max(frame / max(self.frame_count(slide) - 1, 1), 0.0), 1.0)
+        start, end = self.start_scale, self.end_scale
+
+        if slide.animation == AnimationType.ZOOM_OUT:
+            return end - (end - start) * progress, 0.5, 0.5
+        if slide.animation == AnimationType.PAN_LEFT:
+            return max(start, end), 1.0 - progress, 0.5
+        if slide.animation == AnimationType.PAN_RIGHT:
+            return max(start, end), progress, 0.5
+        # ZOOM_IN
+        return start + (end - start) * progress, 0.5, 0.5
+
+    def _motion(self, animation: AnimationType, progress: str) -> Tuple[str, str, str]:
+        """アニメーション種別ごとのズーム率・切り出し位置の式（zoom は zoompan の現在値）"""
+        start, end = self.start_scale, self.end_scale
+        center_x = "(iw-iw/zoom)/2"
+        center_y = "(ih-ih/zoom)/2"
+
+        if animation == AnimationType.ZOOM_OUT:
+            return f"{end:.6f}-{end - start:.6f}*{progress}", center_x, center_y
+
+        if animation in (AnimationType.PAN_LEFT, AnimationType.PAN_RIGHT):
+            # 拡大した状態で左右端の間を移動する
+            zoom = f"{max(start, end):.6f}"
+            if animation == AnimationType.PAN_LEFT:
+                # 視点が左へ移動する（右端から左端へ）
+                return zoom, f"(iw-iw/zoom)*(1-{progress})", center_y
+            return zoom, f"(iw-iw/zoom)*{progress}", center_y
+
+        # ZOOM_IN
+        return f"{start:.6f}+{end - start:.6f}*{progress}", center_x, center_y
+
+
+def _even(value: float) -> int:
+    """偶数に丸める（yuv420p は幅・高さが偶数である必要がある）"""
+    return int(round(value / 2)) * 2
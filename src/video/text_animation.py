@@ -0,0 +1,190 @@
+"""
+テキストアニメーションのフィルター生成モジュール
+
+アニメーションするテキスト要素（TextElement.animation）は描画済みのスプライト
+（src.composition.text_sprite）としてFFmpegに入力し、overlay の位置・fade の
+アルファ・scale の倍率を時刻 t の式で動かす。Pythonでフレームごとに描画しないため、
+静止テキストとほぼ同じコストで動かせる。
+"""
+from pathlib import Path
+from typing import Any, Dict, List, Tuple
+
+from src.composition.text_renderer import TextRenderer
+from src.core.config import get_config
+from src.core.schemas.video_script import Slide, TextAnimationType, TextElement
+
+# SLIDE_UP で下から移動してくる距離（出力の高さに対する割合）
+SLIDE_UP_DISTANCE = 0.03
+
+# POP の開始時の大きさ（最終的な大きさに対する割合）
+POP_START_SCALE = 0.5
+
+
+class TextAnimator:
+    """アニメーションするテキストをスライド動画に重ねるフィルターを作るクラス"""
+
+    def __init__(self, width: int, height: int, fps: int, duration: float = 0.4):
+        """
+        Args:
+            width: 出力の幅
+            height: 出力の高さ
+            fps: フレームレート
+            duration: アニメーション1回の長さ（秒）
+        """
+        self.width = width
+        self.height = height
+        self.fps = fps
+        self.duration = max(duration, 1.0 / fps)
+        self.text_renderer = TextRenderer()
+        # スプライトはスライド画像の解像度で描画し、出力解像度との比で拡縮する
+        video_config = get_config().video
+        self.source_width = video_config.width
+        self.source_height = video_config.height
+        self.scale = width / video_config.width
+
+    def animated_elements(self, slide: Slide) -> List[TextElement]:
+        """スライド画像に焼き込まず、重ねて動かすテキスト要素"""
+        return [
+            element for element in slide.text_elements
+            if self.text_renderer.is_animated(element)
+        ]
+
+    def cache_parts(self, slide: Slide) -> List[Dict[str, Any]]:
+        """スライド動画のキャッシュキーに含める値（重ねるテキストと描画設定）"""
+        elements = self.animated_elements(slide)
+        if not elements:
+            return []
+        return [
+            {
+                "elements": [element.model_dump(mode="json") for element in elements],
+                "fonts": get_config().fonts.model_dump(),
+                "source": (self.source_width, self.source_height),
+                "duration": self.duration,
+            }
+        ]
+
+    def build(
+        self,
+        slide: Slide,
+        base_label: str,
+        first_input: int,
+        sprite_dir: Path,
+    ) -> Tuple[List[str], List[str], str]:
+        """
+        テキストを重ねるための入力とフィルターを作成
+
+        Args:
+            slide: スライド情報
+            base_label: 重ねる先の映像のラベル（例: "[base]"）
+            first_input: スプライトに割り当てる最初の入力番号
+            sprite_dir: スプライト画像を書き出すディレクトリ
+
+        Returns:
+            Tuple[List[str], List[str], str]: FFmpegの入力引数、フィルターのリスト、出力のラベル
+        """
+        inputs: List[str] = []
+        filters: List[str] = []
+        label = base_label
+        sprite_dir.mkdir(parents=True, exist_ok=True)
+
+        for index, element in enumerate(self.animated_elements(slide)):
+            sprite, left, top = self.text_renderer.layout(
+                element, self.source_width, self.source_height,
+            )
+            sprite_path = sprite_dir / f"text_{slide.order:02d}_{index}.png"
+            sprite.image.save(sprite_path, "PNG")
+
+            input_index = first_input + index
+            # 画像は1回だけ読み込み、フィルターで表示時間分のフレームに繰り返す
+            # （-loop 1 はフレームごとにPNGを展開し直す）
+            inputs += ["-i", str(sprite_path)]
+
+            sprite_filter, x, y = self._motion(
+                element,
+                slide,
+                left * self.scale,
+                top * self.scale,
+                sprite.image.width * self.scale,
+                sprite.image.height * self.scale,
+            )
+            output = f"[txt{slide.order}_{index}]"
+            filters.append(f"[{input_index}:v]{sprite_filter}[spr{slide.order}_{index}]")
+            filters.append(
+                f"{label}[spr{slide.order}_{index}]"
+                f"overlay=x='{x}':y='{y}':eval=frame{output}"
+            )
+            label = output
+
+        return inputs, filters, label
+
+    def frame_state(self, element: TextElement, time: float) -> Tuple[float, float, float]:
+        """
+        時刻 time（秒）でのテキストの状態（_motion の式と同じ動きを数値で返す）
+
+        フィルターを使わずにフレームを生成する場合（src.video.frame_renderer）に使う。
+
+        Returns:
+            Tuple[float, float, float]: 不透明度（0〜1）、下方向のずれ（出力のpx）、拡大率
+        """
+        progress = min(max((time - element.animation_delay) / self.duration, 0.0), 1.0)
+
+        if element.animation == TextAnimationType.SLIDE_UP:
+            distance = round(self.height * SLIDE_UP_DISTANCE)
+            return progress, distance * (1 - progress) ** 3, 1.0
+
+        if element.animation == TextAnimationType.POP:
+            ease = 1 + 2.70158 * (progress - 1) ** 3 + 1.70158 * (progress - 1) ** 2
+            return progress, 0.0, POP_START_SCALE + (1 - POP_START_SCALE) * ease
+
+        # FADE_IN
+        return progress, 0.0, 1.0
+
+    def _motion(
+        self,
+        element: TextElement,
+        slide: Slide,
+        left: float,
+        top: float,
+        width: float,
+        height: float,
+    ) -> Tuple[str, str, str]:
+        """アニメーション種別ごとのスプライトのフィルターと overlay の位置の式"""
+        delay = element.animation_delay
+        duration = self.duration
+        # 進行度 0〜1（t は秒）
+        progress = f"clip((t-{delay:.3f})/{duration:.3f},0,1)"
+
+        frames = max(int(slide.duration * self.fps), 1)
+        repeat = f"loop=loop={frames - 1}:size=1:start=0,setpts=N/({self.fps}*TB)"
+        # 拡縮と overlay 用の形式（yuva420p）への変換は、繰り返す前に1回だけ行う
+        sprite_filter = "format=rgba"
+        if self.scale != 1:
+            sprite_filter += f",scale=w=iw*{self.scale:.6f}:h=ih*{self.scale:.6f}"
+        sprite_filter += f",format=yuva420p,{repeat}"
+        # どの種類も同じ時間でフェードインする（開始前は透明）
+        fade = f"fade=t=in:st={delay:.3f}:d={duration:.3f}:alpha=1"
+
+        if element.animation == TextAnimationType.SLIDE_UP:
+            # 下から移動して止まる（ease-out）
+            distance = round(self.height * SLIDE_UP_DISTANCE)
+            return (
+                f"{sprite_filter},{fade}",
+                f"{left:.0f}",
+                f"{top:.0f}+{distance}*pow(1-{progress},3)",
+            )
+
+        if element.animation == TextAnimationType.POP:
+            # 小さい状態から少し行き過ぎて戻る（ease-out-back）。中心を基準に拡大する
+            ease = f"(1+2.70158*pow({progress}-1,3)+1.70158*pow({progress}-1,2))"
+            factor = f"({POP_START_SCALE}+{1 - POP_START_SCALE}*{ease})"
+            center_x = left + width / 2
+            center_y = top + height / 2
+            return (
+                f"format=yuva420p,{repeat},{fade},"
+                f"scale=w='max(iw*{self.scale:.6f}*{factor},2)':h=-2:eval=frame",
+                f"{center_x:.1f}-w/2",
+                f"{center_y:.1f}-h/2",
+            )
+
+        # FADE_IN
+        return f"{sprite_filter},{fade}", f"{left:.0f}", f"{top:.0f}"
@@ -1,13 +1,26 @@
 """
 FFmpegを使用した動画合成モジュール
 """
+import contextvars
+import hashlib
 import logging
+import os
 import subprocess
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import List, Optional
+from typing import Iterable, List, Optional, Tuple, Union
 
+from PIL import Image
+
+from src.core.cache import get_artifact_cache
 from src.core.config import get_config, get_project_root
 from src.core.schemas.video_script import Slide, VideoScript
+from src.core.tracing import span
+from src.video.ffmpeg_budget import get_ffmpeg_budget
+from src.video.frame_renderer import FrameRenderer, TimelineSlide, render_process_count
+from src.video.ken_burns import KenBurnsEffect
+from src.video.text_animation import TextAnimator
 
 logger = logging.getLogger(__name__)
 
@@ -15,12 +28,66 @@ logger = logging.getLogger(__name__)
 class VideoComposer:
     """FFmpegを使用して動画を合成するクラス"""
 
-    def __init__(self):
+    def __init__(self, profile: Optional[str] = None):
+        """
+        Args:
+            profile: レンダリングプロファイル名（video.profiles のキー、省略時は video 設定のまま）
+        """
         config = get_config()
         self.config = config
         self.video_config = config.video
         self.slide_config = config.slides
+        self.profile = profile
+
+        zoom_enabled = self.slide_config.zoom_enabled
+        if profile is not None:
+            if profile not in config.video.profiles:
+                raise ValueError(
+                    f"Unknown render profile: {profile} "
+                    f"(available: {', '.join(config.video.profiles)})"
+                )
+            render_profile = config.video.profiles[profile]
+            self.video_config = config.video.model_copy(update=render_profile.video_overrides())
+            if render_profile.zoom_enabled is not None:
+                zoom_enabled = render_profile.zoom_enabled
+
         self.project_root = get_project_root()
+        self.ffmpeg_budget = get_ffmpeg_budget()
+        self.cache = get_artifact_cache()
+        self.ken_burns = KenBurnsEffect(
+            width=self.video_config.width,
+            height=self.video_config.height,
+            fps=self.video_config.fps,
+            start_scale=self.slide_config.zoom_start_scale,
+            end_scale=self.slide_config.zoom_end_scale,
+            oversample=self.slide_config.zoom_oversample,
+            enabled=zoom_enabled,
+        )
+        self.text_animator = TextAnimator(
+            width=self.video_config.width,
+            height=self.video_config.height,
+            fps=self.video_config.fps,
+            duration=self.slide_config.text_animation_duration,
+        )
+
+        # フレームをPythonで生成するレンダラー（renderer: "numpy" の場合のみ）
+        self.frame_renderer: Optional[FrameRenderer] = None
+        if self.video_config.renderer == "numpy":
+            self.frame_renderer = FrameRenderer(
+                width=self.video_config.width,
+                height=self.video_config.height,
+                fps=self.video_config.fps,
+                ken_burns=self.ken_burns,
+                text_animation_duration=self.slide_config.text_animation_duration,
+                # slides.transition が空ならトランジションなし（種類は使わず常にクロスフェード）
+                transition_duration=(
+                    self.slide_config.transition_duration if self.slide_config.transition else 0.0
+                ),
+            )
+        elif self.video_config.renderer != "ffmpeg":
+            raise ValueError(
+                f"Unknown renderer: {self.video_config.renderer} (available: ffmpeg, numpy)"
+            )
 
     def compose_video(
         self,
@@ -47,16 +114,63 @@ class VideoComposer:
         """
         logger.info("Composing video...")
 
+        if self.frame_renderer is not None:
+            return self._compose_rendered(
+                slide_paths, slides, audio_path, output_path, bgm_path, subtitle_path,
+            )
+
+        if self.video_config.single_pass:
+            return self._compose_single_pass(
+                slide_paths, slides, audio_path, output_path, bgm_path, subtitle_path,
+            )
+
         # 一時ディレクトリ
-        temp_dir = output_path.parent / "temp"
-        temp_dir.mkdir(parents=True, exist_ok=True)
+        temp_dir = self.get_temp_dir(output_path)
 
         # 1. 各スライドを動画化（Ken Burnsエフェクト付き）
         slide_videos = self._create_slide_videos(slide_paths, slides, temp_dir)
 
+        # 2〜5. 結合（トランジション付き）・字幕・音声
+        return self.compose_from_segments(
+            slide_videos,
+            audio_path,
+            output_path,
+            bgm_path,
+            subtitle_path,
+            slides=slides,
+        )
+
+    def compose_from_segments(
+        self,
+        slide_videos: List[Path],
+        audio_path: Path,
+        output_path: Path,
+        bgm_path: Optional[Path] = None,
+        subtitle_path: Optional[Path] = None,
+        slides: Optional[List[Slide]] = None,
+    ) -> Path:
+        """
+        エンコード済みのスライド動画を結合して音声を付ける
+
+        Args:
+            slide_videos: スライド動画のパスリスト（表示順）
+            audio_path: ナレーション音声のパス
+            output_path: 出力先パス
+            bgm_path: BGMのパス（オプション）
+            subtitle_path: 字幕SRTファイルのパス（オプション）
+            slides: スライド情報リスト（指定した場合はスライド間にトランジションを入れる）
+
+        Returns:
+            Path: 生成された動画のパス
+        """
+        temp_dir = self.get_temp_dir(output_path)
+
         # 2. スライド動画を結合
         concat_video = temp_dir / "concat.mp4"
-        self._concat_videos(slide_videos, concat_video)
+        if slides is not None and len(slide_videos) > 1 and self._transition_frames(slides) > 0:
+            self._concat_with_transitions(slide_videos, slides, concat_video)
+        else:
+            self._concat_videos(slide_videos, concat_video)
 
         # 3. 字幕を追加（ある場合）
         if subtitle_path and subtitle_path.exists():
@@ -79,55 +193,489 @@ class VideoComposer:
         logger.info(f"Video composed: {output_path}")
         return output_path
 
+    def get_temp_dir(self, output_path: Path) -> Path:
+        """出力先に対応する一時ディレクトリを取得（なければ作成）"""
+        temp_dir = output_path.parent / "temp"
+        temp_dir.mkdir(parents=True, exist_ok=True)
+        return temp_dir
+
     def _create_slide_videos(
         self,
         slide_paths: List[Path],
         slides: List[Slide],
         temp_dir: Path,
     ) -> List[Path]:
-        """各スライドを動画化"""
-        slide_videos = []
-
-        for slide_path, slide in zip(slide_paths, slides):
-            output_path = temp_dir / f"slide_{slide.order:02d}.mp4"
-
-            # Ken Burnsエフェクトの設定
-            if self.slide_config.zoom_enabled:
-                start_scale = self.slide_config.zoom_start_scale
-                end_scale = self.slide_config.zoom_end_scale
-
-                # ズームエフェクトのフィルター
-                zoom_filter = (
-                    f"scale=8000:-1,"
-                    f"zoompan=z='min(zoom+{(end_scale-start_scale)/slide.duration/self.video_config.fps:.6f},1.5)':"
-                    f"x='iw/2-(iw/zoom/2)':y='ih/2-(ih/zoom/2)':"
-                    f"d={int(slide.duration * self.video_config.fps)}:"
-                    f"s={self.video_config.width}x{self.video_config.height}:"
-                    f"fps={self.video_config.fps}"
+        """各スライドを並列に動画化（結果は表示順）"""
+        with ThreadPoolExecutor(
+            max_workers=self.max_parallel_encodes,
+            thread_name_prefix="encode",
+        ) as executor:
+            futures = [
+                executor.submit(
+                    contextvars.copy_context().run,
+                    self.encode_slide,
+                    slide_path,
+                    slide,
+                    temp_dir / f"slide_{slide.order:02d}.mp4",
                 )
+                for slide_path, slide in zip(slide_paths, slides)
+            ]
+            return [future.result() for future in futures]
+
+    @property
+    def max_parallel_encodes(self) -> int:
+        """スレッド予算内で同時に実行できるエンコード数"""
+        return self.ffmpeg_budget.max_parallel_encodes
+
+    def encode_slide(
+        self,
+        source: Union[Path, Image.Image],
+        slide: Slide,
+        output_path: Path,
+    ) -> Path:
+        """
+        1枚のスライド画像を動画化する（Ken Burnsエフェクト付き）
+
+        合成済みの画像を渡した場合はPNGを経由せず、rawvideo としてFFmpegの
+        標準入力に直接流す（PNGの圧縮・展開を省く）。
+        アニメーションするテキストはここでスプライトとして重ねる。
+
+        Args:
+            source: スライド画像のパス、または合成済みの画像
+            slide: スライド情報
+            output_path: 出力先パス
+
+        Returns:
+            Path: 生成されたスライド動画のパス
+        """
+        video_filter = self.ken_burns.build_filter(slide)
+        frame: Optional[bytes] = None
+        if isinstance(source, Image.Image):
+            if source.mode != "RGB":
+                source = source.convert("RGB")
+            frame = source.tobytes()
+            source_hash = hashlib.sha256(frame).hexdigest()
+        else:
+            source_hash = self.cache.hash_file(source)
+
+        with span("slide.encode", order=slide.order) as current:
+            # 同じスライド画像・エフェクト・エンコード設定の動画があれば再利用
+            # （フィルター文字列に表示時間・ズーム設定・fps・解像度が含まれる）
+            cache_key = self.cache.make_key(
+                source_hash,
+                video_filter,
+                slide.duration,
+                self._video_codec_args(),
+                self.text_animator.cache_parts(slide),
+                self.video_config.renderer,
+                self._keyframe_args(slide),
+            )
+            if self.cache.get("segments", cache_key, output_path):
+                current.attributes["cache_hit"] = True
+                logger.info(f"Segment cache hit: {output_path}")
+                return output_path
+
+            if self.frame_renderer is not None:
+                # 全フレームをPythonで生成する（並行する他のスライドと同じプロセスプールを使う）
+                timeline = self.frame_renderer.build_timeline([source], [slide])
+                self._encode_frames(timeline, output_path, parallel=True, extra_args=self._keyframe_args(slide))
+                self.cache.put("segments", cache_key, output_path)
+                return output_path
+
+            if frame is None:
+                input_args = ["-loop", "1", "-i", str(source)]
             else:
-                zoom_filter = (
-                    f"scale={self.video_config.width}:{self.video_config.height},"
-                    f"fps={self.video_config.fps}"
-                )
+                # 1フレームだけ流し、静止画の場合はフィルターで表示時間分繰り返す
+                input_args = [
+                    "-f", "rawvideo",
+                    "-pix_fmt", "rgb24",
+                    "-s", f"{source.width}x{source.height}",
+                    "-framerate", str(self.video_config.fps),
+                    "-i", "pipe:0",
+                ]
+                if not self.ken_burns.is_animated(slide):
+                    frames = self.ken_burns.frame_count(slide)
+                    video_filter = (
+                        f"loop=loop={frames - 1}:size=1:start=0,"
+                        f"setpts=N/({self.video_config.fps}*TB),{video_filter}"
+                    )
+
+            # アニメーションするテキストを重ねる
+            text_inputs, text_filters, video_label = self.text_animator.build(
+                slide, "[base]", 1, output_path.parent,
+            )
+            if text_filters:
+                filter_args = [
+                    "-filter_complex", ";".join([f"[0:v]{video_filter}[base]", *text_filters]),
+                    "-map", video_label,
+                ]
+            else:
+                filter_args = ["-vf", video_filter]
 
             # FFmpegコマンド
             cmd = [
                 "ffmpeg", "-y",
-                "-loop", "1",
-                "-i", str(slide_path),
-                "-vf", zoom_filter,
+                *input_args,
+                *text_inputs,
+                *filter_args,
                 "-t", str(slide.duration),
-                "-c:v", self.video_config.video_codec,
-                "-pix_fmt", "yuv420p",
-                "-b:v", self.video_config.video_bitrate,
+                *self._video_codec_args(),
+                *self._keyframe_args(slide),
                 str(output_path),
             ]
 
-            self._run_ffmpeg(cmd)
-            slide_videos.append(output_path)
+            self._run_ffmpeg(cmd, "encode_slide", input_data=frame)
+            self.cache.put("segments", cache_key, output_path)
+
+        return output_path
+
+    def _video_codec_args(self) -> List[str]:
+        """映像エンコードのFFmpeg引数（コーデック・プリセット・品質）"""
+        args = ["-c:v", self.video_config.video_codec, "-pix_fmt", "yuv420p"]
+        if self.video_config.preset:
+            args += ["-preset", self.video_config.preset]
+        if self.video_config.tune:
+            args += ["-tune", self.video_config.tune]
+        if self.video_config.crf is not None:
+            args += ["-crf", str(self.video_config.crf)]
+        else:
+            args += ["-b:v", self.video_config.video_bitrate]
+        return args
+
+    def _compose_single_pass(
+        self,
+        slide_paths: List[Path],
+        slides: List[Slide],
+        audio_path: Path,
+        output_path: Path,
+        bgm_path: Optional[Path] = None,
+        subtitle_path: Optional[Path] = None,
+    ) -> Path:
+        """
+        1つのフィルターグラフで動画を合成する
+
+        スライドの動画化・結合・字幕焼き込み・音声ミックスを1回のFFmpeg実行で行い、
+        映像のエンコードを1回にする（一時ファイルは重ねるテキストの画像だけ）。
+        """
+        fps = self.video_config.fps
+        inputs: List[str] = []
+        filters: List[str] = []
+        # テキストのスプライト画像の書き出し先（重ねるテキストがある場合だけ作成される）
+        temp_dir = output_path.parent / "temp"
+
+        # 1. 各スライドを動画化（スライド画像を先に並べ、テキストのスプライトはその後の入力にする）
+        count = len(slides)
+        next_input = count
+        for index, (slide_path, slide) in enumerate(zip(slide_paths, slides)):
+            if self.ken_burns.is_animated(slide):
+                # zoompan は入力1フレームから表示時間分のフレームを生成する
+                inputs += ["-i", str(slide_path)]
+            else:
+                inputs += ["-loop", "1", "-framerate", str(fps), "-t", str(slide.duration), "-i", str(slide_path)]
+            filters.append(
+                f"[{index}:v]{self.ken_burns.build_filter(slide)},"
+                f"trim=duration={slide.duration},setpts=PTS-STARTPTS,"
+                f"setsar=1[b{index}]"
+            )
+
+        text_inputs: List[str] = []
+        for index, slide in enumerate(slides):
+            slide_inputs, text_filters, label = self.text_animator.build(
+                slide, f"[b{index}]", next_input, temp_dir,
+            )
+            text_inputs += slide_inputs
+            next_input += len(self.text_animator.animated_elements(slide))
+            filters += text_filters
+            filters.append(f"{label}format=yuv420p[v{index}]")
+        inputs += text_inputs
+
+        # 2. 結合（トランジションがある場合は境界部分を xfade でつなぐ）
+        half = self._transition_frames(slides)
+        if half > 0 and count > 1:
+            pieces = self._transition_filters(slides, filters, half)
+        else:
+            pieces = [f"[v{i}]" for i in range(count)]
+        filters.append("".join(pieces) + f"concat=n={len(pieces)}:v=1:a=0[vcat]")
+        video_label = "[vcat]"
 
-        return slide_videos
+        # 3. 字幕
+        if subtitle_path and subtitle_path.exists():
+            filters.append(f"[vcat]{self._subtitle_filter(subtitle_path)}[vout]")
+            video_label = "[vout]"
+
+        # 4. 音声
+        audio_input = next_input
+        inputs += ["-i", str(audio_path)]
+        audio_label = f"{audio_input}:a:0"
+        if bgm_path and bgm_path.exists():
+            inputs += ["-i", str(bgm_path)]
+            filters.append(
+                f"[{audio_input}:a]volume=1.0[narration];"
+                f"[{audio_input + 1}:a]volume={self.config.audio.bgm.volume}[bgm];"
+                f"[narration][bgm]amix=inputs=2:duration=first[aout]"
+            )
+            audio_label = "[aout]"
+
+        cmd = [
+            "ffmpeg", "-y",
+            *inputs,
+            "-filter_complex", ";".join(filters),
+            "-map", video_label,
+            "-map", audio_label,
+            *self._video_codec_args(),
+            "-r", str(fps),
+            "-c:a", self.video_config.audio_codec,
+            "-b:a", self.video_config.audio_bitrate,
+            "-shortest",
+            str(output_path),
+        ]
+
+        # 1本の長いエンコードなので予算の半分まで使う（他のジョブの分は残す）
+        threads = max(self.ffmpeg_budget.total_threads // 2, self.ffmpeg_budget.threads_per_encode)
+        self._run_ffmpeg(cmd, "single_pass", threads=threads)
+
+        if text_inputs and not self.config.output.keep_temp_files:
+            self._cleanup_temp_files(temp_dir)
+
+        logger.info(f"Video composed: {output_path}")
+        return output_path
+
+    def _compose_rendered(
+        self,
+        slide_paths: List[Path],
+        slides: List[Slide],
+        audio_path: Path,
+        output_path: Path,
+        bgm_path: Optional[Path] = None,
+        subtitle_path: Optional[Path] = None,
+    ) -> Path:
+        """
+        全フレームをPythonで生成して動画を合成する（renderer: "numpy"）
+
+        フレームはプロセスプールで並列に生成し、1つのエンコーダーに流す。
+        字幕と音声は通常どおり後から付ける。
+        """
+        temp_dir = self.get_temp_dir(output_path)
+        rendered_video = temp_dir / "rendered.mp4"
+
+        timeline = self.frame_renderer.build_timeline(slide_paths, slides)
+        # 1本の長いエンコードなので予算の半分まで使う（他のジョブの分は残す）
+        threads = max(self.ffmpeg_budget.total_threads // 2, self.ffmpeg_budget.threads_per_encode)
+        self._encode_frames(timeline, rendered_video, parallel=True, threads=threads)
+
+        return self.compose_from_segments(
+            [rendered_video],
+            audio_path,
+            output_path,
+            bgm_path,
+            subtitle_path,
+        )
+
+    def _encode_frames(
+        self,
+        timeline: List[TimelineSlide],
+        output_path: Path,
+        parallel: bool,
+        threads: Optional[int] = None,
+        extra_args: Optional[List[str]] = None,
+    ) -> None:
+        """FrameRenderer で生成したフレームを rawvideo としてエンコーダーに流す（parallel ならプロセスプールで生成）"""
+        cmd = [
+            "ffmpeg", "-y",
+            "-f", "rawvideo",
+            "-pix_fmt", "rgb24",
+            "-s", f"{self.video_config.width}x{self.video_config.height}",
+            "-framerate", str(self.video_config.fps),
+            "-i", "pipe:0",
+            *self._video_codec_args(),
+            *(extra_args or []),
+            str(output_path),
+        ]
+        with span("video.render_frames", processes=render_process_count() if parallel else 1,
+                  frames=self.frame_renderer.total_frames(timeline)):
+            self._run_ffmpeg(
+                cmd,
+                "encode_frames",
+                threads=threads,
+                input_data=self.frame_renderer.iter_frames(timeline, parallel),
+            )
+
+    def _transition_frames(self, slides: List[Slide]) -> int:
+        """
+        スライドの境界の前後それぞれでトランジションに使うフレーム数（0ならトランジションなし）
+
+        境界の前後 transition_duration/2 秒ずつを使うため、動画全体の長さは変わらない。
+        """
+        if not self.slide_config.transition:
+            return 0
+        half = int(round(self.slide_config.transition_duration * self.video_config.fps / 2))
+        if half <= 0:
+            return 0
+        # 前後両方のトランジションが入らないほど短いスライドがある場合は使わない
+        if any(self.ken_burns.frame_count(slide) <= half * 2 for slide in slides):
+            return 0
+        return half
+
+    def _keyframe_args(self, slide: Slide) -> List[str]:
+        """
+        トランジションの境目（先頭・末尾から half フレーム）をキーフレームにする引数
+
+        スライド動画の本体をストリームコピーで正確に切り出せるようにする。
+        時刻は対象フレームの半フレーム前にし、丸め誤差で前のフレームにずれないようにする。
+        """
+        half = self._transition_frames([slide])
+        if half == 0:
+            return []
+        fps = self.video_config.fps
+        frames = self.ken_burns.frame_count(slide)
+        times = [(half - 0.5) / fps, (frames - half - 0.5) / fps]
+        return ["-force_key_frames", ",".join(f"{time:.6f}" for time in times)]
+
+    def _concat_with_transitions(
+        self,
+        video_paths: List[Path],
+        slides: List[Slide],
+        output_path: Path,
+    ) -> None:
+        """
+        スライド動画をトランジション付きで結合する
+
+        各スライド動画の本体（境界の前後 half フレームを除いた部分）はストリームコピーで切り出し、
+        境界部分だけを xfade で再エンコードしてから、全体を concat で結合する。
+        """
+        half = self._transition_frames(slides)
+        temp_dir = output_path.parent
+        last = len(video_paths) - 1
+
+        with ThreadPoolExecutor(
+            max_workers=self.max_parallel_encodes,
+            thread_name_prefix="transition",
+        ) as executor:
+            futures = []
+            for index, (video_path, slide) in enumerate(zip(video_paths, slides)):
+                frames = self.ken_burns.frame_count(slide)
+                start = half if index > 0 else 0
+                end = frames - half if index < last else frames
+                futures.append(executor.submit(
+                    contextvars.copy_context().run,
+                    self._cut_segment,
+                    video_path,
+                    start,
+                    end - start,
+                    temp_dir / f"body_{index:02d}.mp4",
+                ))
+                if index < last:
+                    futures.append(executor.submit(
+                        contextvars.copy_context().run,
+                        self._encode_transition,
+                        video_path,
+                        frames,
+                        video_paths[index + 1],
+                        half,
+                        temp_dir / f"transition_{index:02d}.mp4",
+                    ))
+            pieces = [future.result() for future in futures]
+
+        self._concat_videos(pieces, output_path)
+
+    def _cut_segment(self, video_path: Path, start: int, frames: int, output_path: Path) -> Path:
+        """スライド動画のフレーム start から frames フレームをストリームコピーで切り出す（start はキーフレーム）"""
+        fps = self.video_config.fps
+        cmd = ["ffmpeg", "-y"]
+        if start > 0:
+            # キーフレームから読み始める（半フレーム後を指定して、そのキーフレームより前に戻らないようにする）
+            cmd += ["-ss", f"{(start + 0.5) / fps:.6f}"]
+        cmd += [
+            "-i", str(video_path),
+            "-frames:v", str(frames),
+            "-c", "copy",
+            "-avoid_negative_ts", "make_zero",
+            str(output_path),
+        ]
+        self._run_ffmpeg(cmd, "cut_segment", threads=1)
+        return output_path
+
+    def _encode_transition(
+        self,
+        previous_path: Path,
+        previous_frames: int,
+        next_path: Path,
+        half: int,
+        output_path: Path,
+    ) -> Path:
+        """
+        境界部分（前のスライドの最後 half フレームと次のスライドの最初 half フレーム）を xfade でつなぐ
+
+        前のスライドは最後のフレームを、次のスライドは最初のフレームを half フレーム分伸ばしてから
+        2*half フレームかけて切り替えるため、出力は元の境界部分と同じ 2*half フレームになる。
+        """
+        fps = self.video_config.fps
+        duration = 2 * half / fps
+        # xfade は入力のフレームレートが確定している必要があるため fps で揃える
+        filters = ";".join([
+            f"[0:v]trim=end_frame={half},setpts=PTS-STARTPTS,fps={fps},"
+            f"tpad=stop={half}:stop_mode=clone[a]",
+            f"[1:v]trim=end_frame={half},setpts=PTS-STARTPTS,fps={fps},"
+            f"tpad=start={half}:start_mode=clone[b]",
+            f"[a][b]xfade=transition={self.slide_config.transition}:"
+            f"duration={duration:.6f}:offset=0,format=yuv420p",
+        ])
+        cmd = [
+            "ffmpeg", "-y",
+            # 前のスライドは境界部分の先頭（キーフレーム）から正確にシークする
+            "-ss", f"{(previous_frames - half - 0.5) / fps:.6f}",
+            "-i", str(previous_path),
+            "-i", str(next_path),
+            "-filter_complex", filters,
+            "-frames:v", str(2 * half),
+            "-r", str(fps),
+            *self._video_codec_args(),
+            str(output_path),
+        ]
+        self._run_ffmpeg(cmd, "encode_transition")
+        return output_path
+
+    def _transition_filters(self, slides: List[Slide], filters: List[str], half: int) -> List[str]:
+        """
+        1パス合成用に、各スライド [v{i}] を本体と境界部分に分けて xfade でつなぐフィルターを追加
+
+        Returns:
+            List[str]: 表示順に結合するラベル（本体とトランジションが交互に並ぶ）
+        """
+        fps = self.video_config.fps
+        duration = 2 * half / fps
+        last = len(slides) - 1
+        pieces: List[str] = []
+        for index, slide in enumerate(slides):
+            frames = self.ken_burns.frame_count(slide)
+            start = half if index > 0 else 0
+            end = frames - half if index < last else frames
+            outputs = [f"[body{index}]"]
+            parts = [f"trim=start_frame={start}:end_frame={end},setpts=PTS-STARTPTS[body{index}]"]
+            if index < last:
+                outputs.append(f"[tail{index}]")
+                parts.append(
+                    f"trim=start_frame={frames - half}:end_frame={frames},setpts=PTS-STARTPTS,fps={fps},"
+                    f"tpad=stop={half}:stop_mode=clone[tail{index}]"
+                )
+            if index > 0:
+                outputs.append(f"[head{index}]")
+                parts.append(
+                    f"trim=end_frame={half},setpts=PTS-STARTPTS,fps={fps},"
+                    f"tpad=start={half}:start_mode=clone[head{index}]"
+                )
+            split_labels = [f"[s{index}_{n}]" for n in range(len(outputs))]
+            filters.append(f"[v{index}]split={len(outputs)}{''.join(split_labels)}")
+            filters += [f"{label}{part}" for label, part in zip(split_labels, parts)]
+
+            if index > 0:
+                filters.append(
+                    f"[tail{index - 1}][head{index}]xfade=transition={self.slide_config.transition}:"
+                    f"duration={duration:.6f}:offset=0[x{index - 1}]"
+                )
+                pieces.append(f"[x{index - 1}]")
+            pieces.append(f"[body{index}]")
+        return pieces
 
     def _concat_videos(self, video_paths: List[Path], output_path: Path) -> None:
         """複数の動画を結合"""
@@ -149,7 +697,7 @@ class VideoComposer:
             str(output_path),
         ]
 
-        self._run_ffmpeg(cmd)
+        self._run_ffmpeg(cmd, "concat", threads=1)
 
     def _add_subtitles(
         self,
@@ -157,8 +705,24 @@ class VideoComposer:
         subtitle_path: Path,
         output_path: Path,
     ) -> None:
+        """動画に字幕を焼き込む"""
+        logger.info("Adding subtitles to video...")
+
+        cmd = [
+            "ffmpeg", "-y",
+            "-i", str(video_path),
+            "-vf", self._subtitle_filter(subtitle_path),
+            *self._video_codec_args(),
+            "-c:a", "copy",
+            str(output_path),
+        ]
+
+        self._run_ffmpeg(cmd, "subtitles")
+        logger.info("Subtitles added successfully")
+
+    def _subtitle_filter(self, subtitle_path: Path) -> str:
         """
-        動画に字幕を焼き込む
+        字幕焼き込みフィルター
 
         字幕スタイル:
         - 画面下部中央に配置
@@ -166,8 +730,6 @@ class VideoComposer:
         - 白文字＋黒の縁取り（どんな背景でも読みやすい）
         - 半透明の背景ボックス
         """
-        logger.info("Adding subtitles to video...")
-
         # フォントパスを取得
         fonts_dir = self.project_root / self.config.fonts.directory
         font_file = fonts_dir / self.config.fonts.bold
@@ -202,29 +764,16 @@ class VideoComposer:
         # 字幕フィルター
         if font_file:
             font_path_escaped = str(font_file).replace('\\', '/').replace(':', '\\:')
-            subtitle_filter = (
+            return (
                 f"subtitles='{srt_path_escaped}':"
                 f"fontsdir='{str(fonts_dir).replace(chr(92), '/').replace(':', chr(92)+':')}':"
                 f"force_style='{subtitle_style}'"
             )
-        else:
-            subtitle_filter = (
-                f"subtitles='{srt_path_escaped}':"
-                f"force_style='{subtitle_style}'"
-            )
 
-        cmd = [
-            "ffmpeg", "-y",
-            "-i", str(video_path),
-            "-vf", subtitle_filter,
-            "-c:v", self.video_config.video_codec,
-            "-b:v", self.video_config.video_bitrate,
-            "-c:a", "copy",
-            str(output_path),
-        ]
-
-        self._run_ffmpeg(cmd)
-        logger.info("Subtitles added successfully")
+        return (
+            f"subtitles='{srt_path_escaped}':"
+            f"force_style='{subtitle_style}'"
+        )
 
     def _add_audio(
         self,
@@ -246,7 +795,7 @@ class VideoComposer:
             str(output_path),
         ]
 
-        self._run_ffmpeg(cmd)
+        self._run_ffmpeg(cmd, "mux_audio", threads=1)
 
     def _add_audio_with_bgm(
         self,
@@ -280,23 +829,117 @@ class VideoComposer:
             str(output_path),
         ]
 
-        self._run_ffmpeg(cmd)
+        self._run_ffmpeg(cmd, "mix_audio", threads=1)
 
-    def _run_ffmpeg(self, cmd: List[str]) -> None:
-        """FFmpegコマンドを実行"""
-        logger.debug(f"Running FFmpeg: {' '.join(cmd)}")
+    def _run_ffmpeg(
+        self,
+        cmd: List[str],
+        label: str = "run",
+        threads: Optional[int] = None,
+        input_data: Optional[Union[bytes, Iterable[bytes]]] = None,
+    ) -> None:
+        """
+        FFmpegコマンドを実行
 
-        try:
-            # Windows環境ではエンコーディング問題を回避するため、バイナリモードで実行
-            result = subprocess.run(
-                cmd,
-                capture_output=True,
-                check=True,
+        Args:
+            cmd: FFmpegコマンド（最後の要素が出力先）
+            label: 計測用のラベル
+            threads: 予約するスレッド数（省略時はエンコード1プロセス分、映像をコピーするだけなら1）
+            input_data: 標準入力に流すデータ（"-i pipe:0" の場合）。
+                バイト列のイテレーターを渡すと、生成しながら順に流す
+        """
+        with span(f"ffmpeg.{label}") as current:
+            current.add_bytes(bytes_in=sum(
+                Path(arg).stat().st_size
+                for flag, arg in zip(cmd, cmd[1:])
+                if flag == "-i" and Path(arg).is_file()
+            ) + (len(input_data) if isinstance(input_data, bytes) else 0))
+
+            with self.ffmpeg_budget.reserve(threads) as reserved:
+                # エンコーダー（-threads）に加えて、フィルターグラフ（zoompan・xfade・overlay など）の
+                # スレッド数も予約数に制限する（フィルター側はグローバルオプションなので先頭に置く）
+                cmd = [
+                    cmd[0],
+                    "-filter_threads", str(reserved),
+                    "-filter_complex_threads", str(reserved),
+                    *cmd[1:-1],
+                    "-threads", str(reserved),
+                    cmd[-1],
+                ]
+                logger.debug(f"Running FFmpeg: {' '.join(cmd)}")
+                returncode, stderr, child_cpu = self._spawn_ffmpeg(cmd, input_data)
+            current.add_child_cpu(child_cpu)
+            current.attributes["threads"] = reserved
+
+            if returncode != 0:
+                stderr = stderr.decode('utf-8', errors='ignore') if stderr else ''
+                logger.error(f"FFmpeg error: {stderr}")
+                raise RuntimeError(f"FFmpeg failed: {stderr}")
+
+            output_path = Path(cmd[-1])
+            if output_path.is_file():
+                current.add_bytes(bytes_out=output_path.stat().st_size)
+
+    def _spawn_ffmpeg(
+        self,
+        cmd: List[str],
+        input_data: Optional[Union[bytes, Iterable[bytes]]] = None,
+    ) -> Tuple[int, bytes, float]:
+        """FFmpegを起動して終了を待つ（終了コード・標準エラー・子プロセスのCPU時間を返す）"""
+        # Windows環境ではエンコーディング問題を回避するため、バイナリモードで実行
+        if not hasattr(os, "wait4"):
+            # wait4のない環境（Windows）ではCPU時間は計測しない
+            if input_data is not None and not isinstance(input_data, bytes):
+                input_data = b"".join(input_data)
+            result = subprocess.run(cmd, input=input_data, capture_output=True)
+            return result.returncode, result.stderr, 0.0
+
+        process = subprocess.Popen(
+            cmd,
+            stdin=subprocess.DEVNULL if input_data is None else subprocess.PIPE,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.PIPE,
+        )
+        writer = None
+        errors: List[BaseException] = []
+        if input_data is not None:
+            # 標準エラーの読み出しと並行して書き込む（パイプが詰まって止まらないように）
+            writer = threading.Thread(
+                target=self._write_stdin, args=(process, input_data, errors), daemon=True,
             )
-        except subprocess.CalledProcessError as e:
-            stderr = e.stderr.decode('utf-8', errors='ignore') if e.stderr else ''
-            logger.error(f"FFmpeg error: {stderr}")
-            raise RuntimeError(f"FFmpeg failed: {stderr}")
+            writer.start()
+        stderr = process.stderr.read()
+        process.stderr.close()
+        if writer is not None:
+            writer.join()
+        # wait4でこのプロセス自身のリソース使用量を取得（並行実行中の他のFFmpegを含まない）
+        _, status, usage = os.wait4(process.pid, 0)
+        process.returncode = os.waitstatus_to_exitcode(status)
+        if errors:
+            # 入力の生成に失敗した場合（途中までの入力で出力が完成したように見えても失敗とする）
+            raise errors[0]
+        return process.returncode, stderr, usage.ru_utime + usage.ru_stime
+
+    @staticmethod
+    def _write_stdin(
+        process: subprocess.Popen,
+        data: Union[bytes, Iterable[bytes]],
+        errors: List[BaseException],
+    ) -> None:
+        """子プロセスの標準入力にデータを書き込んで閉じる（生成時の例外は errors に入れる）"""
+        try:
+            for chunk in ([data] if isinstance(data, bytes) else data):
+                process.stdin.write(chunk)
+        except BrokenPipeError:
+            # FFmpegが先に終了した場合（エラーは終了コードと標準エラーで報告される）
+            pass
+        except Exception as e:
+            errors.append(e)
+        finally:
+            try:
+                process.stdin.close()
+            except BrokenPipeError:
+                pass
 
     def _cleanup_temp_files(self, temp_dir: Path) -> None:
         """一時ファイルを削除"""
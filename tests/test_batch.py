@@ -0,0 +1,60 @@
+"""BatchRunner（一括生成）のテスト"""
+import json
+from types import SimpleNamespace
+
+from src.batch import BatchRunner, read_themes
+
+
+class FakeGenerator:
+    """テーマが "fail" なら失敗し、それ以外は timings.json を書いて成功する"""
+
+    def __init__(self, root):
+        self.project_root = root
+        self.config = SimpleNamespace(output=SimpleNamespace(directory="output"))
+
+    def generate(self, theme, job_id, profile=None):
+        output_dir = self.project_root / "output" / job_id
+        output_dir.mkdir(parents=True)
+        (output_dir / "timings.json").write_text(json.dumps({
+            "summary": {
+                "phase.script": {"wall_time": 1.23456},
+                "phase.video": {"wall_time": 4.5},
+                "ffmpeg.encode_slide": {"wall_time": 3.0},
+            },
+        }), encoding="utf-8")
+        if theme == "fail":
+            raise RuntimeError("narration failed")
+        return output_dir / "video.mp4"
+
+
+def test_read_themes_skips_blank_and_comment_lines(tmp_path):
+    path = tmp_path / "themes.txt"
+    path.write_text("# 今週のテーマ\n朝のルーティン\n\n  睡眠の質  \n", encoding="utf-8")
+
+    assert read_themes(path) == ["朝のルーティン", "睡眠の質"]
+
+
+def test_summary_includes_phase_timings(tmp_path):
+    runner = BatchRunner(FakeGenerator(tmp_path), jobs=2)
+    summary_path = tmp_path / "batch.json"
+
+    results = runner.run(["ok", "fail"], summary_path)
+
+    assert [result["status"] for result in results] == ["completed", "failed"]
+    for result in results:
+        assert result["timings"] == str(tmp_path / "output" / result["job_id"] / "timings.json")
+        assert result["phases"] == {"script": 1.235, "video": 4.5}
+    summary = json.loads(summary_path.read_text(encoding="utf-8"))
+    assert summary["succeeded"] == 1 and summary["failed"] == 1
+    assert summary["results"][0]["phases"] == {"script": 1.235, "video": 4.5}
+
+
+def test_job_without_timings(tmp_path):
+    class EarlyFailure(FakeGenerator):
+        def generate(self, theme, job_id, profile=None):
+            raise RuntimeError("invalid theme")
+
+    results = BatchRunner(EarlyFailure(tmp_path)).run(["x"], tmp_path / "batch.json")
+
+    assert results[0]["status"] == "failed"
+    assert "timings" not in results[0] and "phases" not in results[0]
@@ -0,0 +1,19 @@
+"""ベンチマークのベースライン比較のテスト"""
+from src.benchmark.runner import compare_to_baseline
+
+
+def test_regression_beyond_tolerance_and_slack():
+    baseline = {"4_slides": {"total": 10.0, "phase.video": 1.0}}
+    results = {"4_slides": {"total": 12.5, "phase.video": 1.4}}
+
+    regressions = compare_to_baseline(results, baseline, tolerance=0.2, min_slack=0.5)
+
+    # total は 12.0s を超えたので劣化、phase.video は最小許容量 0.5s 以内
+    assert regressions == ["4_slides total: 12.50s > 12.00s (baseline 10.00s)"]
+
+
+def test_metrics_missing_from_baseline_are_ignored():
+    results = {"8_slides": {"total": 99.0}, "4_slides": {"phase.new": 5.0}}
+    baseline = {"4_slides": {"total": 1.0}}
+
+    assert compare_to_baseline(results, baseline, tolerance=0.2, min_slack=0.5) == []
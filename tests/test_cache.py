@@ -0,0 +1,87 @@
+"""ArtifactCache（コンテンツアドレス型キャッシュ）のテスト"""
+import os
+
+from src.core.cache import ArtifactCache
+
+
+def make_cache(tmp_path, max_bytes=1024 * 1024, enabled=True):
+    return ArtifactCache(tmp_path / "cache", max_bytes=max_bytes, enabled=enabled)
+
+
+def entry_path(cache, namespace, key, suffix):
+    return cache.directory / namespace / key[:2] / f"{key}{suffix}"
+
+
+def test_make_key_is_stable_and_order_sensitive():
+    key = ArtifactCache.make_key("prompt", {"size": "1024x1792", "model": "dall-e-3"})
+
+    assert key == ArtifactCache.make_key("prompt", {"model": "dall-e-3", "size": "1024x1792"})
+    assert key != ArtifactCache.make_key({"size": "1024x1792", "model": "dall-e-3"}, "prompt")
+    assert key != ArtifactCache.make_key("prompt", {"size": "1080x1920", "model": "dall-e-3"})
+    assert len(key) == 64
+
+
+def test_put_and_get_round_trip(tmp_path):
+    cache = make_cache(tmp_path)
+    source = tmp_path / "source.png"
+    source.write_bytes(b"image")
+    key = cache.make_key("background")
+
+    cache.put("backgrounds", key, source)
+    output = tmp_path / "out" / "background.png"
+
+    assert cache.get("backgrounds", key, output)
+    assert output.read_bytes() == b"image"
+    assert not cache.get("backgrounds", cache.make_key("other"), tmp_path / "miss.png")
+
+
+def test_put_bytes_and_lookup(tmp_path):
+    cache = make_cache(tmp_path)
+    key = cache.make_key("sprite")
+
+    assert cache.lookup("sprites", key, ".png") is None
+    cache.put_bytes("sprites", key, b"sprite", ".png")
+
+    path = cache.lookup("sprites", key, ".png")
+    assert path is not None and path.read_bytes() == b"sprite"
+
+
+def test_disabled_cache_stores_nothing(tmp_path):
+    cache = make_cache(tmp_path, enabled=False)
+    key = cache.make_key("narration")
+    cache.put_bytes("narration", key, b"audio", ".wav")
+
+    assert not (tmp_path / "cache").exists()
+    assert cache.lookup("narration", key, ".wav") is None
+
+
+def test_evicts_least_recently_used(tmp_path):
+    cache = make_cache(tmp_path, max_bytes=250)
+    keys = [cache.make_key(index) for index in range(3)]
+    for index, key in enumerate(keys[:2]):
+        cache.put_bytes("slides", key, b"x" * 100, ".png")
+        os.utime(entry_path(cache, "slides", key, ".png"), (1000 + index, 1000 + index))
+
+    # 古い方（keys[0]）を使うと、keys[1] が最も長く使われていないエントリになる
+    path = cache.lookup("slides", keys[0], ".png")
+    assert path is not None
+
+    cache.put_bytes("slides", keys[2], b"x" * 100, ".png")
+
+    assert cache.lookup("slides", keys[0], ".png") is not None
+    assert cache.lookup("slides", keys[1], ".png") is None
+    assert cache.lookup("slides", keys[2], ".png") is not None
+
+
+def test_overwrite_does_not_inflate_total(tmp_path):
+    cache = make_cache(tmp_path, max_bytes=1000)
+    first = cache.make_key("first")
+    second = cache.make_key("second")
+    cache.put_bytes("slides", first, b"x" * 100, ".png")
+    for _ in range(5):
+        cache.put_bytes("slides", second, b"x" * 100, ".png")
+
+    # 上書きしても合計は実サイズのまま（膨らんで早めに削除が走らない）
+    assert cache._total_bytes == 200
+    assert cache.lookup("slides", first, ".png") is not None
+    assert cache.lookup("slides", second, ".png") is not None
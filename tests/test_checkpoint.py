@@ -0,0 +1,102 @@
+"""JobManifest（チェックポイント）のテスト"""
+import json
+from types import SimpleNamespace
+
+import pytest
+
+from src.core.checkpoint import JobManifest
+
+
+def test_create_and_load_round_trip(tmp_path):
+    JobManifest.create(tmp_path, "job-1", "朝のルーティン", profile="draft")
+
+    manifest = JobManifest.load(tmp_path)
+
+    assert manifest.job_id == "job-1"
+    assert manifest.theme == "朝のルーティン"
+    assert manifest.profile == "draft"
+    assert manifest.data["phases"] == {}
+
+
+def test_load_missing_manifest(tmp_path):
+    with pytest.raises(FileNotFoundError):
+        JobManifest.load(tmp_path)
+
+
+def test_completed_phase_survives_reload(tmp_path):
+    slides_dir = tmp_path / "slides"
+    slides_dir.mkdir()
+    artifacts = [slides_dir / "slide_02.png", slides_dir / "slide_01.png"]
+    for path in artifacts:
+        path.write_bytes(path.name.encode())
+
+    manifest = JobManifest.create(tmp_path, "job-1", "theme")
+    manifest.mark_complete("slides", artifacts)
+
+    loaded = JobManifest.load(tmp_path)
+    assert loaded.is_complete("slides")
+    assert not loaded.is_complete("video")
+    # 生成物は記録した順で返す
+    assert loaded.artifacts("slides") == artifacts
+    saved = json.loads((tmp_path / JobManifest.FILENAME).read_text(encoding="utf-8"))
+    assert list(saved["phases"]["slides"]["artifacts"]) == ["slides/slide_02.png", "slides/slide_01.png"]
+
+
+def test_modified_artifact_invalidates_phase(tmp_path):
+    narration = tmp_path / "narration.wav"
+    narration.write_bytes(b"audio")
+    manifest = JobManifest.create(tmp_path, "job-1", "theme")
+    manifest.mark_complete("narration", [narration])
+
+    narration.write_bytes(b"truncated")
+
+    assert not JobManifest.load(tmp_path).is_complete("narration")
+
+
+def test_missing_artifact_invalidates_phase(tmp_path):
+    script = tmp_path / "script.json"
+    script.write_text("{}", encoding="utf-8")
+    manifest = JobManifest.create(tmp_path, "job-1", "theme")
+    manifest.mark_complete("script", [script])
+
+    script.unlink()
+
+    assert not JobManifest.load(tmp_path).is_complete("script")
+
+
+def test_save_leaves_no_temporary_file(tmp_path):
+    JobManifest.create(tmp_path, "job-1", "theme").save()
+
+    assert sorted(path.name for path in tmp_path.iterdir()) == [JobManifest.FILENAME]
+
+
+@pytest.fixture
+def generator(tmp_path):
+    from src.main import VideoGenerator
+
+    # 外部APIのクライアントは作らず、出力先だけを持たせる
+    generator = VideoGenerator.__new__(VideoGenerator)
+    generator.project_root = tmp_path
+    generator.config = SimpleNamespace(output=SimpleNamespace(directory="output"))
+    return generator
+
+
+def test_can_resume_requires_matching_manifest(tmp_path, generator):
+    output_dir = tmp_path / "output" / "video_1"
+    assert not generator.can_resume("video_1", "theme")
+
+    output_dir.mkdir(parents=True)
+    JobManifest.create(output_dir, "video_1", "theme", profile="draft")
+
+    assert generator.can_resume("video_1", "theme", "draft")
+    # テーマ・プロファイルが違えば新しいジョブとして作り直す
+    assert not generator.can_resume("video_1", "other theme", "draft")
+    assert not generator.can_resume("video_1", "theme")
+
+
+def test_can_resume_ignores_broken_manifest(tmp_path, generator):
+    output_dir = tmp_path / "output" / "video_1"
+    output_dir.mkdir(parents=True)
+    (output_dir / JobManifest.FILENAME).write_text("{", encoding="utf-8")
+
+    assert not generator.can_resume("video_1", "theme")
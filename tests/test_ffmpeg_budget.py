@@ -0,0 +1,117 @@
+"""FFmpegBudget（FFmpegのスレッド予算）のテスト"""
+import threading
+import time
+
+from src.video.ffmpeg_budget import FFmpegBudget
+
+
+def test_threads_per_encode_is_clamped():
+    assert FFmpegBudget(total_threads=4, threads_per_encode=8).threads_per_encode == 4
+    assert FFmpegBudget(total_threads=4, threads_per_encode=0).threads_per_encode == 1
+    assert FFmpegBudget(total_threads=0, threads_per_encode=2).total_threads == 1
+
+
+def test_max_parallel_encodes():
+    assert FFmpegBudget(total_threads=8, threads_per_encode=2).max_parallel_encodes == 4
+    assert FFmpegBudget(total_threads=3, threads_per_encode=2).max_parallel_encodes == 1
+
+
+def test_reserve_defaults_and_clamps():
+    budget = FFmpegBudget(total_threads=4, threads_per_encode=2)
+
+    with budget.reserve() as threads:
+        assert threads == 2
+    with budget.reserve(16) as threads:
+        assert threads == 4
+    with budget.reserve(1) as threads:
+        assert threads == 1
+
+
+def test_reserve_waits_until_threads_are_released():
+    budget = FFmpegBudget(total_threads=4, threads_per_encode=2)
+    acquired = threading.Event()
+
+    def second():
+        with budget.reserve(3):
+            acquired.set()
+
+    with budget.reserve(2):
+        worker = threading.Thread(target=second)
+        worker.start()
+        # 2スレッドしか空いていないので3スレッドの予約は待たされる
+        assert not acquired.wait(0.2)
+    assert acquired.wait(5)
+    worker.join()
+
+
+def test_reservations_never_exceed_total():
+    budget = FFmpegBudget(total_threads=4, threads_per_encode=2)
+    in_use = []
+    peak = []
+    lock = threading.Lock()
+
+    def encode():
+        with budget.reserve() as threads:
+            with lock:
+                in_use.append(threads)
+                peak.append(sum(in_use))
+            time.sleep(0.01)
+            with lock:
+                in_use.remove(threads)
+
+    workers = [threading.Thread(target=encode) for _ in range(8)]
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join()
+
+    assert max(peak) <= 4
+    assert budget._available == 4
+
+
+def test_reservations_are_granted_in_arrival_order():
+    budget = FFmpegBudget(total_threads=4, threads_per_encode=2)
+    order = []
+
+    def reserve(name, threads):
+        with budget.reserve(threads):
+            order.append(name)
+
+    with budget.reserve(2):
+        large = threading.Thread(target=reserve, args=("large", 4))
+        large.start()
+        while not budget._waiting:
+            time.sleep(0.01)
+        small = threading.Thread(target=reserve, args=("small", 2))
+        small.start()
+        # 2スレッド空いていても、先に待っている4スレッドの予約を追い越さない
+        time.sleep(0.2)
+        assert order == []
+        assert len(budget._waiting) == 2
+    large.join(5)
+    small.join(5)
+
+    assert order == ["large", "small"]
+    assert budget._available == 4 and not budget._waiting
+
+
+def test_next_waiter_proceeds_when_head_is_granted():
+    budget = FFmpegBudget(total_threads=4, threads_per_encode=1)
+    started = threading.Barrier(3)
+    release = threading.Event()
+
+    def encode():
+        with budget.reserve(1):
+            started.wait(5)
+            release.wait(5)
+
+    workers = [threading.Thread(target=encode) for _ in range(2)]
+    for worker in workers:
+        worker.start()
+    # 空きがあれば後ろの予約も待たずに受け取れる
+    started.wait(5)
+    release.set()
+    for worker in workers:
+        worker.join(5)
+
+    assert budget._available == 4
@@ -0,0 +1,111 @@
+"""FrameRenderer（Pythonでのフレーム生成）のテスト"""
+import pickle
+
+import numpy as np
+import pytest
+from PIL import Image
+
+from src.core.schemas.video_script import AnimationType, Slide, SlideBackground
+from src.video import frame_renderer
+from src.video.frame_renderer import FrameRenderer
+from src.video.ken_burns import KenBurnsEffect
+
+WIDTH, HEIGHT, FPS = 36, 64, 10
+COLORS = [(200, 40, 40), (40, 200, 40), (40, 40, 200)]
+
+
+def make_slide(order, animation):
+    return Slide(
+        order=order,
+        duration=3.0,
+        background=SlideBackground(prompt="p"),
+        narration="n",
+        animation=animation,
+    )
+
+
+@pytest.fixture
+def renderer():
+    return FrameRenderer(
+        WIDTH, HEIGHT, FPS,
+        KenBurnsEffect(WIDTH, HEIGHT, FPS),
+        transition_duration=0.4,
+    )
+
+
+@pytest.fixture
+def timeline(renderer):
+    sources = []
+    for color in COLORS:
+        # 縦方向のグラデーション（ズーム・パンで値が変わるように）
+        ramp = np.linspace(0.5, 1.0, HEIGHT * 2)[:, None, None]
+        pixels = (np.array(color)[None, None, :] * ramp).repeat(WIDTH * 2, axis=1)
+        sources.append(Image.fromarray(pixels.astype(np.uint8), "RGB"))
+    slides = [
+        make_slide(1, AnimationType.ZOOM_IN),
+        make_slide(2, AnimationType.NONE),
+        make_slide(3, AnimationType.PAN_LEFT),
+    ]
+    return renderer.build_timeline(sources, slides)
+
+
+def frames(data):
+    return np.frombuffer(data, dtype=np.uint8).reshape(-1, HEIGHT, WIDTH, 3)
+
+
+def test_timeline_covers_every_frame(renderer, timeline):
+    assert [item.start_frame for item in timeline] == [0, 30, 60]
+    assert renderer.total_frames(timeline) == 90
+    assert frames(b"".join(renderer.iter_frames(timeline))).shape[0] == 90
+
+
+def test_output_does_not_depend_on_chunk_size(renderer, timeline):
+    reference = b"".join(renderer.iter_frames(timeline, chunk_frames=1))
+
+    assert b"".join(renderer.iter_frames(timeline)) == reference
+    assert b"".join(renderer.iter_frames(timeline, chunk_frames=7)) == reference
+
+
+def test_sources_are_prepared_once_per_slide(renderer, timeline, monkeypatch):
+    prepared = []
+    original = FrameRenderer._prepare_source
+
+    def counting(self, item):
+        prepared.append(item.slide.order)
+        return original(self, item)
+
+    monkeypatch.setattr(FrameRenderer, "_prepare_source", counting)
+    for _ in renderer.iter_frames(timeline, chunk_frames=3):
+        pass
+
+    assert sorted(prepared) == [1, 2, 3]
+
+
+def test_crossfade_is_centred_on_boundary(renderer, timeline):
+    video = frames(b"".join(renderer.iter_frames(timeline))).astype(int)
+    # スライド2は静止しているので、クロスフェードの外は一定
+    red, green = video[..., 0].mean(axis=(1, 2)), video[..., 1].mean(axis=(1, 2))
+
+    assert red[27] > red[28] > red[29] > red[30] > red[31] > red[32]
+    assert green[27] < green[28] < green[29] < green[30] < green[31] < green[32]
+    assert np.array_equal(video[33], video[40])
+    # 境界（フレーム30）の前後で混ぜる割合が対称
+    assert red[29] - red[30] == pytest.approx(red[30] - red[31], abs=2)
+
+
+def test_worker_reuses_renderer_across_ranges(renderer, timeline):
+    frame_renderer._worker_renderers.clear()
+    first = pickle.loads(pickle.dumps(renderer))
+    second = pickle.loads(pickle.dumps(renderer))
+
+    # 送られてきたレンダラーにはキャッシュが含まれない
+    assert not first._sources and not first._sprites
+
+    frame_renderer._render_in_worker(first, timeline[:2], 0, 10)
+    data = frame_renderer._render_in_worker(second, timeline[:2], 10, 20)
+
+    # 2回目は最初に受け取ったレンダラー（読み込み済みのスライド画像）を使う
+    assert frame_renderer._worker_renderers[renderer.token] is first
+    assert timeline[0].key in first._sources and not second._sources
+    assert data == renderer.render_range(timeline, 10, 20)
+    frame_renderer._worker_renderers.clear()
@@ -0,0 +1,140 @@
+"""PhaseGraph（フェーズ依存グラフ）のテスト"""
+import threading
+
+import pytest
+
+from src.core.pipeline import PhaseGraph
+
+
+def test_dependencies_receive_results():
+    graph = PhaseGraph()
+    graph.add_phase("script", lambda: "script")
+    graph.add_phase("images", lambda script: f"images({script})", depends_on=["script"])
+    graph.add_phase("narration", lambda script: f"narration({script})", depends_on=["script"])
+    graph.add_phase(
+        "video",
+        lambda images, narration: f"video({images},{narration})",
+        depends_on=["images", "narration"],
+    )
+
+    results = graph.run()
+
+    assert results == {
+        "script": "script",
+        "images": "images(script)",
+        "narration": "narration(script)",
+        "video": "video(images(script),narration(script))",
+    }
+
+
+def test_phase_starts_after_dependencies_finish():
+    order = []
+    lock = threading.Lock()
+
+    def record(name):
+        def func(**_):
+            with lock:
+                order.append(name)
+            return name
+        return func
+
+    graph = PhaseGraph()
+    graph.add_phase("c", record("c"), depends_on=["a", "b"])
+    graph.add_phase("b", record("b"), depends_on=["a"])
+    graph.add_phase("a", record("a"))
+
+    graph.run()
+
+    assert order == ["a", "b", "c"]
+
+
+def test_independent_phases_run_concurrently():
+    # 2つのフェーズが同時に実行されていなければ Barrier がタイムアウトする
+    barrier = threading.Barrier(2, timeout=5)
+    graph = PhaseGraph()
+    graph.add_phase("images", barrier.wait)
+    graph.add_phase("narration", barrier.wait)
+
+    graph.run()
+
+
+def test_duplicate_phase_rejected():
+    graph = PhaseGraph()
+    graph.add_phase("script", lambda: None)
+    with pytest.raises(ValueError, match="already registered"):
+        graph.add_phase("script", lambda: None)
+
+
+def test_unknown_dependency_rejected():
+    graph = PhaseGraph()
+    graph.add_phase("video", lambda images: None, depends_on=["images"])
+    with pytest.raises(ValueError, match="unknown phase 'images'"):
+        graph.run()
+
+
+def test_cycle_detected():
+    graph = PhaseGraph()
+    graph.add_phase("a", lambda c: None, depends_on=["c"])
+    graph.add_phase("b", lambda a: None, depends_on=["a"])
+    graph.add_phase("c", lambda b: None, depends_on=["b"])
+    graph.add_phase("root", lambda: None)
+    with pytest.raises(ValueError, match=r"Circular dependency among phases: \['a', 'b', 'c'\]"):
+        graph.run()
+
+
+def test_failure_propagates_and_skips_dependents():
+    called = []
+
+    def fail():
+        raise RuntimeError("boom")
+
+    graph = PhaseGraph()
+    graph.add_phase("script", fail)
+    graph.add_phase("video", lambda script: called.append("video"), depends_on=["script"])
+
+    with pytest.raises(RuntimeError, match="boom"):
+        graph.run()
+    assert called == []
+
+
+def test_restored_phase_skips_its_dependencies():
+    called = []
+
+    def run(name):
+        def func(**_):
+            called.append(name)
+            return name
+        return func
+
+    graph = PhaseGraph()
+    graph.add_phase("script", run("script"))
+    graph.add_phase("images", run("images"), depends_on=["script"], restore=lambda: "restored")
+    graph.add_phase("video", run("video"), depends_on=["images"])
+
+    results = graph.run()
+
+    # images は復元され、images からしか必要とされない script は実行しない
+    assert results == {"images": "restored", "video": "video"}
+    assert called == ["video"]
+
+
+def test_dependency_still_runs_when_needed_elsewhere():
+    called = []
+
+    def run(name):
+        def func(**_):
+            called.append(name)
+            return name
+        return func
+
+    graph = PhaseGraph()
+    graph.add_phase("script", run("script"))
+    graph.add_phase("images", run("images"), depends_on=["script"], restore=lambda: "restored")
+    graph.add_phase("narration", run("narration"), depends_on=["script"])
+    graph.add_phase("video", run("video"), depends_on=["images", "narration"])
+
+    results = graph.run()
+
+    assert results["images"] == "restored"
+    assert results["script"] == "script"
+    assert sorted(called) == ["narration", "script", "video"]
@@ -0,0 +1,106 @@
+"""TextAnimator の2つの実装（FFmpegの式と frame_state）が同じ動きになることのテスト"""
+import re
+
+import pytest
+
+from src.core.schemas.video_script import Slide, SlideBackground, TextAnimationType, TextElement
+from src.video.text_animation import SLIDE_UP_DISTANCE, TextAnimator
+
+WIDTH, HEIGHT, FPS = 1080, 1920, 30
+DELAY, DURATION = 0.5, 0.4
+LEFT, TOP, SPRITE_WIDTH, SPRITE_HEIGHT = 100.0, 600.0, 400.0, 120.0
+
+# 開始前・開始直後・途中（POP が行き過ぎる付近を含む）・終了時・終了後
+TIMES = [0.0, DELAY - 0.01, DELAY, DELAY + 0.01, DELAY + 0.1, DELAY + 0.2, DELAY + 0.3,
+         DELAY + DURATION, DELAY + DURATION + 0.5]
+
+
+@pytest.fixture
+def animator():
+    # フォントを読み込まないよう、式の生成に使う値だけを持たせる
+    animator = TextAnimator.__new__(TextAnimator)
+    animator.width, animator.height, animator.fps = WIDTH, HEIGHT, FPS
+    animator.duration = DURATION
+    animator.scale = 1.0
+    return animator
+
+
+def make_slide():
+    return Slide(order=1, duration=3.0, background=SlideBackground(prompt="p"), narration="n")
+
+
+def make_element(animation):
+    return TextElement(content="text", animation=animation, animation_delay=DELAY)
+
+
+def evaluate(expression, time, **variables):
+    """FFmpegの式を Python で評価する（使っている関数だけを対応）"""
+    namespace = {"clip": lambda x, low, high: min(max(x, low), high), "pow": pow, "max": max, "t": time}
+    return eval(expression, namespace, variables)
+
+
+def ffmpeg_opacity(sprite_filter, time):
+    """fade=t=in:...:alpha=1 の不透明度"""
+    start, duration = map(float, re.search(r"fade=t=in:st=([\d.]+):d=([\d.]+):alpha=1", sprite_filter).groups())
+    return min(max((time - start) / duration, 0.0), 1.0)
+
+
+@pytest.mark.parametrize("time", TIMES)
+def test_fade_in_matches(animator, time):
+    element = make_element(TextAnimationType.FADE_IN)
+    sprite_filter, x, y = animator._motion(element, make_slide(), LEFT, TOP, SPRITE_WIDTH, SPRITE_HEIGHT)
+
+    opacity, offset, scale = animator.frame_state(element, time)
+
+    assert ffmpeg_opacity(sprite_filter, time) == pytest.approx(opacity)
+    assert (evaluate(x, time), evaluate(y, time)) == (LEFT, TOP)
+    assert (offset, scale) == (0.0, 1.0)
+
+
+@pytest.mark.parametrize("time", TIMES)
+def test_slide_up_matches(animator, time):
+    element = make_element(TextAnimationType.SLIDE_UP)
+    sprite_filter, x, y = animator._motion(element, make_slide(), LEFT, TOP, SPRITE_WIDTH, SPRITE_HEIGHT)
+
+    opacity, offset, scale = animator.frame_state(element, time)
+
+    assert ffmpeg_opacity(sprite_filter, time) == pytest.approx(opacity)
+    assert evaluate(x, time) == LEFT
+    assert evaluate(y, time) - TOP == pytest.approx(offset)
+    assert scale == 1.0
+
+
+@pytest.mark.parametrize("time", TIMES)
+def test_pop_matches(animator, time):
+    element = make_element(TextAnimationType.POP)
+    sprite_filter, x, y = animator._motion(element, make_slide(), LEFT, TOP, SPRITE_WIDTH, SPRITE_HEIGHT)
+    width_expression = re.search(r"scale=w='(.+?)':h=-2:eval=frame", sprite_filter).group(1)
+
+    opacity, offset, scale = animator.frame_state(element, time)
+
+    assert ffmpeg_opacity(sprite_filter, time) == pytest.approx(opacity)
+    width = evaluate(width_expression, time, iw=SPRITE_WIDTH)
+    assert width / SPRITE_WIDTH == pytest.approx(scale)
+    # 中心を基準に拡大する
+    assert evaluate(x, time, w=width) + width / 2 == pytest.approx(LEFT + SPRITE_WIDTH / 2, abs=0.05)
+    assert offset == 0.0
+
+
+def test_motion_is_static_outside_animation(animator):
+    element = make_element(TextAnimationType.SLIDE_UP)
+    distance = round(HEIGHT * SLIDE_UP_DISTANCE)
+
+    # 遅延の前は開始位置で透明、終了後は最終位置で不透明
+    assert animator.frame_state(element, 0.0) == (0.0, distance, 1.0)
+    assert animator.frame_state(element, DELAY) == (0.0, distance, 1.0)
+    assert animator.frame_state(element, DELAY + DURATION) == (1.0, 0.0, 1.0)
+    assert animator.frame_state(element, 10.0) == (1.0, 0.0, 1.0)
+
+
+def test_pop_overshoots_then_settles(animator):
+    element = make_element(TextAnimationType.POP)
+    scales = [animator.frame_state(element, DELAY + DURATION * step / 20)[2] for step in range(21)]
+
+    assert scales[0] == pytest.approx(0.5)
+    assert max(scales) > 1.0
+    assert scales[-1] == pytest.approx(1.0)
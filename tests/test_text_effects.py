@@ -0,0 +1,111 @@
+"""テキストエフェクト（膨張・ぼかし・合成）のテスト"""
+import numpy as np
+import pytest
+
+from src.composition.text_effects import TextEffectStyle, blur, dilate, render_effects
+
+
+def dot(size=31):
+    mask = np.zeros((size, size), dtype=np.float32)
+    mask[size // 2, size // 2] = 1.0
+    return mask
+
+
+def naive_dilate(mask, radius):
+    """円形の構造要素での膨張を素直に計算する（比較用）"""
+    height, width = mask.shape
+    result = np.zeros_like(mask)
+    for dy in range(-radius, radius + 1):
+        for dx in range(-radius, radius + 1):
+            if dx * dx + dy * dy > (radius + 0.5) ** 2:
+                continue
+            shifted = np.zeros_like(mask)
+            shifted[max(dy, 0):height + min(dy, 0), max(dx, 0):width + min(dx, 0)] = \
+                mask[max(-dy, 0):height - max(dy, 0), max(-dx, 0):width - max(dx, 0)]
+            result = np.maximum(result, shifted)
+    return result
+
+
+@pytest.mark.parametrize("radius", [1, 2, 3, 5, 8])
+def test_dilate_matches_naive_disk(radius):
+    rng = np.random.default_rng(radius)
+    mask = (rng.random((40, 50)) > 0.97).astype(np.float32) * rng.random((40, 50)).astype(np.float32)
+
+    assert np.array_equal(dilate(mask, radius), naive_dilate(mask, radius))
+
+
+def test_dilate_of_dot_is_a_disk():
+    result = dilate(dot(), 4)
+    ys, xs = np.nonzero(result)
+
+    assert xs.min() == 15 - 4 and xs.max() == 15 + 4
+    assert ys.min() == 15 - 4 and ys.max() == 15 + 4
+    # 角は円の外
+    assert result[15 - 4, 15 - 4] == 0
+
+
+def test_dilate_with_zero_radius_returns_input():
+    mask = dot()
+    assert dilate(mask, 0) is mask
+
+
+def test_blur_preserves_total_and_stays_within_radius():
+    result = blur(dot(41), 6)
+
+    assert result.dtype == np.float32
+    assert result.sum() == pytest.approx(1.0, abs=1e-5)
+    ys, xs = np.nonzero(result > 1e-7)
+    assert xs.min() >= 20 - 6 and xs.max() <= 20 + 6
+    assert ys.min() >= 20 - 6 and ys.max() <= 20 + 6
+    # 中心が最も濃く、左右対称
+    assert result.argmax() == 20 * 41 + 20
+    assert np.allclose(result, result[:, ::-1], atol=1e-7)
+
+
+def test_blur_of_uniform_interior_is_unchanged():
+    mask = np.ones((40, 40), dtype=np.float32)
+    result = blur(mask, 3)
+
+    assert np.allclose(result[10:30, 10:30], 1.0, atol=1e-6)
+
+
+def test_render_fill_only():
+    mask = np.zeros((10, 10), dtype=np.float32)
+    mask[3:7, 3:7] = 1.0
+
+    rgba = np.asarray(render_effects(mask, TextEffectStyle(color="#FF0000")))
+
+    assert rgba[5, 5].tolist() == [255, 0, 0, 255]
+    assert rgba[0, 0, 3] == 0
+
+
+def test_render_stroke_surrounds_fill():
+    mask = np.zeros((20, 20), dtype=np.float32)
+    mask[8:12, 8:12] = 1.0
+
+    rgba = np.asarray(render_effects(mask, TextEffectStyle(stroke_width=2, stroke_color="#0000FF")))
+
+    assert rgba[10, 10].tolist() == [255, 255, 255, 255]
+    assert rgba[10, 6].tolist() == [0, 0, 255, 255]
+    assert rgba[10, 5, 3] == 0
+
+
+def test_render_gradient_runs_top_to_bottom():
+    mask = np.ones((11, 4), dtype=np.float32)
+
+    rgba = np.asarray(render_effects(
+        mask, TextEffectStyle(color="#000000", gradient_color="#FFFFFF"), fill_rows=(0, 11),
+    ))
+
+    assert rgba[0, 0, :3].tolist() == [0, 0, 0]
+    assert rgba[10, 0, :3].tolist() == [255, 255, 255]
+    assert np.all(np.diff(rgba[:, 0, 0].astype(int)) >= 0)
+
+
+def test_extent_covers_shadow_and_glow():
+    style = TextEffectStyle(
+        stroke_width=3, shadow_color="#000000", shadow_offset=(4, -6), shadow_blur=5,
+        glow_color="#FFFF00", glow_radius=12,
+    )
+    assert style.extent == max(3 + 6 + 5, 3 + 12)
+    assert TextEffectStyle().extent == 0
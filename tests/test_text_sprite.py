@@ -0,0 +1,90 @@
+"""テキストスプライト（背景ボックス・画面端での切り取り）のテスト"""
+import numpy as np
+import pytest
+from PIL import Image, ImageDraw, ImageFont
+
+from src.composition.text_renderer import BOX_PADDING, FontManager, TextRenderer
+from src.composition.text_sprite import SpriteCache
+from src.core.schemas.video_script import TextElement, TextStyle
+
+
+class DefaultFontManager(FontManager):
+    """フォントファイルの代わりに Pillow 内蔵のフォントを使う"""
+
+    def get_style_font(self, style):
+        return ImageFont.load_default(40), {
+            "color": "#FFFFFF",
+            "stroke_width": 2,
+            "stroke_color": "#000000",
+            "gradient_color": None,
+            "shadow_color": None,
+            "shadow_offset": (4, 4),
+            "shadow_blur": 6,
+            "glow_color": None,
+            "glow_radius": 12,
+        }
+
+
+@pytest.fixture
+def renderer():
+    renderer = TextRenderer.__new__(TextRenderer)
+    renderer.font_manager = DefaultFontManager()
+    renderer.sprite_cache = SpriteCache(max_memory_bytes=16 * 1024 * 1024)
+    renderer.video_width = 1080
+    renderer.video_height = 1920
+    renderer.text_animation = False
+    return renderer
+
+
+def test_box_includes_its_last_row_and_column(renderer):
+    # ImageDraw.rounded_rectangle は右端・下端の座標も塗るので、ボックスはその列・行まで含む
+    sprite = renderer.render_sprite(TextElement(content="Title", style=TextStyle.TITLE), 1080)
+    alpha = np.asarray(sprite.image)[..., 3]
+    margin = sprite.margin
+
+    middle_row = alpha[margin + sprite.text_height // 2]
+    columns = np.flatnonzero(middle_row)
+    assert columns[0] == margin - BOX_PADDING
+    assert columns[-1] == margin + sprite.text_width + BOX_PADDING
+
+    middle_column = alpha[:, margin - BOX_PADDING // 2]
+    rows = np.flatnonzero(middle_column)
+    assert rows[0] == margin - BOX_PADDING
+    assert rows[-1] == margin + sprite.text_height + BOX_PADDING
+
+
+def test_box_matches_full_frame_overlay(renderer):
+    # 以前の実装（画面全体のオーバーレイにボックスを描いて合成）と同じ範囲・濃さになること
+    sprite = renderer.render_sprite(TextElement(content="Hook", style=TextStyle.HOOK), 1080)
+    margin = sprite.margin
+    box = (
+        margin - BOX_PADDING,
+        margin - BOX_PADDING,
+        margin + sprite.text_width + BOX_PADDING,
+        margin + sprite.text_height + BOX_PADDING,
+    )
+    reference = Image.new("RGBA", sprite.image.size, (0, 0, 0, 0))
+    ImageDraw.Draw(reference).rounded_rectangle(box, radius=10, fill=(0, 0, 0, 128))
+
+    # 文字とその縁取りの周辺を除いた、ボックスだけの部分で比べる
+    actual = np.asarray(sprite.image)[..., 3].astype(int)
+    expected = np.asarray(reference)[..., 3].astype(int)
+    outside_text = np.ones_like(actual, dtype=bool)
+    outside_text[margin - 4:margin + sprite.text_height + 4, margin - 4:margin + sprite.text_width + 4] = False
+    assert np.array_equal(actual[outside_text], expected[outside_text])
+
+
+@pytest.mark.parametrize("position", [(-30, -20), (100, 80), (1000, 1850)])
+def test_paste_sprite_clips_at_frame_edges(renderer, position):
+    sprite = renderer.render_sprite(TextElement(content="Edge", style=TextStyle.TITLE), 1080).image
+    image = Image.new("RGBA", (1080, 1920), (40, 80, 120, 255))
+
+    pasted = image.copy()
+    TextRenderer._paste_sprite(pasted, sprite, position)
+
+    # 十分大きな画像に貼ってから切り出したものと同じになること
+    x, y = position
+    padded = Image.new("RGBA", (1080 + 2 * sprite.width, 1920 + 2 * sprite.height), (40, 80, 120, 255))
+    padded.alpha_composite(sprite, dest=(x + sprite.width, y + sprite.height))
+    expected = padded.crop((sprite.width, sprite.height, sprite.width + 1080, sprite.height + 1920))
+    assert np.array_equal(np.asarray(pasted), np.asarray(expected))
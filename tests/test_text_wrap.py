@@ -0,0 +1,96 @@
+"""TextRenderer の折り返し（禁則処理・英単語・長い単語）のテスト"""
+import pytest
+
+from src.composition.text_renderer import TextRenderer
+
+# 文字幅は 1文字10 を基本とし、一部の文字だけ狭くする（プロポーショナルフォントの代わり）
+NARROW_CHARS = {" ": 2, "x": 2}
+
+
+class StubFontManager:
+    """フォントファイルを使わずに決まった送り幅を返す"""
+
+    def get_advance(self, font, char):
+        return NARROW_CHARS.get(char, 10)
+
+
+@pytest.fixture
+def renderer():
+    renderer = TextRenderer.__new__(TextRenderer)
+    renderer.font_manager = StubFontManager()
+    return renderer
+
+
+def width(line):
+    return sum(NARROW_CHARS.get(char, 10) for char in line)
+
+
+def wrap(renderer, text, max_width):
+    lines = renderer._wrap_text(text, None, max_width)
+    assert all(lines), f"empty line in {lines}"
+    return lines
+
+
+def test_short_text_is_not_wrapped(renderer):
+    assert wrap(renderer, "あいう", 50) == ["あいう"]
+
+
+def test_newlines_start_new_paragraphs(renderer):
+    assert wrap(renderer, "あい\nう\n\nえ", 50) == ["あい", "う", "え"]
+
+
+def test_closing_punctuation_is_not_at_line_start(renderer):
+    assert wrap(renderer, "あいうえお。かき", 50) == ["あいうえ", "お。かき"]
+    assert wrap(renderer, "あいうえお」です", 50) == ["あいうえ", "お」です"]
+
+
+def test_small_kana_is_not_at_line_start(renderer):
+    assert wrap(renderer, "あいうえおっと", 50) == ["あいうえ", "おっと"]
+    assert wrap(renderer, "アイウエオーカ", 50) == ["アイウエ", "オーカ"]
+
+
+def test_opening_bracket_is_not_at_line_end(renderer):
+    assert wrap(renderer, "あいうえ「おか」", 50) == ["あいうえ", "「おか」"]
+
+
+def test_ascii_words_are_not_split(renderer):
+    assert wrap(renderer, "hello world", 50) == ["hello", "world"]
+    assert wrap(renderer, "ab cdefg", 50) == ["ab", "cdefg"]
+
+
+def test_overlong_word_is_split_by_width(renderer):
+    assert wrap(renderer, "abcdefghijkl", 50) == ["abcde", "fghij", "kl"]
+    assert wrap(renderer, "ab cdefghijkl", 50) == ["ab", "cdefg", "hijkl"]
+
+
+def test_carried_over_word_is_rebroken(renderer):
+    # "x " で改行すると "leadin" が次の行に送られ、そのままでは幅 60 > 55 になる
+    lines = wrap(renderer, "x leading", 55)
+
+    assert lines == ["x", "leadi", "ng"]
+    assert all(width(line) <= 55 for line in lines)
+
+
+def test_leading_space_does_not_produce_empty_line(renderer):
+    lines = wrap(renderer, " leading", 55)
+
+    assert lines == [" leadi", "ng"]
+    assert all(width(line) <= 55 for line in lines)
+
+
+def test_spaces_at_break_are_dropped(renderer):
+    assert wrap(renderer, "abcde   fgh", 50) == ["abcde", "fgh"]
+    assert wrap(renderer, "     ", 6) == []
+
+
+def test_find_break_prefers_latest_allowed_position():
+    assert TextRenderer._find_break(list("あいう"), "え") == 3
+    assert TextRenderer._find_break(list("あいう"), "。") == 2
+    assert TextRenderer._find_break(list("あい「"), "う") == 2
+    assert TextRenderer._find_break(list("ab cd"), "e") == 3
+
+
+def test_find_break_falls_back_to_line_end():
+    assert TextRenderer._find_break(list("abcde"), "f") == 5
+    # 空白だけの行になる位置では改行しない
+    assert TextRenderer._find_break(list(" abcd"), "e") == 5
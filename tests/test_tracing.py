@@ -0,0 +1,53 @@
+"""トレース（ワーカープロセスのスパンの引き継ぎ）のテスト"""
+import pickle
+import time
+
+from src.core.tracing import adopt_spans, capture_spans, span, trace_job
+
+
+def work_in_worker():
+    """ワーカープロセスでの処理の代わり（スパンはプロセス間で pickle して返す）"""
+    with capture_spans() as spans:
+        with span("slide.compose", order=1) as current:
+            with span("slide.render"):
+                sum(range(200_000))
+            current.add_bytes(bytes_in=10, bytes_out=20)
+    return pickle.loads(pickle.dumps(spans))
+
+
+def test_captured_spans_are_not_recorded_in_worker_context():
+    with trace_job("job") as tracer:
+        work_in_worker()
+
+    assert tracer.spans == []
+
+
+def test_adopted_spans_join_the_job_trace():
+    with trace_job("job") as tracer:
+        with span("slide.compose_pool") as pool:
+            before = time.perf_counter() - tracer.origin
+            spans = work_in_worker()
+            adopt_spans(spans)
+            after = time.perf_counter() - tracer.origin
+
+    by_name = {s.name: s for s in tracer.spans}
+    compose, render = by_name["slide.compose"], by_name["slide.render"]
+
+    # 親子関係はこのジョブのスパンIDで張り直される
+    assert compose.parent_id == pool.span_id
+    assert render.parent_id == compose.span_id
+    assert len({s.span_id for s in tracer.spans}) == 3
+    # 開始時刻はこのトレースの基準に合わせる
+    assert before - 0.01 <= compose.start <= render.start <= after
+    assert compose.attributes == {"order": 1}
+
+    summary = tracer.summary()
+    assert summary["slide.compose"]["count"] == 1
+    assert summary["slide.compose"]["bytes_out"] == 20
+    assert summary["slide.compose"]["cpu_time"] > 0
+    # ワーカーのCPU時間は、プールのスパンの子プロセスCPU時間として数える
+    assert pool.child_cpu_time == compose.cpu_time
+
+
+def test_adopt_without_tracer_is_noop():
+    adopt_spans(work_in_worker())
@@ -0,0 +1,178 @@
+"""スライド間トランジション（キーフレーム・切り出し・xfade の範囲）のテスト"""
+import math
+import re
+
+import pytest
+
+from src.core.schemas.video_script import AnimationType, Slide, SlideBackground
+from src.video.video_composer import VideoComposer
+
+FPS = 30
+DURATIONS = [3.0, 3.5, 4.0]
+HALF = 6  # transition_duration 0.4 秒 × 30fps の半分
+
+
+def make_slides():
+    return [
+        Slide(
+            order=index + 1,
+            duration=duration,
+            background=SlideBackground(prompt="p"),
+            narration="n",
+            animation=AnimationType.NONE,
+        )
+        for index, duration in enumerate(DURATIONS)
+    ]
+
+
+def make_composer(transition="fade", transition_duration=0.4):
+    composer = VideoComposer()
+    composer.video_config = composer.video_config.model_copy(update={"fps": FPS, "renderer": "ffmpeg"})
+    composer.slide_config = composer.slide_config.model_copy(update={
+        "transition": transition,
+        "transition_duration": transition_duration,
+    })
+    composer.ken_burns.fps = FPS
+    return composer
+
+
+@pytest.fixture
+def composer():
+    return make_composer()
+
+
+def test_transition_frames(composer):
+    assert composer._transition_frames(make_slides()) == HALF
+    # 前後両方のトランジションが入らない短いスライドがあれば使わない
+    assert make_composer(transition_duration=6.0)._transition_frames(make_slides()) == 0
+    assert make_composer(transition="")._transition_frames(make_slides()) == 0
+    assert make_composer(transition_duration=0)._transition_frames(make_slides()) == 0
+
+
+def test_keyframes_are_forced_at_cut_points(composer):
+    slide = make_slides()[0]
+    args = composer._keyframe_args(slide)
+
+    assert args[0] == "-force_key_frames"
+    times = [float(value) for value in args[1].split(",")]
+    assert args[1] == "0.183333,2.783333"
+    # 指定時刻以降の最初のフレームがキーフレームになるので、本体の先頭・末尾の次のフレームに当たる
+    assert [math.ceil(time * FPS) for time in times] == [HALF, 90 - HALF]
+
+
+def test_no_keyframes_without_transition():
+    slide = make_slides()[0]
+    assert make_composer(transition="")._keyframe_args(slide) == []
+    assert make_composer(transition_duration=0)._keyframe_args(slide) == []
+
+
+def test_cut_and_transition_pieces_add_up_to_slide_durations(composer, tmp_path, monkeypatch):
+    slides = make_slides()
+    videos = [tmp_path / f"slide_{index}.mp4" for index in range(len(slides))]
+    cuts, transitions, concatenated = {}, {}, []
+
+    def cut(video_path, start, frames, output_path):
+        cuts[output_path.name] = (videos.index(video_path), start, frames)
+        return output_path
+
+    def transition(previous_path, previous_frames, next_path, half, output_path):
+        transitions[output_path.name] = (videos.index(previous_path), previous_frames, videos.index(next_path), half)
+        return output_path
+
+    monkeypatch.setattr(composer, "_cut_segment", cut)
+    monkeypatch.setattr(composer, "_encode_transition", transition)
+    monkeypatch.setattr(composer, "_concat_videos", lambda paths, output: concatenated.extend(paths))
+
+    composer._concat_with_transitions(videos, slides, tmp_path / "concat.mp4")
+
+    assert [path.name for path in concatenated] == [
+        "body_00.mp4", "transition_00.mp4", "body_01.mp4", "transition_01.mp4", "body_02.mp4",
+    ]
+    assert cuts == {
+        "body_00.mp4": (0, 0, 90 - HALF),
+        "body_01.mp4": (1, HALF, 105 - 2 * HALF),
+        "body_02.mp4": (2, HALF, 120 - HALF),
+    }
+    assert transitions == {
+        "transition_00.mp4": (0, 90, 1, HALF),
+        "transition_01.mp4": (1, 105, 2, HALF),
+    }
+    # 境界部分は前後 HALF フレームずつを 2*HALF フレームで置き換えるので、全体の長さは変わらない
+    total = sum(frames for _, _, frames in cuts.values()) + 2 * HALF * len(transitions)
+    assert total == sum(int(duration * FPS) for duration in DURATIONS)
+
+
+def test_single_pass_filters_partition_each_slide(composer):
+    slides = make_slides()
+    filters = []
+
+    pieces = composer._transition_filters(slides, filters, HALF)
+    graph = ";".join(filters)
+
+    assert pieces == ["[body0]", "[x0]", "[body1]", "[x1]", "[body2]"]
+    bodies = {
+        int(index): (int(start), int(end))
+        for start, end, index in re.findall(r"trim=start_frame=(\d+):end_frame=(\d+),setpts=PTS-STARTPTS\[body(\d+)\]", graph)
+    }
+    tails = {
+        int(index): (int(start), int(end), int(pad))
+        for start, end, pad, index in re.findall(
+            r"trim=start_frame=(\d+):end_frame=(\d+),[^;]*tpad=stop=(\d+):stop_mode=clone\[tail(\d+)\]", graph)
+    }
+    heads = {
+        int(index): (int(end), int(pad))
+        for end, pad, index in re.findall(r"trim=end_frame=(\d+),[^;]*tpad=start=(\d+):start_mode=clone\[head(\d+)\]", graph)
+    }
+
+    for index, slide in enumerate(slides):
+        frames = int(slide.duration * FPS)
+        # 先頭 HALF（head）・本体・末尾 HALF（tail）で、スライドの全フレームを重複なく覆う
+        start = heads[index][0] if index in heads else 0
+        end = tails[index][0] if index in tails else frames
+        assert bodies[index] == (start, end)
+        if index in tails:
+            assert tails[index] == (frames - HALF, frames, HALF)
+    assert sorted(heads) == [1, 2] and sorted(tails) == [0, 1]
+    assert all(head == (HALF, HALF) for head in heads.values())
+    assert graph.count(f"xfade=transition=fade:duration={2 * HALF / FPS:.6f}:offset=0") == 2
+
+
+@pytest.mark.parametrize("settings", [{"transition": ""}, {"transition_duration": 0}])
+def test_segments_fall_back_to_plain_concat(settings, tmp_path, monkeypatch):
+    composer = make_composer(**settings)
+    videos = [tmp_path / f"slide_{index}.mp4" for index in range(3)]
+    concatenated = []
+
+    def with_transitions(*args):
+        raise AssertionError("transitions are disabled")
+
+    monkeypatch.setattr(composer, "_concat_with_transitions", with_transitions)
+    monkeypatch.setattr(composer, "_concat_videos", lambda paths, output: concatenated.append(paths))
+    monkeypatch.setattr(composer, "_add_audio", lambda video, audio, output: None)
+    monkeypatch.setattr(composer, "_cleanup_temp_files", lambda temp_dir: None)
+
+    composer.compose_from_segments(videos, tmp_path / "audio.wav", tmp_path / "video.mp4", slides=make_slides())
+
+    assert concatenated == [videos]
+
+
+@pytest.mark.parametrize("settings, expected", [
+    ({}, "[body0][x0][body1][x1][body2]concat=n=5:v=1:a=0[vcat]"),
+    ({"transition": ""}, "[v0][v1][v2]concat=n=3:v=1:a=0[vcat]"),
+    ({"transition_duration": 0}, "[v0][v1][v2]concat=n=3:v=1:a=0[vcat]"),
+])
+def test_single_pass_concat(settings, expected, tmp_path, monkeypatch):
+    composer = make_composer(**settings)
+    commands = []
+    monkeypatch.setattr(composer, "_run_ffmpeg", lambda cmd, name, threads=None: commands.append(cmd))
+
+    composer._compose_single_pass(
+        [tmp_path / f"slide_{index}.png" for index in range(3)],
+        make_slides(),
+        tmp_path / "audio.wav",
+        tmp_path / "video.mp4",
+    )
+
+    graph = commands[0][commands[0].index("-filter_complex") + 1]
+    assert expected in graph.split(";")
+    assert ("xfade" in graph) == (not settings)